@@ -0,0 +1,96 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Measures per-request overhead of applying authentication to prepared requests.
+
+Compares locked header update (previous implementation) with lock-free credentials snapshot.
+Run: python benchmarks/auth_headers.py [--threads N] [--requests N]
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from threading import RLock
+from time import perf_counter
+from typing import Callable, Dict
+
+from requests import PreparedRequest, Request
+
+from catalystwan.apigw_auth import ApiGwAuth, ApiGwLogin
+from catalystwan.vmanage_auth import update_headers, vManageAuth
+
+URL = "https://example.com/dataservice/device"
+
+
+def prepare() -> PreparedRequest:
+    return Request(method="GET", url=URL, cookies={"other": "cookie"}).prepare()
+
+
+def vmanage_auth() -> vManageAuth:
+    auth = vManageAuth("admin", "admin")  # pragma: allowlist secret
+    auth.cookies.set("JSESSIONID", "0123456789abcdef" * 4)
+    auth.xsrftoken = "fedcba9876543210" * 4
+    auth.handle_auth = lambda request: None  # type: ignore[method-assign]
+    return auth
+
+
+def apigw_auth() -> ApiGwAuth:
+    login = ApiGwLogin(client_id="id", client_secret="secret", org_name="org")  # pragma: allowlist secret
+    auth = ApiGwAuth(login)
+    auth.get_token = lambda *args, **kwargs: "0123456789abcdef" * 4  # type: ignore[method-assign]
+    return auth
+
+
+def legacy_vmanage(auth: vManageAuth) -> Callable[[PreparedRequest], PreparedRequest]:
+    lock = RLock()
+
+    def apply(request: PreparedRequest) -> PreparedRequest:
+        with lock:
+            update_headers(request, auth.jsessionid, auth.xsrftoken)
+        return request
+
+    return apply
+
+
+def legacy_apigw(auth: ApiGwAuth) -> Callable[[PreparedRequest], PreparedRequest]:
+    auth(prepare())
+    lock = RLock()
+
+    def apply(request: PreparedRequest) -> PreparedRequest:
+        with lock:
+            auth.build_digest_header(request)
+        return request
+
+    return apply
+
+
+def measure(apply: Callable[[PreparedRequest], PreparedRequest], requests: int, threads: int) -> float:
+    """Returns mean time in microseconds spent in 'apply' per request"""
+    batch = [[prepare() for _ in range(requests)] for _ in range(threads)]
+
+    def run(prepared):
+        for request in prepared:
+            apply(request)
+
+    start = perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(run, batch))
+    return (perf_counter() - start) / (requests * threads) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000, help="requests per thread")
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+    cases: Dict[str, Callable[[PreparedRequest], PreparedRequest]] = {
+        "vManageAuth locked update_headers": legacy_vmanage(vmanage_auth()),
+        "vManageAuth snapshot": vmanage_auth(),
+        "ApiGwAuth locked build_digest_header": legacy_apigw(apigw_auth()),
+        "ApiGwAuth snapshot": apigw_auth(),
+    }
+    print(f"{args.threads} thread(s), {args.requests} requests per thread")
+    for name, apply in cases.items():
+        print(f"{name:<40} {measure(apply, args.requests, args.threads):8.2f} us/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from benchmarks.conftest import cached_fleet
+from catalystwan.dataclasses import Device
+from catalystwan.utils.creation_tools import create_dataclass, flatten_dict
+from catalystwan.utils.dict import flatten_dict as flatten_dict_with_paths
+
+
+def bench_create_dataclass(benchmark, fleet):
+    result = benchmark(lambda: [create_dataclass(Device, item) for item in fleet])
+    assert result[0].hostname == fleet[0]["host-name"]
+
+
+def bench_flatten_dict(benchmark, fleet):
+    document = {"header": {"generatedOn": 0}, "data": fleet}
+    assert benchmark(flatten_dict, document)
+
+
+def bench_flatten_dict_with_paths(benchmark):
+    document = {"data": {"devices": cached_fleet(1000)}}
+    assert benchmark(flatten_dict_with_paths, document)
@@ -0,0 +1,115 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+from typing import Iterator, List, Optional
+
+from pydantic import BaseModel
+
+from benchmarks.conftest import make_response
+from benchmarks.payloads import response_content
+from catalystwan.endpoints import BASE_PATH, APIEndpoints, delete, get, post, versions, view
+from catalystwan.endpoints.monitoring.device_details import DeviceData
+from catalystwan.pagination import Pagination
+from catalystwan.response import ManagerResponse
+from catalystwan.typed_list import DataSequence
+from catalystwan.utils.session_type import ProviderView, SingleTenantView
+from catalystwan.version import parse_api_version
+
+JSON_HEADERS = {"content-type": "application/json"}
+PAGE_SIZE = 1000
+
+
+class Template(BaseModel):
+    name: str
+    description: Optional[str] = None
+
+
+class Client:
+    """Minimal APIEndpointClient returning canned responses, isolates decorator overhead from transport"""
+
+    api_version = parse_api_version("20.12.1")
+    session_type = SingleTenantView
+    validate_responses = True
+
+    def __init__(self, content: bytes = b""):
+        self.response = make_response(content)
+
+    def request(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        return ManagerResponse(self.response)
+
+
+class PagedClient(Client):
+    """Serves fleet in pages of requested size, next page is addressed by scroll id (index of its first record)"""
+
+    def __init__(self, fleet: List[dict], page_size: int):
+        self.pages = {}
+        for start in range(0, len(fleet), page_size):
+            end = start + page_size
+            page_info = {"scrollId": str(end), "hasMoreData": end < len(fleet)}
+            self.pages[str(start)] = make_response(
+                json.dumps({"data": fleet[start:end], "pageInfo": page_info}).encode()
+            )
+
+    def request(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        return ManagerResponse(self.pages[kwargs["params"].get("scrollId", "0")])
+
+
+class Endpoints(APIEndpoints):
+    @delete("/template/device/{template_id}")
+    def delete_template(self, template_id: str) -> None:  # type: ignore [empty-body]
+        ...
+
+    @versions(">=20.9")
+    @view({SingleTenantView, ProviderView})
+    @post("/template/device")
+    def create_template(self, payload: Template) -> None:  # type: ignore [empty-body]
+        ...
+
+    @get("/device", "data")
+    def get_devices(self) -> DataSequence[DeviceData]:  # type: ignore [empty-body]
+        ...
+
+    @get("/device/page", "data", pagination=Pagination(page_size=PAGE_SIZE))
+    def iter_devices(self) -> Iterator[DeviceData]:  # type: ignore [empty-body]
+        ...
+
+
+TEMPLATE_ID = "7ad6a5b4-3c87-4c5a-9a6e-0e6c5ad7b1b0"
+
+
+def bench_direct_client_request(benchmark):
+    """Reference for dispatch benchmarks: request sent directly, as decorated endpoint would send it"""
+    client = Client()
+    benchmark(client.request, "DELETE", BASE_PATH + "/template/device/" + TEMPLATE_ID)
+
+
+def bench_direct_client_request_model_payload(benchmark):
+    client = Client()
+    payload = Template(name="template", description="benchmark")
+
+    def send():
+        data = payload.model_dump_json(exclude_none=True, by_alias=True)
+        return client.request("POST", BASE_PATH + "/template/device", data=data, headers=JSON_HEADERS)
+
+    benchmark(send)
+
+
+def bench_dispatch_path_parameter(benchmark):
+    endpoints = Endpoints(Client())
+    benchmark(endpoints.delete_template, template_id=TEMPLATE_ID)
+
+
+def bench_dispatch_versioned_model_payload(benchmark):
+    endpoints = Endpoints(Client())
+    benchmark(endpoints.create_template, payload=Template(name="template", description="benchmark"))
+
+
+def bench_dispatch_dataseq(benchmark):
+    endpoints = Endpoints(Client(response_content([{"deviceId": f"10.0.0.{i}"} for i in range(10)])))
+    assert len(benchmark(endpoints.get_devices)) == 10
+
+
+def bench_paged_iteration(benchmark, fleet):
+    """Items are validated page by page, at most two pages of fleet are held at once"""
+    endpoints = Endpoints(PagedClient(fleet, PAGE_SIZE))
+    assert benchmark(lambda: sum(1 for _ in endpoints.iter_devices())) == len(fleet)
@@ -0,0 +1,29 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from ipaddress import IPv4Network
+
+import pytest
+
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.data_prefix import DataPrefixParcel
+
+ENTRIES = (100, 1000, 10000)
+
+
+def data_prefix_parcel(entries: int) -> DataPrefixParcel:
+    parcel = DataPrefixParcel(parcel_name="BenchmarkDataPrefix")  # type: ignore[call-arg]
+    for index in range(entries):
+        parcel.add_data_prefix(IPv4Network(f"10.{index // 256 % 256}.{index % 256}.0/24"))
+    return parcel
+
+
+@pytest.mark.parametrize("entries", ENTRIES)
+def bench_parcel_model_dump(benchmark, entries):
+    parcel = data_prefix_parcel(entries)
+    payload = benchmark(parcel.model_dump, by_alias=True, exclude_none=True)
+    assert len(payload["data"]["entries"]) == entries
+
+
+@pytest.mark.parametrize("entries", ENTRIES)
+def bench_parcel_model_dump_json(benchmark, entries):
+    parcel = data_prefix_parcel(entries)
+    assert benchmark(parcel.model_dump_json, by_alias=True, exclude_none=True)
@@ -0,0 +1,38 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from ipaddress import IPv4Address, IPv4Network
+from uuid import UUID
+
+import pytest
+
+from catalystwan.models.policy import TrafficDataPolicy
+
+SEQUENCES = (10, 100, 1000)
+LIST_ID = UUID("0f5a6d3c-7e39-4c59-a3c5-6a3ba5d7a0e1")
+
+
+def build_traffic_data_policy(sequences: int) -> TrafficDataPolicy:
+    policy = TrafficDataPolicy(name="BenchmarkTrafficDataPolicy")
+    for index in range(sequences):
+        sequence = policy.add_ipv4_sequence(name=f"sequence-{index}", base_action="accept")
+        sequence.match_source_ip([IPv4Network(f"10.{index // 256}.{index % 256}.0/24")])
+        sequence.match_destination_data_prefix_list(LIST_ID)
+        sequence.match_destination_port(ports={443, 8443}, port_ranges=[(5000, 5100)])
+        sequence.match_dscp(46)
+        sequence.associate_count_action(f"counter-{index}")
+        sequence.associate_next_hop_action(IPv4Address("192.168.0.1"))
+        sequence.associate_vpn_action(10)
+    return policy
+
+
+@pytest.mark.parametrize("sequences", SEQUENCES)
+def bench_build_traffic_data_policy(benchmark, sequences):
+    policy = benchmark(build_traffic_data_policy, sequences)
+    assert len(policy.sequences) == sequences
+
+
+@pytest.mark.parametrize("sequences", SEQUENCES)
+def bench_dump_traffic_data_policy(benchmark, sequences):
+    policy = build_traffic_data_policy(sequences)
+    payload = benchmark(policy.model_dump, by_alias=True, exclude_none=True, mode="json")
+    assert len(payload["sequences"]) == sequences
@@ -0,0 +1,54 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from benchmarks.conftest import make_response
+from catalystwan.endpoints.monitoring.device_details import DeviceData
+from catalystwan.response import ManagerResponse
+from catalystwan.typed_list import DataSequence
+
+
+def bench_response_construction(benchmark, fleet_content):
+    response = make_response(fleet_content)
+    benchmark(ManagerResponse, response)
+
+
+def bench_response_json(benchmark, fleet_content):
+    response = make_response(fleet_content)
+    data = benchmark(lambda: ManagerResponse(response).json())
+    assert len(data["data"]) > 0
+
+
+def bench_response_dataseq(benchmark, fleet, fleet_content):
+    response = make_response(fleet_content)
+    result: DataSequence = benchmark(lambda: ManagerResponse(response).dataseq(DeviceData))
+    assert len(result) == len(fleet)
+
+
+def bench_response_dataseq_without_validation(benchmark, fleet, fleet_content):
+    response = make_response(fleet_content)
+    result: DataSequence = benchmark(lambda: ManagerResponse(response).dataseq(DeviceData, validate=False))
+    assert len(result) == len(fleet)
+
+
+def bench_response_dataseq_of_decoded_json(benchmark, fleet, fleet_content):
+    response = make_response(fleet_content)
+
+    def decoded_dataseq():
+        vmng_response = ManagerResponse(response)
+        vmng_response.json()
+        return vmng_response.dataseq(DeviceData)
+
+    result: DataSequence = benchmark(decoded_dataseq)
+    assert len(result) == len(fleet)
+
+
+def bench_response_dataseq_sampled_validation(benchmark, fleet, fleet_content):
+    response = make_response(fleet_content)
+    result: DataSequence = benchmark(lambda: ManagerResponse(response).dataseq(DeviceData, validate=0.05))
+    assert len(result) == len(fleet)
+
+
+def bench_response_dataseq_projection(benchmark, fleet, fleet_content):
+    response = make_response(fleet_content)
+    fields = ["uuid", "system_ip", "host_name", "reachability"]
+    result: DataSequence = benchmark(lambda: ManagerResponse(response).dataseq(DeviceData, fields=fields))
+    assert len(result) == len(fleet)
@@ -0,0 +1,20 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from catalystwan.api.template_api import TemplatesAPI
+from catalystwan.tests.templates.models import complex_aaa_model, complex_vpn_model, omp_2  # type: ignore[attr-defined]
+
+SCHEMAS = Path(__file__).resolve().parents[1] / "catalystwan" / "tests" / "templates" / "schemas"
+
+
+@pytest.mark.parametrize("template", [complex_vpn_model, complex_aaa_model, omp_2], ids=lambda t: t.type)
+def bench_generate_feature_template_payload(benchmark, template):
+    schema = json.loads((SCHEMAS / f"{template.type}.json").read_text())
+    templates_api = TemplatesAPI(MagicMock())
+    payload = benchmark(templates_api.generate_feature_template_payload, template, schema)
+    assert payload.definition
@@ -0,0 +1,24 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from functools import lru_cache
+
+from benchmarks.conftest import cached_fleet
+from catalystwan.endpoints.monitoring.device_details import DeviceData
+from catalystwan.typed_list import DataSequence
+
+
+@lru_cache()
+def sequence(size: int) -> DataSequence[DeviceData]:
+    return DataSequence(DeviceData, [DeviceData.model_validate(item) for item in cached_fleet(size)])
+
+
+def bench_filter(benchmark, fleet_size):
+    devices = sequence(fleet_size)
+    result = benchmark(devices.filter, personality="vsmart", reachability="reachable")
+    assert 0 < len(result) < fleet_size
+
+
+def bench_find_last(benchmark, fleet_size):
+    devices = sequence(fleet_size)
+    host_name = devices[-1].host_name
+    assert benchmark(devices.find, host_name=host_name) is devices[-1]
@@ -0,0 +1,68 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Measures cold start CPU time and peak RSS of fresh interpreter importing the SDK.
+
+Every scenario runs in new process. Catalog scenarios import feature templates, parcels and policy models,
+"built" variants additionally build every deferred model, which is the cost paid at import time before models
+were declared with defer_build.
+Run: python benchmarks/cold_start.py [--runs N]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from statistics import median
+from typing import Dict, List, Tuple
+
+CATALOG = """
+import catalystwan.api.templates.models.supported
+import catalystwan.models.configuration.config_migration
+import catalystwan.models.configuration.feature_profile.sdwan.policy_object as policy_object
+import catalystwan.models.policy as policy
+policy.AnyPolicyDefinition, policy.AnyPolicyList, policy_object.AnyPolicyObjectParcel
+"""
+
+SCENARIOS: Dict[str, str] = {
+    "import catalystwan.session": "import catalystwan.session",
+    "session containers": """
+from unittest.mock import MagicMock
+from catalystwan.api.api_container import APIContainer
+from catalystwan.endpoints.endpoints_container import APIEndpointContainter
+APIContainer(MagicMock()).load_all()
+APIEndpointContainter(MagicMock()).load_all()
+""",
+    "model catalog": CATALOG,
+    "model catalog built": CATALOG + "from catalystwan.models.warmup import build_models; build_models()",
+}
+
+PROBE = """
+import json, resource, time
+start = time.process_time()
+{code}
+elapsed = time.process_time() - start
+print(json.dumps([elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss]))
+"""
+
+
+def measure(code: str, runs: int) -> Tuple[float, float]:
+    """Returns median CPU seconds and median peak RSS in MiB"""
+    samples: List[Tuple[float, int]] = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", PROBE.format(code=code)], capture_output=True, check=True)
+        samples.append(tuple(json.loads(result.stdout)))  # type: ignore[arg-type]
+    return median(s[0] for s in samples), median(s[1] for s in samples) / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    print(f"median of {args.runs} run(s)")
+    for name, code in SCENARIOS.items():
+        seconds, rss = measure(code, args.runs)
+        print(f"{name:<30} {seconds:6.3f} s CPU {rss:7.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from functools import lru_cache
+from typing import List
+
+import pytest
+from requests import Response
+
+from benchmarks.payloads import FLEET_SIZES, devices, response_content
+
+
+@lru_cache()
+def cached_fleet(size: int) -> List[dict]:
+    return devices(size)
+
+
+@lru_cache()
+def cached_content(size: int) -> bytes:
+    return response_content(cached_fleet(size))
+
+
+def make_response(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "application/json"
+    response._content = content
+    return response
+
+
+@pytest.fixture(params=FLEET_SIZES, ids=lambda size: f"{size // 1000}k")
+def fleet_size(request) -> int:
+    return request.param
+
+
+@pytest.fixture
+def fleet(fleet_size) -> List[dict]:
+    """Device records of fleet (generated once per benchmark session, do not modify)"""
+    return cached_fleet(fleet_size)
+
+
+@pytest.fixture
+def fleet_content(fleet_size) -> bytes:
+    """Serialized /dataservice/device response body of fleet"""
+    return cached_content(fleet_size)
@@ -0,0 +1,65 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Synthetic SDWAN Manager payloads sized like real fleets, deterministic for comparable benchmark runs"""
+
+import json
+from ipaddress import IPv4Address
+from typing import Any, Dict, List
+
+FLEET_SIZES = (1_000, 10_000, 100_000)
+MODELS = ("vedge-C8000V", "vedge-ISR-4331", "vedge-cloud", "vsmart", "vbond")
+PERSONALITIES = ("vedge", "vedge", "vedge", "vsmart", "vbond")
+
+
+def device(index: int) -> Dict[str, Any]:
+    """Device record as returned by /dataservice/device"""
+    system_ip = str(IPv4Address(0x0A000000 + index))
+    kind = index % len(MODELS)
+    return {
+        "deviceId": system_ip,
+        "system-ip": system_ip,
+        "local-system-ip": system_ip,
+        "host-name": f"edge-{index:06d}",
+        "reachability": "reachable" if index % 10 else "unreachable",
+        "status": "normal",
+        "personality": PERSONALITIES[kind],
+        "device-type": PERSONALITIES[kind],
+        "device-model": MODELS[kind],
+        "device-os": "next",
+        "platform": "x86_64",
+        "uuid": f"C8K-{index:08X}-0000-4000-8000-{index:012X}",
+        "board-serial": f"{index:08X}",
+        "site-id": str(100 + index // 50),
+        "domain-id": "1",
+        "version": "17.12.01a.0.118",
+        "uptime-date": 1700000000000 + index,
+        "lastupdated": 1700000000000 + index,
+        "controlConnections": "3",
+        "connectedVManages": ["10.255.0.1"],
+        "device-groups": ["No groups"],
+        "timezone": "UTC",
+        "latitude": "37.666684",
+        "longitude": "-122.777023",
+        "isDeviceGeoData": False,
+        "state": "green",
+        "state_description": "All daemons up",
+        "statusOrder": 4,
+        "validity": "valid",
+        "max-controllers": "0",
+        "model_sku": "None",
+        "testbed_mode": False,
+        "layoutLevel": 4,
+        "total_cpu_count": "8",
+        "cpuState": "normal",
+        "memState": "normal",
+    }
+
+
+def devices(count: int) -> List[Dict[str, Any]]:
+    return [device(index) for index in range(count)]
+
+
+def response_content(data: List[Dict[str, Any]]) -> bytes:
+    """Serialized response body with header and data sections"""
+    header = {"generatedOn": 1700000000000, "viewKeys": {"uniqueKey": ["system-ip"]}, "columns": [], "fields": []}
+    return json.dumps({"header": header, "data": data}).encode()
@@ -0,0 +1,65 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Measures peak memory allocated while parsing /dataservice/device response of fleets into models.
+
+Compares dataseq of loaded response (body, decoded JSON and list of models are held at once) with dataiter
+of streamed response (items are decoded one by one while reading the body, models are dropped after use).
+Run: python benchmarks/stream_memory.py [--chunk-size BYTES]
+"""
+
+import argparse
+import io
+import tracemalloc
+from time import perf_counter
+from typing import Callable, Tuple
+
+from requests import Response
+from urllib3.response import HTTPResponse
+
+from benchmarks.payloads import FLEET_SIZES, devices, response_content
+from catalystwan.endpoints.monitoring.device_details import DeviceData
+from catalystwan.response import STREAM_CHUNK_SIZE, ManagerResponse
+
+
+def streamed(content: bytes) -> ManagerResponse:
+    response = Response()
+    response.status_code = 200
+    response.raw = HTTPResponse(body=io.BytesIO(content), preload_content=False)
+    return ManagerResponse(response)
+
+
+def load_dataseq(content: bytes, chunk_size: int) -> int:
+    response = streamed(content)
+    return len(response.dataseq(DeviceData))
+
+
+def stream_dataiter(content: bytes, chunk_size: int) -> int:
+    response = streamed(content)
+    return sum(1 for _ in response.dataiter(DeviceData, chunk_size=chunk_size))
+
+
+def measure(parse: Callable[[bytes, int], int], content: bytes, chunk_size: int) -> Tuple[float, float]:
+    """Returns peak MiB allocated while parsing and elapsed seconds (served body itself is not counted)"""
+    tracemalloc.start()
+    begin = perf_counter()
+    parse(content, chunk_size)
+    elapsed = perf_counter() - begin
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 2**20, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=STREAM_CHUNK_SIZE)
+    args = parser.parse_args()
+    for size in FLEET_SIZES:
+        content = response_content(devices(size))
+        print(f"{size} devices, body {len(content) / 2**20:.1f} MiB")
+        for name, parse in (("dataseq", load_dataseq), ("dataiter", stream_dataiter)):
+            peak, elapsed = measure(parse, content, args.chunk_size)
+            print(f"  {name:<10} peak {peak:8.2f} MiB {elapsed:7.3f} s (traced)")
+
+
+if __name__ == "__main__":
+    main()
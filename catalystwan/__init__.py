@@ -3,17 +3,20 @@
 import logging
 import logging.config
 import multiprocessing
+import sys
 from functools import lru_cache, wraps
 from importlib import metadata
 from importlib.machinery import PathFinder
 from os import environ
 from pathlib import Path
-from traceback import FrameSummary, StackSummary, extract_stack
-from typing import Callable, Final, List, Optional
+from traceback import FrameSummary, StackSummary
+from types import FrameType
+from typing import Any, Callable, Dict, Final, FrozenSet, List, NamedTuple, Optional
 
 import urllib3
 
-USER_AGENT = f"{__package__}/{metadata.version(__package__)}"
+__version__ = metadata.version(__package__)
+USER_AGENT = f"{__package__}/{__version__}"
 
 
 def with_proc_info_header(method: Callable[..., str]) -> Callable[..., str]:
@@ -25,15 +28,46 @@ def with_proc_info_header(method: Callable[..., str]) -> Callable[..., str]:
     def wrapper(*args, **kwargs) -> str:
         wrapped = method(*args, **kwargs)
         header = f"{multiprocessing.current_process()}"
-        if frame_summary := get_first_external_stack_frame(extract_stack()):
-            fname, line_no, function, _ = frame_summary
-            header += " %s:%d %s(...)" % (fname, line_no, function)
+        if caller := get_external_caller():
+            header += " %s:%d %s(...)" % caller
         header += "\n"
         return header + wrapped
 
     return wrapper
 
 
+class Caller(NamedTuple):
+    filename: str
+    lineno: int
+    function: str
+
+
+_files_in_package: Dict[str, bool] = {}
+
+
+def get_external_caller(frame: Optional[FrameType] = None) -> Optional[Caller]:
+    """
+    Get the code which called into catalystwan: the frame just before
+    the outermost catalystwan frame on the stack (same as get_first_external_stack_frame).
+    Walks raw frame objects starting from given frame (default: caller of this function),
+    package membership is cached per code object file and source lines are never read
+    """
+    frame = sys._getframe(1) if frame is None else frame
+    caller: Optional[FrameType] = None
+    in_package = False
+    while frame is not None:
+        fname = frame.f_code.co_filename
+        if (frame_in_package := _files_in_package.get(fname)) is None:
+            frame_in_package = _files_in_package[fname] = is_file_in_package(fname)
+        if in_package and not frame_in_package:
+            caller = frame
+        in_package = frame_in_package
+        frame = frame.f_back
+    if in_package or caller is None:
+        return None
+    return Caller(caller.f_code.co_filename, caller.f_lineno, caller.f_code.co_name)
+
+
 def get_first_external_stack_frame(stack: StackSummary) -> Optional[FrameSummary]:
     """
     Get the first python frame
@@ -55,7 +89,7 @@ def is_file_in_package(fname: str) -> bool:
     Checks if filepath given by string
     is part of catalystwan source code
     """
-    return Path(fname) in pkg_src_list
+    return Path(fname) in package_sources()
 
 
 def list_package_sources() -> List[Path]:
@@ -70,9 +104,22 @@ def list_package_sources() -> List[Path]:
     return pkg_srcs
 
 
+@lru_cache()
+def package_sources() -> FrozenSet[Path]:
+    """
+    Paths to all python source files of current package,
+    listed on first use instead of during import
+    """
+    return frozenset(list_package_sources())
+
+
+def __getattr__(name: str) -> Any:
+    if name == "pkg_src_list":
+        return list(package_sources())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 LOGGING_CONF_DIR: Final[str] = str(Path(__file__).parents[0] / "logging.conf")
-__version__ = metadata.version(__package__)
-pkg_src_list = list_package_sources()
 
 
 if environ.get("catalystwan_devel") is not None:
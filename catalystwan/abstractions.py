@@ -1,12 +1,14 @@
 # Copyright 2024 Cisco Systems, Inc. and its affiliates
 
-from typing import Optional, Protocol, Type, TypeVar
+from threading import RLock
+from typing import Iterator, Optional, Protocol, Type, TypeVar
 
 from packaging.version import Version  # type: ignore
 from requests import PreparedRequest
 
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.session_type import SessionType
+from catalystwan.validation import Validation
 
 T = TypeVar("T")
 
@@ -25,10 +27,13 @@ class APIEndpointClientResponse(Protocol):
     def content(self) -> bytes:
         ...
 
-    def dataobj(self, cls: Type[T], sourcekey: Optional[str], validate: bool) -> T:
+    def dataobj(self, cls: Type[T], sourcekey: Optional[str], validate: Validation) -> T:
         ...
 
-    def dataseq(self, cls: Type[T], sourcekey: Optional[str], validate: bool) -> DataSequence[T]:
+    def dataseq(self, cls: Type[T], sourcekey: Optional[str], validate: Validation) -> DataSequence[T]:
+        ...
+
+    def dataiter(self, cls: Type[T], sourcekey: Optional[str], validate: Validation) -> Iterator[T]:
         ...
 
     def json(self) -> dict:
@@ -59,11 +64,41 @@ class APIEndpointClient(Protocol):
         ...
 
 
+class AsyncAPIEndpointClient(Protocol):
+    """
+    Interface to asynchronous client object.
+    Same as APIEndpointClient but 'request' is a coroutine,
+    methods decorated with @request return awaitables when bound to such client.
+    """
+
+    async def request(self, method: str, url: str, **kwargs) -> APIEndpointClientResponse:
+        ...
+
+    @property
+    def api_version(self) -> Version:
+        ...
+
+    @property
+    def session_type(self) -> Optional[SessionType]:
+        ...
+
+    @property
+    def validate_responses(self) -> bool:
+        ...
+
+
 class AuthProtocol(Protocol):
     """
     Additional interface for Auth to handle login/logout for multiple auth types by common ManagerSession
+
+    Attributes:
+        generation: number of successful authentications, changes whenever credentials are renewed
+        login_lock: held by session performing login, so login is done once for all sessions sharing the auth
     """
 
+    generation: int
+    login_lock: RLock
+
     def logout(self, client: APIEndpointClient) -> None:
         ...
 
@@ -170,7 +170,8 @@ class AdminTechAPI:
             download_dir = Path.cwd()
         download_path = download_dir / filename
         url = f"/dataservice/device/tools/admintech/download/{filename}"
-        if self.session.get_file(url=url, filename=download_path).status_code != 200:
+        # resumed download is completed with 206 Partial Content
+        if self.session.get_file(url=url, filename=download_path).status_code not in (200, 206):
             raise DownloadAdminTechLogError(f"Cannot download admin tech file: {filename} from remote")
         logger.info(f"Downloaded AdminTech file to: {download_path}")
         return download_path
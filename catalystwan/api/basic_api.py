@@ -153,7 +153,9 @@ class DevicesAPI:
             logger.info("Rediscovering devices...")
             api = "/dataservice/device/action/rediscoverall"
             self.session.post(url=api)
-        devices = self.session.endpoints.monitoring_device_details.list_all_devices()
+        devices = self.session.endpoints.monitoring_device_details.list_all_devices(
+            fields=["device_id"]  # type: ignore [call-arg]
+        )
         device_ids = [device.device_id for device in devices]
         devices_sys_info = DataSequence(Device, [])
         for i in range(0, len(device_ids), self.max_params):
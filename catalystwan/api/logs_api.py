@@ -6,7 +6,8 @@ import logging
 from datetime import datetime as dt
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
-from urllib.parse import quote
+
+from catalystwan.endpoints.monitoring.audit_log import AuditLogQuery
 
 logger = logging.getLogger(__name__)
 
@@ -41,21 +42,19 @@ class LogsAPI:
                 ],
             }
         }
-        addon_to_url = quote(str(query), safe="").replace("%27", "%22")
-
-        url_path = f"/dataservice/auditlog/severity?query={addon_to_url}"
-        logs = self.session.get_data(url_path)
+        # audit log is requested page by page and written while next pages are received
+        logs = self.session.endpoints.monitoring_audit_log.get_audit_logs(AuditLogQuery(**query))
 
         if file_path is None:
             file_path = str(Path(__file__).parents[0] / "audit.log")
 
         with open(file_path, "w") as file:
             for log in logs:
-                time = dt.utcfromtimestamp(log["entry_time"] / 1000)
+                time = dt.utcfromtimestamp(log.entry_time / 1000)
                 time_readable = time.strftime("%Y-%m-%d %H:%M:%S")
                 file.write(
-                    f"Entry time: {time_readable} - LogId: {log['logid']} - "
-                    f"Log message: {log['logmessage']} - TenantId: {log['tenant']}\n"
+                    f"Entry time: {time_readable} - LogId: {log.logid} - "
+                    f"Log message: {log.logmessage} - TenantId: {log.tenant}\n"
                 )
 
         logger.info(f"Logs saved to {file_path}")
@@ -142,7 +142,7 @@ class PacketCaptureAPI:
         if file_path is None:
             file_path = f"{Path(__file__).parents[0]}/{device.uuid}.pcap"
         url = f"/dataservice/stream/device/capture/download/{packet.session_id}"
-        self.session.get_file(url, file_path)  # type: ignore
+        self.session.get_file(url, file_path)
         return True
 
     def get_status(self, packet_channel: PacketSetup) -> Status:
@@ -69,9 +69,11 @@ class TenantMigrationAPI:
             download_path (Path): full download path containing a filename eg.: Path("/home/user/tenant-export.tar.gz")
             remote_filename (str): path to exported tenant migration file on vManage
         """
-        tenant_data = self.session.endpoints.tenant_migration.download_tenant_data(remote_filename)
-        with open(download_path, "wb") as file:
-            file.write(tenant_data)
+        # file is streamed to disk by session, endpoint restrictions are checked as the endpoint is not called
+        endpoints = self.session.endpoints.tenant_migration
+        endpoints.check_compatibility(endpoints.download_tenant_data)
+        url = f"/dataservice/tenantmigration/download/{remote_filename}"
+        self.session.get_file(url, download_path)
 
     def import_tenant(self, import_file: Path, migration_key: Optional[str] = None) -> ImportTask:
         """Imports the deployment and configuration data into multi-tenant vManage instance.
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import json
 import logging
+from copy import copy
 from pathlib import PurePath
-from typing import TYPE_CHECKING, Dict, List, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -16,15 +18,33 @@ from catalystwan.endpoints.configuration_device_actions import (
     PartitionDevice,
 )
 from catalystwan.endpoints.configuration_device_inventory import DeviceDetailsResponse
-from catalystwan.exceptions import ImageNotInRepositoryError
+from catalystwan.exceptions import ImageChecksumError, ImageNotInRepositoryError
 from catalystwan.typed_list import DataSequence
-from catalystwan.utils.upgrades_helper import SoftwarePackageUploadPayload
+from catalystwan.utils.upgrades_helper import ImageFile, SoftwarePackageUploadPayload
 
 if TYPE_CHECKING:
     from catalystwan.session import ManagerSession
 
 logger = logging.getLogger(__name__)
 
+SOFTWARE_PACKAGE_URL = "/dataservice/device/action/software/package"
+SOFTWARE_PACKAGE_ENDPOINT = "ConfigurationDeviceSoftwareUpdate.upload_software_to_manager"
+
+
+def remote_checksums(image_details: SoftwareImageDetails, image_name: str) -> List[str]:
+    """Returns checksums reported by vManage for given image file (checksum map is JSON object or plain digest)"""
+    if not image_details.checksum_map:
+        return []
+    try:
+        checksum_map = json.loads(image_details.checksum_map)
+    except ValueError:
+        return [image_details.checksum_map.strip()]
+    if isinstance(checksum_map, dict):
+        if image_name in checksum_map:
+            return [str(checksum_map[image_name])]
+        return [str(checksum) for checksum in checksum_map.values()]
+    return [str(checksum_map)]
+
 
 class DeviceSoftwareRepository(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -172,19 +192,87 @@ class RepositoryAPI:
         )
         return None
 
-    def upload_image(self, image_path: str) -> None:
+    def upload_image(
+        self,
+        image_path: str,
+        checksum: Optional[str] = None,
+        skip_existing: bool = True,
+        verify: bool = True,
+        max_attempts: Optional[int] = None,
+    ) -> bool:
         """
         Upload software image ('tar.gz' or 'SPA.bin') to vManage software repository
 
+        Image is streamed from memory-mapped file, so memory usage does not depend on image size.
+        Software package API does not support partial uploads, so interrupted upload is repeated from the start
+        (unless the image is already present in repository with matching checksum).
+
         Args:
             image_path (str): path to software image
+            checksum (Optional[str]): expected digest of local image in "<algorithm>:<hexdigest>" format
+            skip_existing (bool): do not upload image already present in repository with the same name and checksum
+            verify (bool): verify checksum reported by vManage for uploaded image (when available)
+            max_attempts (Optional[int]): maximum number of upload attempts on transient failures
+                (defaults to max_attempts of session.retry_policy). Upload is repeated according to session retry
+                policy as request opted-in for retry, except for its deadline (single upload can take longer)
+
+        Raises:
+            ImageChecksumError: local image or uploaded image checksum mismatch
 
         Returns:
-            str: Response status code
+            bool: True when image was uploaded, False when upload was skipped
+                (returned None before checksum verification and skipping were introduced)
         """
-        self.session.endpoints.configuration_device_software_update.upload_software_to_manager(
-            payload=SoftwarePackageUploadPayload(image_path=image_path)
-        )
+        image = ImageFile(image_path)
+        if checksum is not None:
+            algorithm, _, expected = checksum.partition(":")
+            if (digest := image.digest(algorithm)) != expected.lower():
+                raise ImageChecksumError(f"Image {image.name} {algorithm} checksum mismatch: {digest} != {expected}")
+        if skip_existing and self._find_uploaded_image(image, match_checksum=True):
+            logger.info(f"Image {image.name} already present in software repository, skipping upload")
+            return False
+        policy = copy(self.session.retry_policy)  # shares counters with session policy
+        policy.deadline = None
+        if max_attempts is not None:
+            policy.max_attempts = max_attempts
+        upload_software = self.session.endpoints.configuration_device_software_update.upload_software_to_manager
+        attempts = 0
+
+        def upload() -> bool:
+            nonlocal attempts
+            attempts += 1
+            if attempts > 1 and self._find_uploaded_image(image, match_checksum=True):
+                logger.info(f"Image {image.name} found in software repository after failed upload")
+                return False
+            upload_software(payload=SoftwarePackageUploadPayload(image_path=image_path))
+            return True
+
+        try:
+            uploaded = policy.execute(upload, "POST", SOFTWARE_PACKAGE_URL, retry=True)
+        finally:
+            if attempts > 1 and (metrics := self.session.metrics) is not None:
+                metrics.record_retries(SOFTWARE_PACKAGE_ENDPOINT, "POST", attempts - 1)
+        if uploaded and verify:
+            self._verify_uploaded_image(image)
+        return True
+
+    def _find_uploaded_image(self, image: ImageFile, match_checksum: bool) -> Optional[SoftwareImageDetails]:
+        for image_details in self.get_all_software_images():
+            if image_details.available_files and image.name in image_details.available_files:
+                if not match_checksum or any(image.matches(c) for c in remote_checksums(image_details, image.name)):
+                    return image_details
+        return None
+
+    def _verify_uploaded_image(self, image: ImageFile) -> None:
+        if (image_details := self._find_uploaded_image(image, match_checksum=False)) is None:
+            raise ImageNotInRepositoryError(f"Image: {image.name} is not the vManage software repository after upload")
+        checksums = remote_checksums(image_details, image.name)
+        if not checksums:
+            logger.debug(f"vManage does not report checksum of {image.name}, skipping verification")
+            return
+        if not any(image.matches(checksum) for checksum in checksums):
+            raise ImageChecksumError(f"Uploaded image {image.name} checksum mismatch, reported: {checksums}")
+        logger.info(f"Verified checksum of uploaded image {image.name}")
 
     def delete_image(self, image_name: str) -> None:
         """
@@ -1,6 +1,8 @@
 import logging
+from dataclasses import dataclass
 from threading import RLock
-from typing import Literal, Optional
+from time import monotonic
+from typing import Literal, Mapping, Optional
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, PositiveInt
@@ -26,39 +28,89 @@ class ApiGwLogin(BaseModel):
     token_duration: PositiveInt = Field(default=10, description="in minutes")
 
 
+@dataclass(frozen=True)
+class ApiGwAuthSnapshot:
+    """Immutable headers prepared once per token and applied to requests without locking"""
+
+    generation: int
+    expires: float
+    headers: Mapping[str, str]
+
+
 class ApiGwAuth(AuthBase, AuthProtocol):
     """Attaches ApiGateway Authentication to the given Requests object.
 
     1. Get a bearer token by sending a POST request to the /apigw/login endpoint.
     2. Use the token in the Authorization header for subsequent requests.
+    3. Refresh the token 'refresh_margin' seconds before 'token_duration' expires (instead of waiting for 401).
     """
 
-    def __init__(self, login: ApiGwLogin, logger: Optional[logging.Logger] = None, verify: bool = False):
+    def __init__(
+        self,
+        login: ApiGwLogin,
+        logger: Optional[logging.Logger] = None,
+        verify: bool = False,
+        refresh_margin: float = 60.0,
+    ):
+        self._snapshot: Optional[ApiGwAuthSnapshot] = None
         self.login = login
         self.token = ""
+        self.token_expires: float = 0.0
+        self.refresh_margin = refresh_margin
         self.logger = logger or logging.getLogger(__name__)
         self.verify = verify
         self.session_count: int = 0
         self.lock: RLock = RLock()
+        self.login_lock: RLock = RLock()
+        self.generation: int = 0
 
     def __str__(self) -> str:
         return f"ApiGatewayAuth(mode={self.login.mode})"
 
     def __call__(self, request: PreparedRequest) -> PreparedRequest:
-        with self.lock:
-            self.handle_auth(request)
-            self.build_digest_header(request)
+        # fast path: headers snapshot is swapped atomically, lock is needed only to obtain or refresh the token
+        snapshot = self._snapshot
+        if snapshot is None or monotonic() >= snapshot.expires:
+            with self.lock:
+                self.handle_auth(request)
+                snapshot = self._snapshot = self._snapshot or self.create_snapshot()
+        request.headers.update(snapshot.headers)
         return request
 
+    def create_snapshot(self) -> ApiGwAuthSnapshot:
+        return ApiGwAuthSnapshot(
+            generation=self.generation,
+            expires=self.token_expires,
+            headers={"sdwan-org": self.login.org_name, "Authorization": f"Bearer {self.token}"},
+        )
+
+    @property
+    def token(self) -> str:
+        return self._token
+
+    @token.setter
+    def token(self, token: str) -> None:
+        self._token = token
+        self._snapshot = None
+
     def handle_auth(self, request: PreparedRequest) -> None:
         if self.token == "":
             self.authenticate(request)
+            self.generation += 1
+        elif monotonic() >= self.token_expires:
+            self.logger.debug(f"Refreshing bearer token of {self} ahead of expiration")
+            self.authenticate(request)
+            self.generation += 1
 
     def authenticate(self, request: PreparedRequest):
         assert request.url is not None
         url = urlparse(request.url)
         base_url = f"{url.scheme}://{url.netloc}"  # noqa: E231
+        issued = monotonic()
         self.token = self.get_token(base_url, self.login, self.logger, self.verify)
+        # refresh token before it expires, margin is limited to half of token lifetime
+        duration = self.login.token_duration * 60
+        self.token_expires = issued + duration - min(self.refresh_margin, duration / 2)
 
     def build_digest_header(self, request: PreparedRequest) -> None:
         header = {
@@ -99,6 +151,7 @@ class ApiGwAuth(AuthBase, AuthProtocol):
     def _clear(self) -> None:
         with self.lock:
             self.token = ""
+            self.generation += 1
 
     def increase_session_count(self) -> None:
         with self.lock:
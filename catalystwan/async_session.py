@@ -0,0 +1,464 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""This module defines AsyncManagerSession - asynchronous counterpart of ManagerSession.
+It is built on httpx.AsyncClient which is an optional dependency: pip install catalystwan[async]
+
+Methods of APIEndpoints decorated with @request return awaitables when bound to AsyncManagerSession:
+>>> from catalystwan.async_session import create_async_manager_session
+>>>
+>>> async def main():
+>>>     async with await create_async_manager_session(url, username, password) as session:
+>>>         devices, statistics_settings = await asyncio.gather(
+>>>             session.endpoints.monitoring_device_details.list_all_devices(),
+>>>             session.endpoints.monitoring_status.get_statistics_settings(),
+>>>         )
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import cached_property, partial
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+from urllib.parse import urljoin
+
+import httpx
+from packaging.version import Version  # type: ignore
+from requests import PreparedRequest, Request, Response
+from requests.cookies import RequestsCookieJar, cookiejar_from_dict
+from requests.exceptions import HTTPError
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from catalystwan import USER_AGENT
+from catalystwan.abstractions import AsyncAPIEndpointClient
+from catalystwan.apigw_auth import ApiGwAuth
+from catalystwan.endpoints.client import ServerInfo
+from catalystwan.exceptions import (
+    DefaultPasswordError,
+    ManagerHTTPError,
+    ManagerReadyTimeout,
+    ManagerRequestException,
+    SessionNotCreatedError,
+)
+from catalystwan.request_limiter import AsyncRequestLimiter
+from catalystwan.request_tracer import RequestTracer
+from catalystwan.response import ManagerResponse, response_history_debug
+from catalystwan.session import (
+    MAX_AUTH_RESENDS,
+    ManagerSessionState,
+    UserMode,
+    create_base_url,
+    determine_session_type,
+)
+from catalystwan.utils.session_type import SessionType
+from catalystwan.version import NullVersion, parse_api_version
+from catalystwan.vmanage_auth import create_vmanage_auth, vManageAuth
+
+if TYPE_CHECKING:
+    from catalystwan.endpoints.endpoints_container import APIEndpointContainter
+
+REQUEST_ARGS = {"data", "files", "params", "json"}
+
+
+def to_requests_response(http_response: httpx.Response, request: PreparedRequest) -> Response:
+    """Converts received httpx.Response to requests.Response so ManagerResponse semantics are kept"""
+    response = Response()
+    response.status_code = http_response.status_code
+    response.reason = http_response.reason_phrase
+    response.headers = CaseInsensitiveDict(http_response.headers.items())
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = str(http_response.url)
+    try:
+        response.elapsed = http_response.elapsed
+    except RuntimeError:
+        pass  # elapsed is not measured when response is not received from network (eg. mocked transport)
+    response.cookies = cookiejar_from_dict(dict(http_response.cookies))
+    response._content = http_response.content
+    final_request = request.copy()
+    final_request.url = str(http_response.request.url)
+    response.request = final_request
+    response.history = [to_requests_response(redirect, request) for redirect in http_response.history]
+    return response
+
+
+async def create_async_manager_session(
+    url: str,
+    username: str,
+    password: str,
+    port: Optional[int] = None,
+    subdomain: Optional[str] = None,
+    logger: Optional[logging.Logger] = None,
+) -> AsyncManagerSession:
+    """Factory method that creates asynchronous session object and performs login according to parameters
+
+    Args:
+        url (str): IP address or domain name
+        username (str): username
+        password (str): password
+        port (int): port
+        subdomain: subdomain specifying to which view switch when creating provider as a tenant session,
+            works only on provider user mode
+        logger: override default module logger
+
+    Returns:
+        AsyncManagerSession: logged-in and operative session to perform tasks on SDWAN Manager.
+    """
+    auth = create_vmanage_auth(username, password, subdomain, logger)
+    session = AsyncManagerSession(
+        base_url=create_base_url(url, port),
+        auth=auth,
+        subdomain=subdomain,
+        logger=logger,
+    )
+    await session.login()
+    return session
+
+
+class AsyncManagerSession(AsyncAPIEndpointClient):
+    """Asynchronous API session for vManage client.
+
+    Shares login state machine, authentication objects and ManagerResponse semantics with ManagerSession
+    but sends requests using httpx.AsyncClient, so many requests can be in-flight without a thread per call.
+    Only 'endpoints' container is available as helpers from 'api' container are synchronous.
+
+    Authentication objects are synchronous: login requests are executed in default executor
+    and afterwards credentials are attached to each request without blocking the event loop.
+
+    Args:
+        base_url: IP address or domain name, i.e. '10.0.1.200' or 'example.com'
+        auth: authentication object - vManage or API Gateway
+        subdomain: subdomain specifying to which view switch when creating provider as a tenant session,
+            works only on provider user mode
+        logger: override default module logger
+        request_limiter: limits number of concurrent requests
+        request_tracer: controls debug trace sampling and keeps history of recent exchanges
+        http_client: preconfigured httpx.AsyncClient (eg. with custom transport or limits)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        auth: Union[vManageAuth, ApiGwAuth],
+        subdomain: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+        request_limiter: Optional[AsyncRequestLimiter] = None,
+        request_tracer: Optional[RequestTracer] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        self.base_url = base_url
+        self.subdomain = subdomain
+        self._session_type = SessionType.NOT_DEFINED
+        self.server_name: Optional[str] = None
+        self.logger = logger or logging.getLogger(__name__)
+        self.response_trace: Callable[
+            [Optional[Response], Union[Request, PreparedRequest, None]], str
+        ] = response_history_debug
+        self.tracer: RequestTracer = request_tracer or RequestTracer()
+        self.verify = False
+        self.headers: CaseInsensitiveDict = CaseInsensitiveDict({"User-Agent": USER_AGENT})
+        self.cookies: RequestsCookieJar = RequestsCookieJar()
+        self._http_client = http_client
+        self._added_to_auth = False
+        self._auth = auth
+        self._platform_version: str = ""
+        self._api_version: Version = NullVersion  # type: ignore
+        self.restart_timeout: int = 1200
+        self.polling_requests_timeout: int = 10
+        self.request_timeout: Optional[int] = None
+        self._validate_responses = True
+        self._state: ManagerSessionState = ManagerSessionState.OPERATIVE
+        self._last_request: Optional[PreparedRequest] = None
+        self._limiter: AsyncRequestLimiter = request_limiter or AsyncRequestLimiter()
+        self._login_lock: Optional[asyncio.Lock] = None
+        self._login_generation: int = 0
+
+    @cached_property
+    def endpoints(self) -> APIEndpointContainter:
+        from catalystwan.endpoints.endpoints_container import APIEndpointContainter
+
+        # endpoints only rely on client protocol which is satisfied by asynchronous session
+        self._endpoints = APIEndpointContainter(self)  # type: ignore[arg-type]
+        return self._endpoints
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(verify=self.verify, follow_redirects=True)
+        return self._http_client
+
+    @property
+    def state(self) -> ManagerSessionState:
+        return self._state
+
+    async def set_state(self, state: ManagerSessionState) -> None:
+        """Resets the session to given state and manages transition to desired OPERATIONAL state"""
+        self._state = state
+        self.logger.debug(f"Session entered state: {self.state.name}")
+
+        if state == ManagerSessionState.OPERATIVE:
+            # this is desired state, nothing to be done
+            return
+        elif state == ManagerSessionState.RESTART_IMMINENT:
+            # in this state we process requests normally
+            # but when ConnectError is caught we enter WAIT_SERVER_READY_AFTER_RESTART
+            return
+        elif state == ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART:
+            await self.wait_server_ready(self.restart_timeout)
+            await self.set_state(ManagerSessionState.LOGIN)
+        elif state == ManagerSessionState.LOGIN:
+            await self.set_state(ManagerSessionState.LOGIN_IN_PROGRESS)
+            await self._sync_auth()
+            server_info = await self._fetch_server_info()
+            self._finalize_login(server_info)
+            self._login_generation += 1
+            await self.set_state(ManagerSessionState.OPERATIVE)
+        elif state == ManagerSessionState.LOGIN_IN_PROGRESS:
+            # nothing to be done, continue to login
+            return
+        elif state == ManagerSessionState.AUTH_SYNC:
+            # expired auth detected during the login, only authenticate and return to the previous login flow
+            await self._sync_auth()
+            await self.set_state(ManagerSessionState.LOGIN_IN_PROGRESS)
+        return
+
+    def restart_imminent(self, restart_timeout_override: Optional[int] = None):
+        """Notify session that restart is imminent.
+        ConnectError and status code 503 will cause session to wait for connectivity and perform login again
+
+        Args:
+            restart_timeout_override (Optional[int], optional): override session property which controls restart timeout
+        """
+        if restart_timeout_override is not None:
+            self.restart_timeout = restart_timeout_override
+        self._state = ManagerSessionState.RESTART_IMMINENT
+
+    async def _run_blocking(self, func: Callable[..., Any], *args) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args))
+
+    async def _sync_auth(self) -> None:
+        self.cookies.clear_session_cookies()
+        if not self._added_to_auth:
+            self._auth.increase_session_count()
+            self._added_to_auth = True
+        self._auth.clear(self._last_request)
+        # authenticate in executor so credentials are ready and subsequent requests do not block event loop
+        await self._run_blocking(self._auth, Request("GET", self.base_url).prepare())
+
+    async def _fetch_server_info(self) -> ServerInfo:
+        try:
+            server_info = await self.server()
+        except DefaultPasswordError:
+            server_info = ServerInfo.model_construct(**{})
+
+        return server_info
+
+    def _finalize_login(self, server_info: ServerInfo) -> None:
+        self.server_name = server_info.server
+
+        tenancy_mode = server_info.tenancy_mode
+        user_mode = server_info.user_mode
+        view_mode = server_info.view_mode
+
+        self._session_type = determine_session_type(tenancy_mode, user_mode, view_mode)
+
+        if user_mode is UserMode.TENANT and self.subdomain:
+            raise SessionNotCreatedError(
+                f"Session not created. Subdomain {self.subdomain} passed to tenant session, "
+                "cannot switch to tenant from tenant user mode."
+            )
+        elif self._session_type is SessionType.NOT_DEFINED:
+            self.logger.warning(
+                "Cannot determine session type for "
+                f"tenancy-mode: {tenancy_mode}, user-mode: {user_mode}, view-mode: {view_mode}"
+            )
+
+        self.logger.info(
+            f"Logged to vManage({self.platform_version}) as {self._auth}. The session type is {self.session_type}"
+        )
+
+    async def login(self) -> AsyncManagerSession:
+        """Performs login to SDWAN Manager and fetches important server info to instance variables
+
+        Raises:
+            SessionNotCreatedError: indicates session configuration is not consistent
+
+        Returns:
+            AsyncManagerSession: (self)
+        """
+        await self.set_state(ManagerSessionState.LOGIN)
+        return self
+
+    async def _relogin(self, generation: int, last_request: PreparedRequest) -> None:
+        """Performs login only once for all coroutines which detected expired auth in the same login generation"""
+        if self._login_lock is None:
+            self._login_lock = asyncio.Lock()
+        async with self._login_lock:
+            if generation != self._login_generation:
+                # other coroutine already logged in, just repeat the request
+                return
+            self._last_request = last_request
+            await self.set_state(ManagerSessionState.LOGIN)
+
+    async def wait_server_ready(self, timeout: int, poll_period: int = 10) -> None:
+        """Waits until server is ready for API requests with given timeout in seconds"""
+
+        begin = monotonic()
+        self.logger.info(f"Waiting for server ready with timeout {timeout} seconds.")
+        headers = {"User-Agent": USER_AGENT}
+
+        def elapsed() -> float:
+            return monotonic() - begin
+
+        # wait for http available
+        while elapsed() < timeout:
+            try:
+                resp = await self.http_client.head(
+                    self.base_url, timeout=self.polling_requests_timeout, headers=headers
+                )
+                if resp.status_code != 503:
+                    break
+            except httpx.TransportError as error:
+                self.logger.debug(error)
+            await asyncio.sleep(poll_period)
+
+        # wait server ready flag
+        server_ready_url = self.get_full_url("/dataservice/client/server/ready")
+        while elapsed() < timeout:
+            try:
+                resp = await self.http_client.get(
+                    server_ready_url, timeout=self.polling_requests_timeout, headers=headers
+                )
+            except httpx.HTTPError as exception:
+                self.logger.debug(exception)
+                raise ManagerRequestException(*exception.args)
+            if resp.status_code == 200 and resp.json().get("isServerReady") is True:
+                self.logger.debug(f"Waiting for server ready took: {elapsed()} seconds.")
+                return
+            await asyncio.sleep(poll_period)
+
+        raise ManagerReadyTimeout(f"Waiting for server ready took longer than {timeout} seconds.")
+
+    async def _send(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        headers = CaseInsensitiveDict(self.headers)
+        headers.update(kwargs.get("headers") or {})
+        request_kwargs = {key: value for key, value in kwargs.items() if key in REQUEST_ARGS}
+        prepared = Request(method, url, headers=headers, cookies=self.cookies, **request_kwargs).prepare()
+        self._auth(prepared)
+        body = prepared.body
+        if hasattr(body, "read"):
+            body = body.read()  # type: ignore[union-attr]
+        http_response = await self.http_client.request(
+            method,
+            str(prepared.url),
+            headers=dict(prepared.headers),
+            content=body,  # type: ignore[arg-type]
+            timeout=kwargs.get("timeout", httpx.USE_CLIENT_DEFAULT),
+        )
+        response = ManagerResponse(to_requests_response(http_response, prepared))
+        self.cookies.update(response.cookies)
+        return response
+
+    async def request(self, method: str, url: str, _auth_resends: int = 0, **kwargs) -> ManagerResponse:
+        full_url = self.get_full_url(url)
+        _kwargs = dict(kwargs)
+        if self.request_timeout is not None:  # do not modify user provided kwargs unless property is set
+            _kwargs.update(timeout=self.request_timeout)
+        generation = self._login_generation
+        try:
+            async with self._limiter:
+                response = await self._send(method, full_url, **_kwargs)
+            self._trace(response, None)
+            if self.state == ManagerSessionState.RESTART_IMMINENT and response.status_code == 503:
+                await self.set_state(ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART)
+        except httpx.HTTPError as exception:
+            self.logger.debug(exception)
+            if self.state == ManagerSessionState.RESTART_IMMINENT and isinstance(exception, httpx.ConnectError):
+                await self.set_state(ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART)
+                return await self.request(method, url, **_kwargs)
+            raise ManagerRequestException(*exception.args)
+
+        self._last_request = response.request
+        if (response.jsessionid_expired or response.api_gw_unauthorized) and self.state in [
+            ManagerSessionState.OPERATIVE,
+            ManagerSessionState.LOGIN_IN_PROGRESS,
+        ]:
+            if _auth_resends >= MAX_AUTH_RESENDS:
+                raise ManagerRequestException(
+                    f"Request not authorized after {_auth_resends} logins", request=response.request, response=response
+                )
+            if self.state == ManagerSessionState.LOGIN_IN_PROGRESS:
+                # detected expired auth during login, resync
+                await self.set_state(ManagerSessionState.AUTH_SYNC)
+            else:
+                self.logger.warning("Logging to session. Reason: expired auth detected in response")
+                await self._relogin(generation, response.request)
+            return await self.request(method, url, _auth_resends=_auth_resends + 1, **_kwargs)
+
+        if response.request.url and "passwordReset.html" in response.request.url:
+            raise DefaultPasswordError("Password must be changed to use this session.")
+
+        try:
+            response.raise_for_status()
+        except HTTPError as error:
+            self.logger.debug(error)
+            error_info = response.get_error_info()
+            raise ManagerHTTPError(*error.args, error_info=error_info, request=error.request, response=error.response)
+        return response
+
+    def _trace(self, response: Optional[Response], request: Union[Request, PreparedRequest, None]) -> None:
+        self.tracer.trace(self.logger, self.response_trace, response, request)
+
+    def get_full_url(self, url_path: str) -> str:
+        """Returns base API url plus given url path."""
+        return urljoin(self.base_url, url_path)
+
+    async def server(self) -> ServerInfo:
+        server_info = await self.endpoints.client.server()
+        self.platform_version = server_info.platform_version
+        return server_info
+
+    async def logout(self) -> None:
+        if self._added_to_auth:
+            self._auth.decrease_session_count()
+            self._added_to_auth = False
+        await self._run_blocking(self._auth.logout, self)
+
+    async def close(self) -> None:
+        """Closes the AsyncManagerSession: logs out from vManage and closes underlying http client."""
+        await self.logout()
+        await self.http_client.aclose()
+
+    async def __aenter__(self) -> AsyncManagerSession:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session_type(self) -> SessionType:
+        return self._session_type
+
+    @property
+    def platform_version(self) -> str:
+        return self._platform_version
+
+    @platform_version.setter
+    def platform_version(self, version: str):
+        self._platform_version = version
+        self._api_version = parse_api_version(version)
+
+    @property
+    def api_version(self) -> Version:
+        return self._api_version
+
+    @property
+    def validate_responses(self) -> bool:
+        return self._validate_responses
+
+    @validate_responses.setter
+    def validate_responses(self, value: bool):
+        self._validate_responses = value
+
+    def __str__(self) -> str:
+        return f"AsyncManagerSession(session_type={self.session_type}, auth={self._auth})"
@@ -0,0 +1,165 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from threading import Event, Lock
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from catalystwan.session import ManagerSession
+
+T = TypeVar("T")
+BatchProgressCallback = Callable[[int, int], None]
+DEFAULT_BATCH_WORKERS = 8
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """Outcome of single call executed in batch: returned value or raised exception"""
+
+    index: int
+    item: Any
+    value: Optional[T] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def cancelled(self) -> bool:
+        return isinstance(self.error, CancelledError)
+
+    def unwrap(self) -> T:
+        """Returns value or raises exception of the call"""
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+
+class Batch:
+    """Runs API calls (APIEndpoints methods, *API helpers or any callable using the session) concurrently.
+
+    Calls are sent by the session, so request limiter, retry policy, re-login and other session features apply
+    to each of them. Number of worker threads is additionally capped by request limiter limit.
+    Exception raised by a call is captured in its result and other calls continue, unless 'fail_fast' is set,
+    then calls not started yet are cancelled after first failure.
+
+    Args:
+        session: session used by the calls (determines default number of workers)
+        max_workers: number of calls executed at once
+        fail_fast: cancel remaining calls after first failure and raise it from map
+        progress: called with (completed, submitted) numbers of calls each time a call completes
+
+    Example:
+        >>> with session.batch(max_workers=16) as batch:
+        ...     futures = [batch.submit(session.api.devices.get_device_details, uuid) for uuid in uuids]
+        >>> for result in session.map(session.api.devices.get_device_details, uuids):
+        ...     print(result.item, result.value if result.ok else result.error)
+    """
+
+    def __init__(
+        self,
+        session: ManagerSession,
+        max_workers: Optional[int] = None,
+        fail_fast: bool = False,
+        progress: Optional[BatchProgressCallback] = None,
+    ):
+        limit = max(1, session._limiter.limit)
+        self.max_workers = max_workers or min(DEFAULT_BATCH_WORKERS, limit)
+        self.fail_fast = fail_fast
+        self.progress = progress
+        self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="catalystwan-batch")
+        self._cancelled: Event = Event()
+        self._lock: Lock = Lock()
+        self._futures: List[Future] = []
+        self._counters: Dict[str, int] = {"submitted": 0, "succeeded": 0, "failed": 0, "cancelled": 0}
+
+    def submit(self, function: Callable[..., T], *args, **kwargs) -> Future[T]:
+        """Schedules call, returns future of its result"""
+        with self._lock:
+            self._counters["submitted"] += 1
+        return self._submit(function, args, kwargs)
+
+    def _submit(self, function: Callable[..., T], args: Tuple, kwargs: Dict[str, Any]) -> Future[T]:
+        future: Future[T]
+        if self._cancelled.is_set():
+            future = Future()
+            future.cancel()
+            future.set_running_or_notify_cancel()
+        else:
+            future = self._executor.submit(self._call, function, args, kwargs)
+        with self._lock:
+            self._futures.append(future)
+        future.add_done_callback(self._completed)
+        return future
+
+    def _call(self, function: Callable[..., T], args: Tuple, kwargs: Dict[str, Any]) -> T:
+        if self._cancelled.is_set():
+            raise CancelledError()
+        return function(*args, **kwargs)
+
+    def _completed(self, future: Future) -> None:
+        if future.cancelled() or isinstance(future.exception(), CancelledError):
+            outcome = "cancelled"
+        elif future.exception() is not None:
+            outcome = "failed"
+        else:
+            outcome = "succeeded"
+        with self._lock:
+            self._counters[outcome] += 1
+            done = self._counters["succeeded"] + self._counters["failed"] + self._counters["cancelled"]
+            submitted = self._counters["submitted"]
+        if outcome == "failed" and self.fail_fast:
+            self.cancel()
+        if self.progress is not None:
+            self.progress(done, submitted)
+
+    def map(self, function: Callable[[Any], T], items: Iterable[Any], ordered: bool = True) -> Iterator[BatchResult[T]]:
+        """Calls function for each item, yields results in order of items (or in order of completion)"""
+        items = list(items)
+        with self._lock:
+            # all items are counted upfront, so progress reports total number of calls
+            self._counters["submitted"] += len(items)
+        futures = {self._submit(function, (item,), {}): (index, item) for index, item in enumerate(items)}
+        for future in futures if ordered else as_completed(futures):
+            index, item = futures[future]
+            try:
+                result = BatchResult[T](index, item, value=future.result())
+            except BaseException as error:
+                if self.fail_fast and not isinstance(error, CancelledError):
+                    raise
+                result = BatchResult[T](index, item, error=error)
+            yield result
+
+    def cancel(self) -> None:
+        """Cancels calls which have not started yet, calls in progress are completed"""
+        self._cancelled.set()
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Snapshot of counters: 'submitted', 'succeeded', 'failed' and 'cancelled' calls"""
+        with self._lock:
+            return dict(self._counters)
+
+    def close(self, wait: bool = True) -> None:
+        """Waits for scheduled calls (or cancels them when 'wait' is False) and releases worker threads"""
+        if not wait:
+            self.cancel()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> Batch:
+        return self
+
+    def __exit__(self, exc_type, *args) -> None:
+        self.close(wait=exc_type is None)
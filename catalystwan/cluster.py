@@ -0,0 +1,221 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+import logging
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Lock, Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Mapping, Optional, Pattern, Sequence, Set
+from urllib.parse import urlparse, urlunparse
+
+from requests import RequestException, get
+
+from catalystwan import USER_AGENT
+
+if TYPE_CHECKING:
+    from catalystwan.session import ManagerSession
+
+BALANCED_METHODS = {"GET", "HEAD"}
+PINNED_PATHS: Sequence[str] = (r"/device/action/status", r"/client/", r"/clusterManagement/", r"/tenant/")
+EJECT_STATUS_CODES = {502, 503}
+
+logger = logging.getLogger(__name__)
+
+
+def node_url(address: str, primary_url: str) -> str:
+    """Returns base url of cluster node with given address, using scheme and port of the primary node"""
+    if "://" in address:
+        return address.rstrip("/")
+    primary = urlparse(primary_url)
+    host = f"[{address}]" if ":" in address else address
+    netloc = f"{host}:{primary.port}" if primary.port else host
+    return urlunparse((primary.scheme or "https", netloc, "", None, None, None))
+
+
+@dataclass
+class ClusterNode:
+    base_url: str
+    healthy: bool = True
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+
+
+class ClusterBalancer:
+    """Spreads read requests of ManagerSession across vManage cluster nodes.
+
+    GET and HEAD requests are sent to the healthy node (primary included) with least outstanding requests.
+    Mutating requests, requests matching 'pinned_paths' (task status polling, client info, cluster management)
+    and all requests during login or restart are sent to the primary node, which is session 'base_url'.
+
+    Node is ejected when request sent to it fails with connection error, timeout or 502/503 status
+    (failed request is repeated according to session retry policy). Nodes are probed in background
+    every 'health_check_interval' seconds, ejected nodes are restored after successful probe.
+
+    Args:
+        nodes: base urls or addresses of secondary nodes (see discover to find them using cluster management API)
+        pinned_paths: url path regex patterns of requests always sent to primary node
+        health_check_interval: seconds between node probes (None - nodes are probed only by check_health)
+        timeout: probe timeout in seconds
+        verify: verify SSL certificate of probed nodes
+
+    Example:
+        >>> session = create_manager_session(url=url, username=username, password=password)
+        >>> session.cluster_balancer = ClusterBalancer()
+        >>> session.cluster_balancer.discover(session)
+        ['https://10.0.1.201:8443', 'https://10.0.1.202:8443']
+    """
+
+    def __init__(
+        self,
+        nodes: Optional[Iterable[str]] = None,
+        pinned_paths: Sequence[str] = PINNED_PATHS,
+        health_check_interval: Optional[float] = 60.0,
+        timeout: float = 5.0,
+        verify: bool = False,
+    ):
+        self.pinned_paths: List[Pattern[str]] = [re.compile(pattern) for pattern in pinned_paths]
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+        self.verify = verify
+        self._addresses: List[str] = list(nodes or [])
+        self._nodes: Dict[str, ClusterNode] = {}
+        self._lock: Lock = Lock()
+        self._checked: float = monotonic()
+        self._checking: bool = False
+
+    def discover(self, session: ManagerSession, management_addresses: Optional[Mapping[str, str]] = None) -> List[str]:
+        """Finds cluster nodes with running application server using cluster management API of the session.
+
+        Cluster management API identifies nodes by system-ip and UUID and reports their cluster link address
+        (deviceIP), which is usually not reachable by API clients. Nodes are reached using management address
+        given for their system-ip or UUID, cluster link address is used only for nodes missing in the mapping.
+        Primary node (session base_url) is recognized by its management address and skipped by its system-ip and UUID.
+
+        Args:
+            session: logged in session connected to the primary node
+            management_addresses: maps system-ip or UUID of cluster nodes to their management addresses (or base urls)
+
+        Returns:
+            List[str]: base urls of discovered secondary nodes
+        """
+        addresses = management_addresses or {}
+        statuses = session.endpoints.cluster_management.health_status_info()
+        nodes: Dict[str, str] = {}
+        primary: Set[str] = set()
+        for status in statuses:
+            identity = status.system_ip or status.uuid or status.device_ip
+            address = addresses.get(status.system_ip or "") or addresses.get(status.uuid or "") or status.device_ip
+            url = node_url(address, session.base_url)
+            if url == session.base_url:
+                primary.add(identity)
+            elif status.application_server:
+                nodes.setdefault(identity, url)
+        self.update([url for identity, url in nodes.items() if identity not in primary], session.base_url)
+        return [url for url in self._nodes if url != session.base_url]
+
+    def update(self, addresses: Iterable[str], primary_url: str) -> None:
+        """Replaces set of secondary nodes, counters of nodes already known are kept"""
+        with self._lock:
+            self._addresses = list(addresses)
+            self._sync_nodes(primary_url)
+
+    def _sync_nodes(self, primary_url: str) -> None:
+        urls = [primary_url, *(node_url(address, primary_url) for address in self._addresses)]
+        self._nodes = {url: self._nodes.get(url) or ClusterNode(url) for url in urls}
+
+    def select(self, primary_url: str, method: str, url: str) -> str:
+        """Returns base url of node which should receive request with given method and url path"""
+        if method.upper() not in BALANCED_METHODS or any(pattern.search(url) for pattern in self.pinned_paths):
+            return self._pick(primary_url, primary_url)
+        self._schedule_health_check()
+        return self._pick(primary_url, None)
+
+    def _pick(self, primary_url: str, base_url: Optional[str]) -> str:
+        with self._lock:
+            if primary_url not in self._nodes:
+                self._sync_nodes(primary_url)
+            if base_url is None:
+                # least outstanding requests, ties resolved by least total requests
+                node = min(
+                    (node for node in self._nodes.values() if node.healthy),
+                    key=lambda node: (node.outstanding, node.requests),
+                )
+            else:
+                node = self._nodes[base_url]
+            node.requests += 1
+            return node.base_url
+
+    @contextmanager
+    def track(self, base_url: str) -> Iterator[None]:
+        """Counts request to the node as outstanding within the context"""
+        node = self._nodes.get(base_url)
+        if node is None:
+            yield
+            return
+        with self._lock:
+            node.outstanding += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                node.outstanding -= 1
+
+    def eject(self, base_url: str, primary_url: str, reason: str) -> None:
+        """Excludes node from balancing until successful health check, primary node is never ejected"""
+        if base_url == primary_url or (node := self._nodes.get(base_url)) is None:
+            return
+        with self._lock:
+            node.failures += 1
+            if node.healthy:
+                node.healthy = False
+                logger.warning(f"Cluster node {base_url} ejected, reason: {reason}")
+
+    def probe(self, base_url: str) -> bool:
+        """Checks if node reports server ready (request does not need authentication)"""
+        try:
+            response = get(
+                f"{base_url}/dataservice/client/server/ready",
+                timeout=self.timeout,
+                verify=self.verify,
+                headers={"User-Agent": USER_AGENT},
+            )
+            return response.status_code == 200 and response.json().get("isServerReady") is True
+        except (RequestException, ValueError):
+            return False
+
+    def check_health(self) -> Dict[str, bool]:
+        """Probes secondary nodes, ejects failing nodes and restores recovered ones. Returns health per node"""
+        try:
+            with self._lock:
+                urls = list(self._nodes)[1:]
+            health = {url: self.probe(url) for url in urls}
+            with self._lock:
+                for url, healthy in health.items():
+                    if (node := self._nodes.get(url)) is not None and node.healthy != healthy:
+                        state = "restored" if healthy else "ejected, reason: health check"
+                        logger.warning(f"Cluster node {url} {state}")
+                        node.healthy = healthy
+            return health
+        finally:
+            self._checked = monotonic()
+            self._checking = False
+
+    def _schedule_health_check(self) -> None:
+        interval = self.health_check_interval
+        if interval is None or self._checking or monotonic() - self._checked < interval:
+            return
+        with self._lock:
+            if self._checking:
+                return
+            self._checking = True
+        Thread(target=self.check_health, name="cluster-health-check", daemon=True).start()
+
+    @property
+    def nodes(self) -> List[ClusterNode]:
+        """Snapshot of known nodes, primary first"""
+        with self._lock:
+            return [ClusterNode(**vars(node)) for node in self._nodes.values()]
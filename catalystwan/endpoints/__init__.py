@@ -32,18 +32,24 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import abc
 from dataclasses import dataclass, fields
 from enum import Enum
-from inspect import _empty, isclass, signature
+from inspect import _empty, isawaitable, isclass, signature
 from io import BufferedReader
+from itertools import chain
 from string import Formatter
+from time import perf_counter
 from typing import (
     Any,
+    Awaitable,
     BinaryIO,
+    Callable,
     ClassVar,
     Dict,
     Final,
     Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
@@ -54,25 +60,37 @@ from typing import (
     Tuple,
     TypeVar,
     Union,
+    cast,
     runtime_checkable,
 )
 from uuid import UUID
 
 from packaging.specifiers import SpecifierSet  # type: ignore
 from packaging.version import Version  # type: ignore
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from typing_extensions import Annotated, get_args, get_origin
 
-from catalystwan.abstractions import APIEndpointClient, APIEndpointClientResponse
+from catalystwan.abstractions import APIEndpointClient, APIEndpointClientResponse, AsyncAPIEndpointClient
 from catalystwan.exceptions import APIEndpointError, APIRequestPayloadTypeError, APIVersionError, APIViewError
+from catalystwan.metrics import current_endpoint
+from catalystwan.pagination import Page, PageInfo, Pagination, iter_pages
+from catalystwan.projection import projected_columns, projection
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.session_type import SessionType
+from catalystwan.validation import response_validation
 
 BASE_PATH: Final[str] = "/dataservice"
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
 
+class StreamPayloadType(Protocol):
+    """File-like request body read in chunks while sending"""
+
+    def read(self, size: int = -1) -> bytes:
+        ...
+
+
 @runtime_checkable
 class CustomPayloadType(Protocol):
     def prepared(self) -> PreparedPayload:
@@ -82,8 +100,9 @@ class CustomPayloadType(Protocol):
 JSON = Union[str, int, float, bool, None, Dict[str, "JSON"], List["JSON"]]
 ModelPayloadType = Union[BaseModel, Sequence[BaseModel]]
 PayloadType = Union[None, JSON, str, bytes, dict, ModelPayloadType, CustomPayloadType]
-ReturnType = Union[None, JSON, bytes, str, dict, BaseModel, DataSequence[BaseModel]]
+ReturnType = Union[None, JSON, bytes, str, dict, BaseModel, DataSequence[BaseModel], Iterator[BaseModel]]
 RequestParamsType = Union[Dict[str, str], BaseModel]
+ResponseParser = Callable[["APIEndpoints", APIEndpointClientResponse], Any]
 
 
 @dataclass
@@ -128,7 +147,7 @@ class APIEndpointRequestMeta:
 class PreparedPayload:
     """Holds data prepared for sending in request"""
 
-    data: Union[Dict, str, bytes, None] = None
+    data: Union[Dict, str, bytes, StreamPayloadType, None] = None
     headers: Optional[Mapping[str, Any]] = None
     files: Optional[Dict[str, Tuple[str, BufferedReader]]] = None
 
@@ -145,14 +164,49 @@ def dict_values_to_str(field_names: Set[str], kwargs: Dict[str, Any]) -> Dict[st
     # this is to keep compatiblity and have seme behavior for (str, Enum) mixin after 3.11 for url formatting
     result: Dict[str, str] = {}
     for field_name in field_names:
-        field_value = kwargs.get(field_name)
-        if isinstance(field_value, Enum):
-            result[field_name] = str(field_value.value)
-        else:
-            result[field_name] = str(field_value)
+        result[field_name] = url_value_to_str(kwargs.get(field_name))
     return result
 
 
+def url_value_to_str(value: Any) -> str:
+    if type(value) is str:
+        return value
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+def compile_url(url: str) -> Callable[[Mapping[str, Any]], str]:
+    """Compiles url template to function formatting it from decorated method arguments.
+    Templates with conversion or format spec in replacement fields fall back to str.format_map"""
+    parsed = list(Formatter().parse(url))
+    if any(conversion or format_spec for _, field_name, format_spec, conversion in parsed if field_name is not None):
+        field_names = {field_name for _, field_name, _, _ in parsed if field_name is not None}
+        return lambda kwargs: url.format_map(dict_values_to_str(field_names, dict(kwargs)))
+    fields: List[Tuple[str, str]] = []  # (preceding literal text, field name)
+    suffix = ""
+    for literal, field_name, _, _ in parsed:
+        suffix += literal
+        if field_name is not None:
+            fields.append((suffix, field_name))
+            suffix = ""
+    if not fields:
+        return lambda kwargs: suffix
+    if len(fields) == 1:
+        prefix, field_name = fields[0]
+        return lambda kwargs: prefix + url_value_to_str(kwargs.get(field_name)) + suffix
+
+    def format_url(kwargs: Mapping[str, Any]) -> str:
+        parts = []
+        for literal, field_name in fields:
+            parts.append(literal)
+            parts.append(url_value_to_str(kwargs.get(field_name)))
+        parts.append(suffix)
+        return "".join(parts)
+
+    return format_url
+
+
 class APIEndpoints:
     """
     Class to be used as base for all API endpoints.
@@ -200,10 +254,16 @@ class APIEndpoints:
             return params.model_dump(exclude_none=True, by_alias=True)
         return params
 
-    def __init__(self, client: APIEndpointClient):
+    def __init__(self, client: Union[APIEndpointClient, AsyncAPIEndpointClient]):
         self._client = client
         self._basepath = BASE_PATH
 
+    def check_compatibility(self, method: Callable) -> None:
+        """Applies view and version restrictions declared for decorated method of this instance
+        to request sent without calling it (eg. file streamed to disk with session.get_file)"""
+        for check in APIEndpointsDecorator.checks_lookup.get(getattr(method, "_ofunc", method).__qualname__, []):
+            check(self)
+
     def _request(
         self,
         method: str,
@@ -212,14 +272,20 @@ class APIEndpoints:
         params: Optional[RequestParamsType] = None,
         force_json_payload: bool = False,
         **kwargs,
-    ) -> APIEndpointClientResponse:
-        """Prepares and sends request using client protocol"""
+    ) -> Union[APIEndpointClientResponse, Awaitable[APIEndpointClientResponse]]:
+        """Prepares and sends request using client protocol (returns awaitable for asynchronous client)"""
         _kwargs = dict(kwargs)
         if payload is not None:
             _kwargs.update(self._prepare_payload(payload, force_json_payload).asdict())
         if params is not None:
             _kwargs.update({"params": self._prepare_params(params)})
-        return self._client.request(method, self._basepath + url, **_kwargs)
+        return self._send(method, url, **_kwargs)
+
+    def _send(
+        self, method: str, url: str, **kwargs
+    ) -> Union[APIEndpointClientResponse, Awaitable[APIEndpointClientResponse]]:
+        """Sends already prepared request for url relative to base path, used by all decorated methods"""
+        return self._client.request(method, self._basepath + url, **kwargs)
 
     @property
     def _api_version(self) -> Optional[Version]:
@@ -230,7 +296,42 @@ class APIEndpoints:
         return self._client.session_type
 
 
+def prepare_payload(payload: PayloadType) -> Dict[str, Any]:
+    """Prepares request keyword arguments (data, headers, files) for payload of any supported type"""
+    return APIEndpoints._prepare_payload(payload).asdict()
+
+
+def prepare_json_payload(payload: PayloadType) -> Dict[str, Any]:
+    return {"data": json.dumps(payload), "headers": {"content-type": "application/json"}}
+
+
+def prepare_model_payload(payload: PayloadType) -> Dict[str, Any]:
+    if isinstance(payload, BaseModel):
+        return {
+            "data": payload.model_dump_json(exclude_none=True, by_alias=True),
+            "headers": {"content-type": "application/json"},
+        }
+    return prepare_payload(payload)
+
+
+def prepare_model_sequence_payload(payload: PayloadType) -> Dict[str, Any]:
+    if isinstance(payload, (list, tuple)):
+        items = [item.model_dump(exclude_none=True, by_alias=True) for item in payload]  # type: ignore[union-attr]
+        return {"data": json.dumps(items), "headers": {"content-type": "application/json"}}
+    return prepare_payload(payload)
+
+
+def prepare_raw_payload(payload: PayloadType) -> Dict[str, Any]:
+    if isinstance(payload, (str, bytes)):
+        return {"data": payload} if payload else {}
+    return prepare_payload(payload)
+
+
 class APIEndpointsDecorator:
+    checks_lookup: ClassVar[
+        Dict[str, List[Callable[[APIEndpoints], None]]]
+    ] = {}  # maps decorated method instance to it's view and version checks (see APIEndpoints.check_compatibility)
+
     @classmethod
     def get_check_instance(cls, _self, *args, **kwargs) -> APIEndpoints:
         """Gets wrapped function instance (first argument)"""
@@ -252,23 +353,47 @@ class versions(APIEndpointsDecorator):
     def __init__(self, supported_versions: str, raises: bool = False):
         self.supported_versions = SpecifierSet(supported_versions)
         self.raises = raises
+        # SpecifierSet containment is resolved once per version, result for last seen version object is kept
+        # separately as session holds the same Version instance (which is slow to hash) for all calls
+        self.compatibility: Dict[Version, bool] = {}
+        self.resolved: Tuple[Optional[Version], bool] = (None, True)
+
+    def is_supported(self, current: Version) -> bool:
+        if (supported := self.compatibility.get(current)) is None:
+            supported = self.compatibility[current] = current in self.supported_versions
+        self.resolved = (current, supported)
+        return supported
+
+    def report(self, func, current: Version) -> None:
+        supported = self.supported_versions
+        if self.raises:
+            raise APIVersionError(func, supported, current)
+        else:
+            logger.warning(
+                f"vManage runs: {current} but {func.__qualname__} only supported for API versions: {supported}"
+            )
 
     def __call__(self, func):
         original_func = getattr(func, "_ofunc", func)  # grab original function
         self.versions_lookup[original_func.__qualname__] = self.supported_versions
 
+        def check(_self: APIEndpoints) -> None:
+            if (current := _self._api_version) and not self.is_supported(current):
+                self.report(func, current)
+
+        self.checks_lookup.setdefault(original_func.__qualname__, []).append(check)
+
         def wrapper(*args, **kwargs):
             """Executes each time decorated method is called"""
-            _self = self.get_check_instance(*args, **kwargs)  # _self refers to APIEndpoints instance
+            _self = args[0] if args else None  # _self refers to APIEndpoints instance
+            if not isinstance(_self, APIEndpoints):
+                _self = self.get_check_instance(*args, **kwargs)
             current = _self._api_version
-            supported = self.supported_versions
-            if current and current not in supported:
-                if self.raises:
-                    raise APIVersionError(func, supported, current)
-                else:
-                    logger.warning(
-                        f"vManage runs: {current} but {func.__qualname__} only supported for API versions: {supported}"
-                    )
+            resolved_version, supported = self.resolved
+            if current is not resolved_version and current:
+                supported = self.is_supported(current)
+            if current and not supported:
+                self.report(func, current)
             return func(*args, **kwargs)
 
         wrapper._ofunc = original_func  # provide original function to next decorator in chain
@@ -291,11 +416,10 @@ class view(APIEndpointsDecorator):
         original_func = getattr(func, "_ofunc", func)  # grab original function
         self.view_lookup[original_func.__qualname__] = self.allowed_session_types
 
-        def wrapper(*args, **kwargs):
-            """Executes each time decorated method is called"""
-            _self = self.get_check_instance(*args, **kwargs)  # _self refers to APIEndpoints instance
+        allowed = self.allowed_session_types
+
+        def check(_self: APIEndpoints) -> None:
             current = _self._session_type
-            allowed = self.allowed_session_types
             if current and current not in allowed:
                 if self.raises:
                     raise APIViewError(func, allowed, current)
@@ -303,6 +427,17 @@ class view(APIEndpointsDecorator):
                     logger.warning(
                         f"Current view is: {current} but {func.__qualname__} only allowed for views: {allowed}"
                     )
+
+        self.checks_lookup.setdefault(original_func.__qualname__, []).append(check)
+
+        def wrapper(*args, **kwargs):
+            """Executes each time decorated method is called"""
+            _self = args[0] if args else None  # _self refers to APIEndpoints instance
+            if not isinstance(_self, APIEndpoints):
+                _self = self.get_check_instance(*args, **kwargs)
+            current = _self._session_type
+            if current and current not in allowed:
+                check(_self)
             return func(*args, **kwargs)
 
         wrapper._ofunc = original_func  # provide original function to next decorator in chain
@@ -331,6 +466,19 @@ class request(APIEndpointsDecorator):
         Return Type:
 
             supports types defined in: catalystwan.endpoints.ReturnType
+            Iterator[BaseModel] streams response, items are decoded and validated one by one while iterating
+            (for endpoints declared with pagination items are validated page by page)
+
+        Pagination:
+
+            optional catalystwan.pagination.Pagination declaring scroll-style paged endpoint,
+            all pages are requested by single call of decorated method
+
+        Projection:
+
+            methods returning BaseModel (or sequence/iterator of them) accept "fields" keyword argument,
+            response is parsed into lean model containing only given fields (see catalystwan.projection),
+            for endpoints selecting returned columns with query parameter its name is given as columns_param
 
     Raises:
         APIEndpointError: when decorated method has unsupported parameters or response type
@@ -341,7 +489,15 @@ class request(APIEndpointsDecorator):
         Dict[str, APIEndpointRequestMeta]
     ] = {}  # maps decorated method instance to it's meta information
 
-    def __init__(self, http_method: str, url: str, resp_json_key: Optional[str] = None, **kwargs):
+    def __init__(
+        self,
+        http_method: str,
+        url: str,
+        resp_json_key: Optional[str] = None,
+        pagination: Optional[Pagination] = None,
+        columns_param: Optional[str] = None,
+        **kwargs,
+    ):
         self.http_method = http_method
         formatter = Formatter()
         url_field_names = {item[1] for item in formatter.parse(url) if item[1] is not None}
@@ -350,6 +506,10 @@ class request(APIEndpointsDecorator):
         self.url = url
         self.url_field_names = url_field_names
         self.resp_json_key = resp_json_key
+        self.pagination = pagination
+        self.columns_param = columns_param
+        self.projections: Dict[Tuple[str, ...], Tuple[ResponseParser, type]] = {}
+        self.qualname = ""  # qualified name of decorated method
         self.return_spec = TypeSpecifier.not_present()
         self.payload_spec = TypeSpecifier.not_present()
         self.kwargs = kwargs
@@ -374,6 +534,10 @@ class request(APIEndpointsDecorator):
                 "APIEndpoint methods decorated with @request must specify return type, "
                 "use None annotation if function does not return any value"
             )
+        if self.pagination is not None:
+            return self.specify_paged_return_type()
+        if get_origin(annotation) is abc.Iterator:
+            return self.specify_paged_return_type()
         if (type_origin := get_origin(annotation)) and isclass(type_origin) and issubclass(type_origin, DataSequence):
             if (
                 (type_args := get_args(annotation))
@@ -392,6 +556,28 @@ class request(APIEndpointsDecorator):
                 raise APIEndpointError(f"Expected: {ReturnType} but return type {annotation}")
         raise APIEndpointError(f"Expected: {ReturnType} but return type {annotation}")
 
+    def specify_paged_return_type(self) -> TypeSpecifier:
+        """Specifies return type of endpoint declared with pagination (Iterator or DataSequence of models)
+        or streaming endpoint (Iterator of models)
+
+        Raises:
+            APIEndpointError: when signature contains unexpected return annotation
+
+        Returns:
+            TypeSpecifier: Specification of return type
+        """
+        annotation = self.sig.return_annotation
+        type_origin = get_origin(annotation)
+        type_args = get_args(annotation)
+        if (
+            type_origin in (abc.Iterator, DataSequence)
+            and len(type_args) == 1
+            and isclass(type_args[0])
+            and issubclass(type_args[0], BaseModel)
+        ):
+            return TypeSpecifier(True, type_origin, type_args[0])
+        raise APIEndpointError(f"Expected: Iterator[BaseModel] or DataSequence[BaseModel] but return type {annotation}")
+
     def specify_payload_type(self) -> TypeSpecifier:
         """Specifies payload type based on decorated method signature annotations.
         Does basic checking of annotated types for 'payload' so problems can be detected early.
@@ -513,22 +699,161 @@ class request(APIEndpointsDecorator):
 
         Returns: Dict[str, Any]: all passed args as keyword arguments (excluding "self")
         """
-        all_args_names = [key for key in self.sig.parameters.keys()]
         all_args_dict = dict(self.defaults)
-        all_args_dict.update(dict(zip(all_args_names, positional_args)))
+        all_args_dict.update(zip(self.arg_names, positional_args))
         all_args_dict.update(keyword_args)
         all_args_dict.pop("self", None)
         return all_args_dict
 
+    def specify_parse_stage(self) -> Optional[str]:
+        """Returns name of response parsing stage reported to metrics: 'validation' of pydantic models,
+        'decode' of JSON or None when response is returned without parsing"""
+        if not self.return_spec.present:
+            return None
+        if self.return_spec.is_json:
+            return "decode"
+        payload_type = self.return_spec.payload_type
+        if self.return_spec.sequence_type is abc.Iterator and self.pagination is None:
+            return None  # streamed items are validated while iterating, after decorated method returned
+        if isclass(payload_type) and issubclass(payload_type, BaseModel):
+            return "validation"
+        if isclass(payload_type) and issubclass(payload_type, dict):
+            return "decode"
+        return None
+
+    def specify_payload_handler(self) -> Callable[[PayloadType], Dict[str, Any]]:
+        """Selects function preparing request keyword arguments from payload based on payload annotation.
+        Payload of other type than annotated is prepared by checking its type like APIEndpoints._prepare_payload"""
+        if self.payload_spec.is_json:
+            return prepare_json_payload
+        if self.payload_spec.payload_union_model_types:
+            return prepare_model_payload
+        payload_type = self.payload_spec.payload_type
+        if isclass(payload_type) and issubclass(payload_type, BaseModel):
+            return prepare_model_sequence_payload if self.payload_spec.sequence_type else prepare_model_payload
+        if isclass(payload_type) and issubclass(payload_type, (str, bytes)):
+            return prepare_raw_payload
+        return prepare_payload
+
+    def specify_response_parser(self, payload_type: Optional[type] = None) -> ResponseParser:
+        """Selects function converting received response to type specified by return annotation
+        (payload type can be replaced by projection of annotated model)"""
+        resp_json_key = self.resp_json_key
+        payload_type = payload_type or self.return_spec.payload_type
+        qualname = self.qualname
+        if self.return_spec.is_json:
+            if resp_json_key is None:
+                return lambda _self, response: response.json()
+
+            def parse_json_key(_self: APIEndpoints, response: APIEndpointClientResponse) -> Any:
+                full_json = response.json()
+                if isinstance(full_json, dict):
+                    return full_json.get(resp_json_key)
+                raise TypeError(f"Expected dictionary as json payload but found: {type(full_json)}")
+
+            return parse_json_key
+        if not self.return_spec.present or payload_type is None:
+            return lambda _self, response: None
+        if issubclass(payload_type, BaseModel):
+            model: Any = payload_type
+            if self.return_spec.sequence_type is abc.Iterator:
+                return lambda _self, response: response.dataiter(
+                    model, resp_json_key, validate=response_validation(_self._client, qualname)
+                )
+            if self.return_spec.sequence_type == DataSequence:
+                return lambda _self, response: response.dataseq(
+                    cls=model, sourcekey=resp_json_key, validate=response_validation(_self._client, qualname)
+                )
+            return lambda _self, response: response.dataobj(
+                model, resp_json_key, validate=response_validation(_self._client, qualname)
+            )
+        if issubclass(payload_type, str):
+            return lambda _self, response: response.text
+        if issubclass(payload_type, bytes):
+            return lambda _self, response: response.content
+        if issubclass(payload_type, dict):
+            return lambda _self, response: response.json()
+        return lambda _self, response: None
+
+    def specify_projection(self, fields: Sequence[str]) -> Tuple[ResponseParser, type]:
+        """Returns response parser and lean model for given fields of returned model (cached per fields)"""
+        key = tuple(fields)
+        if (specified := self.projections.get(key)) is None:
+            payload_type = self.return_spec.payload_type
+            if self.return_spec.is_json or not (isclass(payload_type) and issubclass(payload_type, BaseModel)):
+                raise APIEndpointError(f"{self.qualname} does not return model, fields cannot be selected")
+            try:
+                model = projection(payload_type, key)
+            except ValueError as error:
+                raise APIEndpointError(f"{self.qualname}: {error}") from error
+            specified = self.projections.setdefault(key, (self.specify_response_parser(model), model))
+        return specified
+
+    def parse_response(self, _self: APIEndpoints, response: APIEndpointClientResponse) -> Any:
+        """Converts received response to type specified by decorated method return annotation"""
+        return self.response_parser(_self, response)
+
+    def request_pages(
+        self, _self: APIEndpoints, qualname: str, url: str, request_kwargs: Dict[str, Any], model: type
+    ) -> Iterator[DataSequence]:
+        """Requests first page and returns iterator over pages (next pages are requested while iterating)"""
+        pagination = cast(Pagination, self.pagination)
+        params = dict(request_kwargs.pop("params", None) or {})
+        if pagination.size_param is not None:
+            params.setdefault(pagination.size_param, pagination.page_size)
+
+        def fetch(scroll_id: Optional[str] = None) -> Page:
+            page_params = dict(params, **{pagination.scroll_param: scroll_id}) if scroll_id else params
+            token = current_endpoint.set(qualname)  # also in prefetching thread
+            try:
+                received = _self._send(self.http_method, url, params=page_params, **request_kwargs)
+            finally:
+                current_endpoint.reset(token)
+            if isawaitable(received):
+                raise APIEndpointError(f"{qualname} is paginated and can only be used with synchronous client")
+            response = cast(APIEndpointClientResponse, received)
+            metrics = getattr(_self._client, "metrics", None)
+            begin = perf_counter()
+            try:
+                items: DataSequence = response.dataseq(
+                    model, self.resp_json_key, validate=response_validation(_self._client, qualname)
+                )
+            except ValidationError as error:
+                if metrics is not None:
+                    metrics.record_validation_failure(qualname, error.error_count())
+                raise
+            try:
+                info = response.dataobj(PageInfo, pagination.page_info_key, validate=True)
+            except (ValidationError, AttributeError):
+                info = PageInfo()  # page information not found (or payload is not an object), treated as last page
+            if metrics is not None:
+                metrics.record_parse(qualname, "validation", perf_counter() - begin)
+            return Page(items, info)
+
+        return iter_pages(fetch(), fetch, prefetch=pagination.prefetch)
+
+    async def parse_response_async(
+        self,
+        _self: APIEndpoints,
+        response: Awaitable[APIEndpointClientResponse],
+        parse: Optional[ResponseParser] = None,
+    ) -> Any:
+        """Awaits response from asynchronous client and converts it like parse_response (or with given parser)"""
+        return (parse or self.response_parser)(_self, await response)
+
     def __call__(self, func):
         original_func = getattr(func, "_ofunc", func)  # grab original function
         self.sig = signature(original_func)
+        self.arg_names = tuple(self.sig.parameters.keys())
         self.defaults = {
             key: value.default for (key, value) in self.sig.parameters.items() if value.default is not _empty
         }
         self.return_spec = self.specify_return_type()
         self.payload_spec = self.specify_payload_type()
         self.check_params()
+        self.qualname = qualname = original_func.__qualname__
+        self.parse_stage = self.specify_parse_stage()
+        self.response_parser = self.specify_response_parser()
         self.request_lookup[original_func.__qualname__] = APIEndpointRequestMeta(
             func=original_func,
             http_request=f"{self.http_method} {self.url}",
@@ -536,50 +861,63 @@ class request(APIEndpointsDecorator):
             return_spec=self.return_spec,
         )
 
+        # everything not depending on call arguments is resolved here, so wrapper does only per call work
+        http_method = self.http_method
+        arg_names = self.arg_names
+        defaults = self.defaults
+        format_url = compile_url(self.url)
+        prepare = self.specify_payload_handler()
+        parse = self.response_parser
+        parse_stage = self.parse_stage
+        paged = self.return_spec.sequence_type if self.pagination is not None else None
+        model = self.return_spec.payload_type
+        columns_param = self.columns_param
+        streamed = self.return_spec.sequence_type is abc.Iterator and self.pagination is None
+        send_kwargs = {"stream": True, **self.kwargs} if streamed else self.kwargs
+
         def wrapper(*args, **kwargs):
             """Executes each time decorated method is called"""
-            _self = self.get_check_instance(*args, **kwargs)  # _self refers to APIEndpoints instance
-            _kwargs = self.merge_args(args, kwargs)
-            payload = _kwargs.get("payload")
-            params = _kwargs.get("params")
-            url_kwargs = dict_values_to_str(self.url_field_names, _kwargs)
-            formatted_url = self.url.format_map(url_kwargs)
-            response = _self._request(
-                self.http_method,
-                formatted_url,
-                payload=payload,
-                force_json_payload=self.payload_spec.is_json,
-                params=params,
-                **self.kwargs,
-            )
-            if self.return_spec.present:
-                if self.return_spec.is_json:
-                    full_json = response.json()
-                    if self.resp_json_key is not None:
-                        if isinstance(full_json, dict):
-                            return full_json.get(self.resp_json_key)
-                        else:
-                            raise TypeError(f"Expected dictionary as json payload but found: {type(full_json)}")
-                    return full_json
-                if self.return_spec.payload_type is None:
-                    pass
-                elif issubclass(self.return_spec.payload_type, BaseModel):
-                    if self.return_spec.sequence_type == DataSequence:
-                        return response.dataseq(
-                            cls=self.return_spec.payload_type,
-                            sourcekey=self.resp_json_key,
-                            validate=_self._client.validate_responses,
-                        )
-                    else:
-                        return response.dataobj(
-                            self.return_spec.payload_type, self.resp_json_key, validate=_self._client.validate_responses
-                        )
-                elif issubclass(self.return_spec.payload_type, str):
-                    return response.text
-                elif issubclass(self.return_spec.payload_type, bytes):
-                    return response.content
-                elif issubclass(self.return_spec.payload_type, dict):
-                    return response.json()
+            _self = args[0] if args else None  # _self refers to APIEndpoints instance
+            if not isinstance(_self, APIEndpoints):
+                _self = self.get_check_instance(*args, **kwargs)
+            _kwargs = dict(defaults)  # same as merge_args but "self" is not removed as it is never looked up
+            _kwargs.update(zip(arg_names, args))
+            _kwargs.update(kwargs)
+            request_kwargs = dict(send_kwargs)
+            if (payload := _kwargs.get("payload")) is not None:
+                request_kwargs.update(prepare(payload))
+            if (params := _kwargs.get("params")) is not None:
+                request_kwargs["params"] = _self._prepare_params(params)
+            _parse, _model = parse, model
+            if "fields" in kwargs and "fields" not in arg_names and (fields := kwargs["fields"]) is not None:
+                _parse, _model = self.specify_projection(fields)
+                if columns_param is not None:
+                    columns = ",".join(projected_columns(self.return_spec.payload_type, fields))
+                    request_kwargs["params"] = {**(request_kwargs.get("params") or {}), columns_param: columns}
+            url = format_url(_kwargs)
+            if paged is not None:
+                pages = self.request_pages(_self, qualname, url, request_kwargs, _model)
+                if paged is DataSequence:
+                    return DataSequence(_model, chain.from_iterable(pages))
+                return chain.from_iterable(pages)
+            token = current_endpoint.set(qualname)  # request metrics are attributed to decorated method
+            try:
+                response = _self._send(http_method, url, **request_kwargs)
+            finally:
+                current_endpoint.reset(token)
+            if isawaitable(response):
+                # asynchronous client: return awaitable which parses response when awaited
+                return self.parse_response_async(_self, response, _parse)
+            if parse_stage is None or (metrics := getattr(_self._client, "metrics", None)) is None:
+                return _parse(_self, response)
+            begin = perf_counter()
+            try:
+                return _parse(_self, response)
+            except ValidationError as error:
+                metrics.record_validation_failure(qualname, error.error_count())
+                raise
+            finally:
+                metrics.record_parse(qualname, parse_stage, perf_counter() - begin)
 
         wrapper._ofunc = original_func  # provide original function to next decorator in chain
         return wrapper
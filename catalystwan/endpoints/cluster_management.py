@@ -3,7 +3,7 @@
 # mypy: disable-error-code="empty-body"
 from typing import Literal, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 from catalystwan.endpoints import APIEndpoints, get
 from catalystwan.typed_list import DataSequence
@@ -24,6 +24,25 @@ class VManageDetails(BaseModel):
     status: str
 
 
+class VManageHealthStatus(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, extra="allow")
+    device_ip: str = Field(serialization_alias="deviceIP", validation_alias="deviceIP")
+    system_ip: Optional[str] = Field(default=None, serialization_alias="system-ip", validation_alias="system-ip")
+    uuid: Optional[str] = None
+    application_server: Optional[bool] = Field(
+        default=None, serialization_alias="application-server", validation_alias="application-server"
+    )
+    configuration_db: Optional[bool] = Field(
+        default=None, serialization_alias="configuration-db", validation_alias="configuration-db"
+    )
+    messaging_server: Optional[bool] = Field(
+        default=None, serialization_alias="messaging-server", validation_alias="messaging-server"
+    )
+    statistics_db: Optional[bool] = Field(
+        default=None, serialization_alias="statistics-db", validation_alias="statistics-db"
+    )
+
+
 class ClusterManagement(APIEndpoints):
     def add_or_update_user_credentials(self):
         # POST /clusterManagement/userCreds
@@ -77,8 +96,8 @@ class ClusterManagement(APIEndpoints):
         # GET /clusterManagement/health/details
         ...
 
-    def health_status_info(self):
-        # GET /clusterManagement/health/status
+    @get("/clusterManagement/health/status", "data")
+    def health_status_info(self) -> DataSequence[VManageHealthStatus]:
         ...
 
     def health_summary(self):
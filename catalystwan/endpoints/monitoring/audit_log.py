@@ -0,0 +1,27 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+# mypy: disable-error-code="empty-body"
+from typing import Any, Dict, Iterator, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from catalystwan.endpoints import APIEndpoints, post
+from catalystwan.pagination import Pagination
+
+
+class AuditLogQuery(BaseModel):
+    query: Dict[str, Any]
+
+
+class AuditLogEntry(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    logid: str
+    entry_time: int
+    logmessage: Optional[str] = None
+    tenant: Optional[str] = None
+
+
+class MonitoringAuditLog(APIEndpoints):
+    @post("/auditlog/page", "data", pagination=Pagination(page_size=5000))
+    def get_audit_logs(self, payload: AuditLogQuery) -> Iterator[AuditLogEntry]:
+        ...
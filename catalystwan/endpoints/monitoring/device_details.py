@@ -212,7 +212,7 @@ class MonitoringDeviceDetails(APIEndpoints):
         #  GET /device/models
         ...
 
-    @get("/device", "data")
+    @get("/device", "data", columns_param="columns")
     def list_all_devices(self) -> DataSequence[DeviceData]:
         #  GET /device
         ...
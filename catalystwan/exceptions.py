@@ -66,6 +66,12 @@ class ImageNotInRepositoryError(CatalystwanException):
     pass
 
 
+class ImageChecksumError(CatalystwanException):
+    """The exception that is thrown, if software image checksum does not match expected one"""
+
+    pass
+
+
 class EmptyVersionPayloadError(CatalystwanException):
     """Used when a version is not found in device available or current versions."""
 
@@ -178,6 +184,12 @@ class ManagerReadyTimeout(CatalystwanException):
     pass
 
 
+class DownloadChecksumError(CatalystwanException):
+    """Raised when checksum of downloaded file does not match expected one"""
+
+    pass
+
+
 class CatalystwanDeprecationWarning(DeprecationWarning):
     """Warning issued when using deprecated features or functionality in the Catalystwan SDK.
 
@@ -0,0 +1,283 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+OVERFLOW_ENDPOINT = "<other>"
+
+# qualified name of APIEndpoints method sending current request, set by @request decorator
+current_endpoint: ContextVar[Optional[str]] = ContextVar("current_endpoint", default=None)
+
+
+@dataclass
+class RequestSample:
+    """Single HTTP request attempt sent by ManagerSession"""
+
+    endpoint: str
+    method: str
+    status_code: Optional[int]
+    latency: float
+    limiter_wait: float
+    request_bytes: int
+    response_bytes: int
+    error: Optional[str] = None
+
+
+class MetricsSink:
+    """Receives measurements of ManagerSession requests. Base class discards everything.
+
+    Endpoint is qualified name of decorated APIEndpoints method (see request.request_lookup)
+    or "<METHOD> <url path>" for requests sent directly with session methods.
+    """
+
+    def record_request(self, sample: RequestSample) -> None:
+        """Called after each attempt of a request (response received or request failed)"""
+
+    def record_retries(self, endpoint: str, method: str, retries: int) -> None:
+        """Called when request needed more than one attempt"""
+
+    def record_parse(self, endpoint: str, stage: str, seconds: float) -> None:
+        """Called after response of APIEndpoints method is converted to return type.
+        Stage is 'decode' (JSON decoding) or 'validation' (pydantic models, includes decoding of raw bytes)
+        """
+
+    def record_validation_failure(self, endpoint: str, errors: int) -> None:
+        """Called when response of APIEndpoints method did not pass pydantic validation (errors - number of errors)"""
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds (Prometheus style, last bucket is +Inf)"""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        result, total = [], 0
+        for bound, count in zip((*self.buckets, float("inf")), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimates quantile as upper bound of the bucket containing it"""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"count": self.count, "sum": self.sum, "p50": self.quantile(0.5), "p99": self.quantile(0.99)}
+
+
+@dataclass
+class EndpointStats:
+    method: str = ""
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    validation_failures: int = 0
+    validation_errors: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    status_codes: Counter = field(default_factory=Counter)
+    latency: Histogram = field(default_factory=Histogram)
+    limiter_wait: Histogram = field(default_factory=Histogram)
+    parse: Dict[str, Histogram] = field(default_factory=dict)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "validation_failures": self.validation_failures,
+            "validation_errors": self.validation_errors,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "status_codes": dict(self.status_codes),
+            "latency": self.latency.snapshot(),
+            "limiter_wait": self.limiter_wait.snapshot(),
+            "parse": {stage: histogram.snapshot() for stage, histogram in self.parse.items()},
+        }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class InMemoryMetrics(MetricsSink):
+    """Aggregates measurements per endpoint in memory, provides snapshot and Prometheus text exposition.
+
+    Args:
+        max_endpoints: endpoints above this number are aggregated as '<other>' (limits cardinality of raw url paths)
+
+    Example:
+        >>> metrics = InMemoryMetrics()
+        >>> session = ManagerSession(base_url=url, auth=auth, metrics=metrics)
+        >>> ...
+        >>> metrics.snapshot()["DeviceStateEndpoints.get_devices"]["latency"]
+        {'count': 12, 'sum': 1.53, 'p50': 0.1, 'p99': 0.5}
+        >>> print(metrics.prometheus())
+    """
+
+    def __init__(self, max_endpoints: int = 512):
+        self.max_endpoints = max_endpoints
+        self._stats: Dict[str, EndpointStats] = {}
+        self._lock: Lock = Lock()
+
+    def _get(self, endpoint: str) -> EndpointStats:
+        if (stats := self._stats.get(endpoint)) is None:
+            if len(self._stats) >= self.max_endpoints:
+                endpoint = OVERFLOW_ENDPOINT
+            stats = self._stats.setdefault(endpoint, EndpointStats())
+        return stats
+
+    def record_request(self, sample: RequestSample) -> None:
+        with self._lock:
+            stats = self._get(sample.endpoint)
+            stats.method = stats.method or sample.method
+            stats.requests += 1
+            stats.request_bytes += sample.request_bytes
+            stats.response_bytes += sample.response_bytes
+            stats.latency.observe(sample.latency)
+            stats.limiter_wait.observe(sample.limiter_wait)
+            if sample.status_code is not None:
+                stats.status_codes[sample.status_code] += 1
+            if sample.error is not None or (sample.status_code or 0) >= 400:
+                stats.errors += 1
+
+    def record_retries(self, endpoint: str, method: str, retries: int) -> None:
+        with self._lock:
+            self._get(endpoint).retries += retries
+
+    def record_parse(self, endpoint: str, stage: str, seconds: float) -> None:
+        with self._lock:
+            self._get(endpoint).parse.setdefault(stage, Histogram()).observe(seconds)
+
+    def record_validation_failure(self, endpoint: str, errors: int) -> None:
+        with self._lock:
+            stats = self._get(endpoint)
+            stats.validation_failures += 1
+            stats.validation_errors += errors
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns statistics per endpoint"""
+        with self._lock:
+            return {endpoint: stats.snapshot() for endpoint, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def prometheus(self, prefix: str = "catalystwan") -> str:
+        """Renders metrics in Prometheus text exposition format"""
+        lines: List[str] = []
+
+        def histogram(name: str, labels: str, hist: Histogram) -> None:
+            for bound, total in hist.cumulative():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_{name}_bucket{{{labels},le="{le}"}} {total}')
+            lines.append(f"{prefix}_{name}_sum{{{labels}}} {hist.sum}")
+            lines.append(f"{prefix}_{name}_count{{{labels}}} {hist.count}")
+
+        with self._lock:
+            items = [(f'endpoint="{_escape(e)}",method="{s.method}"', s) for e, s in sorted(self._stats.items())]
+            lines.append(f"# TYPE {prefix}_requests_total counter")
+            for labels, stats in items:
+                for status, count in sorted(stats.status_codes.items()):
+                    lines.append(f'{prefix}_requests_total{{{labels},status="{status}"}} {count}')
+            for name, attribute in (
+                ("request_errors_total", "errors"),
+                ("request_retries_total", "retries"),
+                ("validation_failures_total", "validation_failures"),
+                ("validation_errors_total", "validation_errors"),
+                ("request_bytes_total", "request_bytes"),
+                ("response_bytes_total", "response_bytes"),
+            ):
+                lines.append(f"# TYPE {prefix}_{name} counter")
+                for labels, stats in items:
+                    lines.append(f"{prefix}_{name}{{{labels}}} {getattr(stats, attribute)}")
+            for name, attribute in (
+                ("request_duration_seconds", "latency"),
+                ("limiter_wait_seconds", "limiter_wait"),
+            ):
+                lines.append(f"# TYPE {prefix}_{name} histogram")
+                for labels, stats in items:
+                    histogram(name, labels, getattr(stats, attribute))
+            lines.append(f"# TYPE {prefix}_parse_duration_seconds histogram")
+            for labels, stats in items:
+                for stage, hist in sorted(stats.parse.items()):
+                    histogram("parse_duration_seconds", f'{labels},stage="{stage}"', hist)
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryMetrics(MetricsSink):
+    """Records measurements with OpenTelemetry metrics API (requires 'opentelemetry-api' package).
+
+    Args:
+        meter: OpenTelemetry meter, by default obtained from global meter provider
+
+    Example:
+        >>> session = ManagerSession(base_url=url, auth=auth, metrics=OpenTelemetryMetrics())
+    """
+
+    def __init__(self, meter: Any = None):
+        if meter is None:
+            try:
+                from opentelemetry import metrics  # type: ignore
+            except ImportError as error:
+                raise ImportError(
+                    "OpenTelemetry metrics selected but 'opentelemetry-api' package is not installed"
+                ) from error
+            from catalystwan import USER_AGENT
+
+            meter = metrics.get_meter("catalystwan", USER_AGENT.split("/")[-1])
+        self.requests = meter.create_counter("catalystwan.requests", unit="{request}")
+        self.retries = meter.create_counter("catalystwan.request.retries", unit="{retry}")
+        self.duration = meter.create_histogram("catalystwan.request.duration", unit="s")
+        self.limiter_wait = meter.create_histogram("catalystwan.request.limiter_wait", unit="s")
+        self.request_size = meter.create_histogram("catalystwan.request.body.size", unit="By")
+        self.response_size = meter.create_histogram("catalystwan.response.body.size", unit="By")
+        self.parse_duration = meter.create_histogram("catalystwan.response.parse.duration", unit="s")
+        self.validation_failures = meter.create_counter("catalystwan.response.validation.failures", unit="{response}")
+        self.validation_errors = meter.create_counter("catalystwan.response.validation.errors", unit="{error}")
+
+    def record_request(self, sample: RequestSample) -> None:
+        attributes: Dict[str, Any] = {"endpoint": sample.endpoint, "http.request.method": sample.method}
+        if sample.status_code is not None:
+            attributes["http.response.status_code"] = sample.status_code
+        if sample.error is not None:
+            attributes["error.type"] = sample.error
+        self.requests.add(1, attributes)
+        self.duration.record(sample.latency, attributes)
+        self.limiter_wait.record(sample.limiter_wait, attributes)
+        self.request_size.record(sample.request_bytes, attributes)
+        self.response_size.record(sample.response_bytes, attributes)
+
+    def record_retries(self, endpoint: str, method: str, retries: int) -> None:
+        self.retries.add(retries, {"endpoint": endpoint, "http.request.method": method})
+
+    def record_parse(self, endpoint: str, stage: str, seconds: float) -> None:
+        self.parse_duration.record(seconds, {"endpoint": endpoint, "stage": stage})
+
+    def record_validation_failure(self, endpoint: str, errors: int) -> None:
+        self.validation_failures.add(1, {"endpoint": endpoint})
+        self.validation_errors.add(errors, {"endpoint": endpoint})
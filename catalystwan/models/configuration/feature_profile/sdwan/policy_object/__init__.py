@@ -1,99 +1,49 @@
 # Copyright 2024 Cisco Systems, Inc. and its affiliates
 
-from typing import List, Mapping, Union
+# models are imported from their modules on first access to keep "import catalystwan" fast
+from typing import TYPE_CHECKING
 
-from pydantic import Field
-from typing_extensions import Annotated
+from catalystwan.utils.lazy import lazy_module
 
-from .policy.app_probe import AppProbeMapItem, AppProbeParcel
-from .policy.application_list import ApplicationFamilyListEntry, ApplicationListEntry, ApplicationListParcel
-from .policy.color_list import ColorEntry, ColorParcel
-from .policy.data_prefix import DataPrefixEntry, DataPrefixParcel
-from .policy.expanded_community_list import ExpandedCommunityParcel
-from .policy.fowarding_class import FowardingClassParcel, FowardingClassQueueEntry
-from .policy.ipv6_data_prefix import IPv6DataPrefixEntry, IPv6DataPrefixParcel
-from .policy.ipv6_prefix_list import IPv6PrefixListEntry, IPv6PrefixListParcel
-from .policy.policier import PolicierEntry, PolicierParcel
-from .policy.prefered_group_color import Preference, PreferredColorGroupEntry, PreferredColorGroupParcel
-from .policy.prefix_list import PrefixListEntry, PrefixListParcel
-from .policy.sla_class import FallbackBestTunnel, SLAAppProbeClass, SLAClassCriteria, SLAClassListEntry, SLAClassParcel
-from .policy.standard_community import StandardCommunityEntry, StandardCommunityParcel
-from .policy.tloc_list import TlocEntry, TlocParcel
-from .security.application_list import (
-    SecurityApplicationFamilyListEntry,
-    SecurityApplicationListEntry,
-    SecurityApplicationListParcel,
-)
-from .security.data_prefix import SecurityDataPrefixEntry, SecurityDataPrefixParcel
-from .security.fqdn import FQDNDomainParcel, FQDNListEntry
-from .security.geolocation_list import GeoLocationListEntry, GeoLocationListParcel
-from .security.ips_signature import IPSSignatureListEntry, IPSSignatureParcel
-from .security.local_domain import LocalDomainListEntry, LocalDomainParcel
-from .security.protocol_list import ProtocolListEntry, ProtocolListParcel
-from .security.security_port import SecurityPortListEntry, SecurityPortParcel
-from .security.url import BaseURLListEntry, URLAllowParcel, URLBlockParcel
-from .security.zone import SecurityZoneListEntry, SecurityZoneListParcel
-
-AnyPolicyObjectParcel = Annotated[
-    Union[
-        AppProbeParcel,
-        ApplicationListParcel,
-        ColorParcel,
-        DataPrefixParcel,
-        ExpandedCommunityParcel,
-        FowardingClassParcel,
-        IPv6DataPrefixParcel,
-        IPv6PrefixListParcel,
-        PrefixListParcel,
-        PolicierParcel,
-        PreferredColorGroupParcel,
+if TYPE_CHECKING:
+    from .any_parcel import POLICY_OBJECT_PAYLOAD_ENDPOINT_MAPPING, AnyPolicyObjectParcel
+    from .policy.app_probe import AppProbeEntry, AppProbeMapItem, AppProbeParcel
+    from .policy.application_list import ApplicationFamilyListEntry, ApplicationListEntry, ApplicationListParcel
+    from .policy.color_list import ColorEntry, ColorParcel
+    from .policy.data_prefix import DataPrefixEntry, DataPrefixParcel
+    from .policy.expanded_community_list import ExpandedCommunityParcel
+    from .policy.fowarding_class import FowardingClassParcel, FowardingClassQueueEntry
+    from .policy.ipv6_data_prefix import IPv6DataPrefixEntry, IPv6DataPrefixParcel
+    from .policy.ipv6_prefix_list import IPv6PrefixListEntry, IPv6PrefixListParcel
+    from .policy.policier import PolicierEntry, PolicierParcel
+    from .policy.prefered_group_color import Preference, PreferredColorGroupEntry, PreferredColorGroupParcel
+    from .policy.prefix_list import PrefixListEntry, PrefixListParcel
+    from .policy.sla_class import (
+        FallbackBestTunnel,
+        SLAAppProbeClass,
+        SLAClassCriteria,
+        SLAClassListEntry,
         SLAClassParcel,
-        TlocParcel,
-        StandardCommunityParcel,
-        LocalDomainParcel,
-        FQDNDomainParcel,
-        IPSSignatureParcel,
-        URLAllowParcel,
-        URLBlockParcel,
-        SecurityPortParcel,
-        ProtocolListParcel,
-        GeoLocationListParcel,
-        SecurityZoneListParcel,
+    )
+    from .policy.standard_community import StandardCommunityEntry, StandardCommunityParcel
+    from .policy.tloc_list import TlocEntry, TlocParcel
+    from .security.application_list import (
+        SecurityApplicationFamilyListEntry,
+        SecurityApplicationListEntry,
         SecurityApplicationListParcel,
-        SecurityDataPrefixParcel,
-    ],
-    Field(discriminator="type"),
-]
-
-POLICY_OBJECT_PAYLOAD_ENDPOINT_MAPPING: Mapping[type, str] = {
-    AppProbeParcel: "app-probe",
-    ApplicationListParcel: "app-list",
-    ColorParcel: "color",
-    DataPrefixParcel: "data-prefix",
-    ExpandedCommunityParcel: "expanded-community",
-    FowardingClassParcel: "class",
-    IPv6DataPrefixParcel: "data-ipv6-prefix",
-    IPv6PrefixListParcel: "ipv6-prefix",
-    PrefixListParcel: "prefix",
-    PolicierParcel: "policer",
-    PreferredColorGroupParcel: "preferred-color-group",
-    SLAClassParcel: "sla-class",
-    TlocParcel: "tloc",
-    StandardCommunityParcel: "standard-community",
-    LocalDomainParcel: "security-localdomain",
-    FQDNDomainParcel: "security-fqdn",
-    IPSSignatureParcel: "security-ipssignature",
-    URLAllowParcel: "security-urllist",
-    URLBlockParcel: "security-urllist",
-    SecurityPortParcel: "security-port",
-    ProtocolListParcel: "security-protocolname",
-    GeoLocationListParcel: "security-geolocation",
-    SecurityZoneListParcel: "security-zone",
-    SecurityApplicationListParcel: "security-localapp",
-    SecurityDataPrefixParcel: "security-data-ip-prefix",
-}
+    )
+    from .security.data_prefix import SecurityDataPrefixEntry, SecurityDataPrefixParcel
+    from .security.fqdn import FQDNDomainParcel, FQDNListEntry
+    from .security.geolocation_list import GeoLocationListEntry, GeoLocationListParcel
+    from .security.ips_signature import IPSSignatureListEntry, IPSSignatureParcel
+    from .security.local_domain import LocalDomainListEntry, LocalDomainParcel
+    from .security.protocol_list import ProtocolListEntry, ProtocolListParcel
+    from .security.security_port import SecurityPortListEntry, SecurityPortParcel
+    from .security.url import BaseURLListEntry, URLAllowParcel, URLBlockParcel
+    from .security.zone import SecurityZoneListEntry, SecurityZoneListParcel
 
 __all__ = (
+    "POLICY_OBJECT_PAYLOAD_ENDPOINT_MAPPING",
     "AnyPolicyObjectParcel",
     "ApplicationFamilyListEntry",
     "ApplicationListEntry",
@@ -152,6 +102,43 @@ __all__ = (
     "URLBlockParcel",
 )
 
-
-def __dir__() -> "List[str]":
-    return list(__all__)
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    {
+        ".any_parcel": ("AnyPolicyObjectParcel", "POLICY_OBJECT_PAYLOAD_ENDPOINT_MAPPING"),
+        ".policy.app_probe": ("AppProbeEntry", "AppProbeMapItem", "AppProbeParcel"),
+        ".policy.application_list": ("ApplicationFamilyListEntry", "ApplicationListEntry", "ApplicationListParcel"),
+        ".policy.color_list": ("ColorEntry", "ColorParcel"),
+        ".policy.data_prefix": ("DataPrefixEntry", "DataPrefixParcel"),
+        ".policy.expanded_community_list": ("ExpandedCommunityParcel",),
+        ".policy.fowarding_class": ("FowardingClassParcel", "FowardingClassQueueEntry"),
+        ".policy.ipv6_data_prefix": ("IPv6DataPrefixEntry", "IPv6DataPrefixParcel"),
+        ".policy.ipv6_prefix_list": ("IPv6PrefixListEntry", "IPv6PrefixListParcel"),
+        ".policy.policier": ("PolicierEntry", "PolicierParcel"),
+        ".policy.prefered_group_color": ("Preference", "PreferredColorGroupEntry", "PreferredColorGroupParcel"),
+        ".policy.prefix_list": ("PrefixListEntry", "PrefixListParcel"),
+        ".policy.sla_class": (
+            "FallbackBestTunnel",
+            "SLAAppProbeClass",
+            "SLAClassCriteria",
+            "SLAClassListEntry",
+            "SLAClassParcel",
+        ),
+        ".policy.standard_community": ("StandardCommunityEntry", "StandardCommunityParcel"),
+        ".policy.tloc_list": ("TlocEntry", "TlocParcel"),
+        ".security.application_list": (
+            "SecurityApplicationFamilyListEntry",
+            "SecurityApplicationListEntry",
+            "SecurityApplicationListParcel",
+        ),
+        ".security.data_prefix": ("SecurityDataPrefixEntry", "SecurityDataPrefixParcel"),
+        ".security.fqdn": ("FQDNDomainParcel", "FQDNListEntry"),
+        ".security.geolocation_list": ("GeoLocationListEntry", "GeoLocationListParcel"),
+        ".security.ips_signature": ("IPSSignatureListEntry", "IPSSignatureParcel"),
+        ".security.local_domain": ("LocalDomainListEntry", "LocalDomainParcel"),
+        ".security.protocol_list": ("ProtocolListEntry", "ProtocolListParcel"),
+        ".security.security_port": ("SecurityPortListEntry", "SecurityPortParcel"),
+        ".security.url": ("BaseURLListEntry", "URLAllowParcel", "URLBlockParcel"),
+        ".security.zone": ("SecurityZoneListEntry", "SecurityZoneListParcel"),
+    },
+)
@@ -0,0 +1,119 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from typing import Mapping, Union
+
+from pydantic import Field
+from typing_extensions import Annotated
+
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.app_probe import AppProbeParcel
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.application_list import (
+    ApplicationListParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.color_list import ColorParcel
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.data_prefix import DataPrefixParcel
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.expanded_community_list import (
+    ExpandedCommunityParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.fowarding_class import (
+    FowardingClassParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.ipv6_data_prefix import (
+    IPv6DataPrefixParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.ipv6_prefix_list import (
+    IPv6PrefixListParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.policier import PolicierParcel
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.prefered_group_color import (
+    PreferredColorGroupParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.prefix_list import PrefixListParcel
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.sla_class import SLAClassParcel
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.standard_community import (
+    StandardCommunityParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.policy.tloc_list import TlocParcel
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.security.application_list import (
+    SecurityApplicationListParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.security.data_prefix import (
+    SecurityDataPrefixParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.security.fqdn import FQDNDomainParcel
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.security.geolocation_list import (
+    GeoLocationListParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.security.ips_signature import (
+    IPSSignatureParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.security.local_domain import LocalDomainParcel
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.security.protocol_list import (
+    ProtocolListParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.security.security_port import (
+    SecurityPortParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.security.url import (
+    URLAllowParcel,
+    URLBlockParcel,
+)
+from catalystwan.models.configuration.feature_profile.sdwan.policy_object.security.zone import SecurityZoneListParcel
+
+AnyPolicyObjectParcel = Annotated[
+    Union[
+        AppProbeParcel,
+        ApplicationListParcel,
+        ColorParcel,
+        DataPrefixParcel,
+        ExpandedCommunityParcel,
+        FowardingClassParcel,
+        IPv6DataPrefixParcel,
+        IPv6PrefixListParcel,
+        PrefixListParcel,
+        PolicierParcel,
+        PreferredColorGroupParcel,
+        SLAClassParcel,
+        TlocParcel,
+        StandardCommunityParcel,
+        LocalDomainParcel,
+        FQDNDomainParcel,
+        IPSSignatureParcel,
+        URLAllowParcel,
+        URLBlockParcel,
+        SecurityPortParcel,
+        ProtocolListParcel,
+        GeoLocationListParcel,
+        SecurityZoneListParcel,
+        SecurityApplicationListParcel,
+        SecurityDataPrefixParcel,
+    ],
+    Field(discriminator="type"),
+]
+
+POLICY_OBJECT_PAYLOAD_ENDPOINT_MAPPING: Mapping[type, str] = {
+    AppProbeParcel: "app-probe",
+    ApplicationListParcel: "app-list",
+    ColorParcel: "color",
+    DataPrefixParcel: "data-prefix",
+    ExpandedCommunityParcel: "expanded-community",
+    FowardingClassParcel: "class",
+    IPv6DataPrefixParcel: "data-ipv6-prefix",
+    IPv6PrefixListParcel: "ipv6-prefix",
+    PrefixListParcel: "prefix",
+    PolicierParcel: "policer",
+    PreferredColorGroupParcel: "preferred-color-group",
+    SLAClassParcel: "sla-class",
+    TlocParcel: "tloc",
+    StandardCommunityParcel: "standard-community",
+    LocalDomainParcel: "security-localdomain",
+    FQDNDomainParcel: "security-fqdn",
+    IPSSignatureParcel: "security-ipssignature",
+    URLAllowParcel: "security-urllist",
+    URLBlockParcel: "security-urllist",
+    SecurityPortParcel: "security-port",
+    ProtocolListParcel: "security-protocolname",
+    GeoLocationListParcel: "security-geolocation",
+    SecurityZoneListParcel: "security-zone",
+    SecurityApplicationListParcel: "security-localapp",
+    SecurityDataPrefixParcel: "security-data-ip-prefix",
+}
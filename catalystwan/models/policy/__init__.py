@@ -1,94 +1,30 @@
 # Copyright 2024 Cisco Systems, Inc. and its affiliates
 
 # This stub provide top-level "public" policy models to be used with PolicyAPI()
-from typing import List, Union
+# models are imported from their modules on first access to keep "import catalystwan" fast
+from typing import TYPE_CHECKING
 
-from pydantic import Field
-from typing_extensions import Annotated
+from catalystwan.utils.lazy import lazy_module
 
-from .centralized import CentralizedPolicy, TrafficDataDirection
-from .definitions.access_control_list import AclPolicy
-from .definitions.access_control_list_ipv6 import AclIPv6Policy
-from .definitions.control import ControlPolicy
-from .definitions.device_access import DeviceAccessPolicy
-from .definitions.device_access_ipv6 import DeviceAccessIPv6Policy
-from .definitions.hub_and_spoke import HubAndSpokePolicy
-from .definitions.mesh import MeshPolicy
-from .definitions.qos_map import QoSDropType, QoSMapPolicy
-from .definitions.rewrite import RewritePolicy
-from .definitions.rule_set import RuleSet
-from .definitions.security_group import SecurityGroup
-from .definitions.traffic_data import TrafficDataPolicy
-from .definitions.vpn_membership import VPNMembershipPolicy
-from .definitions.zone_based_firewall import ZoneBasedFWPolicy
-from .lists import (
-    AppList,
-    AppProbeClassList,
-    ASPathList,
-    ClassMapList,
-    ColorList,
-    CommunityList,
-    DataIPv6PrefixList,
-    DataPrefixList,
-    ExpandedCommunityList,
-    FQDNList,
-    GeoLocationList,
-    IPSSignatureList,
-    IPv6PrefixList,
-    LocalAppList,
-    LocalDomainList,
-    MirrorList,
-    PolicerList,
-    PortList,
-    PreferredColorGroupList,
-    PrefixList,
-    ProtocolNameList,
-    RegionList,
-    SiteList,
-    SLAClassList,
-    TLOCList,
-    URLAllowList,
-    URLBlockList,
-    VPNList,
-    ZoneList,
-)
-from .lists_entries import EncapType, PathPreference, PolicerExceedAction
-from .localized import LocalizedPolicy
-from .policy_definition import (
-    Carrier,
-    DNSTypeEntryType,
-    MultiRegionRole,
-    OriginProtocol,
-    PathType,
-    PLPEntryType,
-    PolicyActionType,
-    ServiceType,
-    TLOCActionType,
-)
-from .security import SecurityPolicy, UnifiedSecurityPolicy
-
-AnyPolicyDefinition = Annotated[
-    Union[
-        RuleSet,
-        SecurityGroup,
-        ZoneBasedFWPolicy,
-        TrafficDataPolicy,
-        QoSMapPolicy,
-        RewritePolicy,
-        ControlPolicy,
-        VPNMembershipPolicy,
-        HubAndSpokePolicy,
-        MeshPolicy,
-        AclPolicy,
-        AclIPv6Policy,
-        DeviceAccessPolicy,
-        DeviceAccessIPv6Policy,
-    ],
-    Field(discriminator="type"),
-]
-
-AnyPolicyList = Annotated[
-    Union[
+if TYPE_CHECKING:
+    from .any_definition import AnyPolicyDefinition
+    from .centralized import CentralizedPolicy, TrafficDataDirection
+    from .definitions.access_control_list import AclPolicy
+    from .definitions.access_control_list_ipv6 import AclIPv6Policy
+    from .definitions.control import ControlPolicy
+    from .definitions.device_access import DeviceAccessPolicy
+    from .definitions.device_access_ipv6 import DeviceAccessIPv6Policy
+    from .definitions.hub_and_spoke import HubAndSpokePolicy
+    from .definitions.mesh import MeshPolicy
+    from .definitions.qos_map import QoSDropType, QoSMapPolicy
+    from .definitions.rewrite import RewritePolicy
+    from .definitions.rule_set import RuleSet
+    from .definitions.security_group import SecurityGroup
+    from .definitions.traffic_data import TrafficDataPolicy
+    from .definitions.vpn_membership import VPNMembershipPolicy
+    from .definitions.zone_based_firewall import ZoneBasedFWPolicy
+    from .lists import (
+        AnyPolicyList,
         AppList,
         AppProbeClassList,
         ASPathList,
@@ -114,19 +50,30 @@ AnyPolicyList = Annotated[
         SiteList,
         SLAClassList,
         TLOCList,
-        URLBlockList,
         URLAllowList,
+        URLBlockList,
         VPNList,
         ZoneList,
-    ],
-    Field(discriminator="type"),
-]
-
+    )
+    from .lists_entries import EncapType, PathPreference, PolicerExceedAction
+    from .localized import LocalizedPolicy
+    from .policy_definition import (
+        Carrier,
+        DNSTypeEntryType,
+        MultiRegionRole,
+        OriginProtocol,
+        PathType,
+        PLPEntryType,
+        PolicyActionType,
+        ServiceType,
+        TLOCActionType,
+    )
+    from .security import SecurityPolicy, UnifiedSecurityPolicy
 
 __all__ = (
     "AclIPv6Policy",
     "AclPolicy",
-    "AnyPolicyList",
+    "AnyPolicyDefinition",
     "AnyPolicyList",
     "AppList",
     "AppProbeClassList",
@@ -181,14 +128,78 @@ __all__ = (
     "TrafficDataDirection",
     "TrafficDataPolicy",
     "UnifiedSecurityPolicy",
-    "URLBlockList",
     "URLAllowList",
+    "URLBlockList",
     "VPNList",
     "VPNMembershipPolicy",
     "ZoneBasedFWPolicy",
     "ZoneList",
 )
 
-
-def __dir__() -> "List[str]":
-    return list(__all__)
+__getattr__, __dir__ = lazy_module(
+    __name__,
+    {
+        ".any_definition": ("AnyPolicyDefinition",),
+        ".centralized": ("CentralizedPolicy", "TrafficDataDirection"),
+        ".definitions.access_control_list": ("AclPolicy",),
+        ".definitions.access_control_list_ipv6": ("AclIPv6Policy",),
+        ".definitions.control": ("ControlPolicy",),
+        ".definitions.device_access": ("DeviceAccessPolicy",),
+        ".definitions.device_access_ipv6": ("DeviceAccessIPv6Policy",),
+        ".definitions.hub_and_spoke": ("HubAndSpokePolicy",),
+        ".definitions.mesh": ("MeshPolicy",),
+        ".definitions.qos_map": ("QoSDropType", "QoSMapPolicy"),
+        ".definitions.rewrite": ("RewritePolicy",),
+        ".definitions.rule_set": ("RuleSet",),
+        ".definitions.security_group": ("SecurityGroup",),
+        ".definitions.traffic_data": ("TrafficDataPolicy",),
+        ".definitions.vpn_membership": ("VPNMembershipPolicy",),
+        ".definitions.zone_based_firewall": ("ZoneBasedFWPolicy",),
+        ".lists": (
+            "AnyPolicyList",
+            "AppList",
+            "AppProbeClassList",
+            "ASPathList",
+            "ClassMapList",
+            "ColorList",
+            "CommunityList",
+            "DataIPv6PrefixList",
+            "DataPrefixList",
+            "ExpandedCommunityList",
+            "FQDNList",
+            "GeoLocationList",
+            "IPSSignatureList",
+            "IPv6PrefixList",
+            "LocalAppList",
+            "LocalDomainList",
+            "MirrorList",
+            "PolicerList",
+            "PortList",
+            "PreferredColorGroupList",
+            "PrefixList",
+            "ProtocolNameList",
+            "RegionList",
+            "SiteList",
+            "SLAClassList",
+            "TLOCList",
+            "URLAllowList",
+            "URLBlockList",
+            "VPNList",
+            "ZoneList",
+        ),
+        ".lists_entries": ("EncapType", "PathPreference", "PolicerExceedAction"),
+        ".localized": ("LocalizedPolicy",),
+        ".policy_definition": (
+            "Carrier",
+            "DNSTypeEntryType",
+            "MultiRegionRole",
+            "OriginProtocol",
+            "PathType",
+            "PLPEntryType",
+            "PolicyActionType",
+            "ServiceType",
+            "TLOCActionType",
+        ),
+        ".security": ("SecurityPolicy", "UnifiedSecurityPolicy"),
+    },
+)
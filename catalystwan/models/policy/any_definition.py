@@ -0,0 +1,41 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from typing import Union
+
+from pydantic import Field
+from typing_extensions import Annotated
+
+from catalystwan.models.policy.definitions.access_control_list import AclPolicy
+from catalystwan.models.policy.definitions.access_control_list_ipv6 import AclIPv6Policy
+from catalystwan.models.policy.definitions.control import ControlPolicy
+from catalystwan.models.policy.definitions.device_access import DeviceAccessPolicy
+from catalystwan.models.policy.definitions.device_access_ipv6 import DeviceAccessIPv6Policy
+from catalystwan.models.policy.definitions.hub_and_spoke import HubAndSpokePolicy
+from catalystwan.models.policy.definitions.mesh import MeshPolicy
+from catalystwan.models.policy.definitions.qos_map import QoSMapPolicy
+from catalystwan.models.policy.definitions.rewrite import RewritePolicy
+from catalystwan.models.policy.definitions.rule_set import RuleSet
+from catalystwan.models.policy.definitions.security_group import SecurityGroup
+from catalystwan.models.policy.definitions.traffic_data import TrafficDataPolicy
+from catalystwan.models.policy.definitions.vpn_membership import VPNMembershipPolicy
+from catalystwan.models.policy.definitions.zone_based_firewall import ZoneBasedFWPolicy
+
+AnyPolicyDefinition = Annotated[
+    Union[
+        RuleSet,
+        SecurityGroup,
+        ZoneBasedFWPolicy,
+        TrafficDataPolicy,
+        QoSMapPolicy,
+        RewritePolicy,
+        ControlPolicy,
+        VPNMembershipPolicy,
+        HubAndSpokePolicy,
+        MeshPolicy,
+        AclPolicy,
+        AclIPv6Policy,
+        DeviceAccessPolicy,
+        DeviceAccessIPv6Policy,
+    ],
+    Field(discriminator="type"),
+]
@@ -1,10 +1,11 @@
 # Copyright 2023 Cisco Systems, Inc. and its affiliates
 
 from ipaddress import IPv4Address, IPv4Network, IPv6Network
-from typing import Any, List, Literal, Optional, Set, Tuple
+from typing import Any, List, Literal, Optional, Set, Tuple, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import Annotated
 
 from catalystwan.models.common import InterfaceType, TLOCColor, WellKnownBGPCommunities
 from catalystwan.models.policy.lists_entries import (
@@ -43,6 +44,7 @@ from catalystwan.models.policy.lists_entries import (
 
 
 class PolicyListBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     name: str = Field(
         pattern="^[a-zA-Z0-9_-]{1,32}$",
         description="Can include only alpha-numeric characters, hyphen '-' or underscore '_'; maximum 32 characters",
@@ -328,3 +330,39 @@ class RegionList(PolicyListBase):
     def add_region_range(self, region_range: Tuple[int, int]):
         entry = RegionListEntry(region_id=f"{region_range[0]}-{region_range[1]}")
         self._add_entry(entry)
+
+
+AnyPolicyList = Annotated[
+    Union[
+        AppList,
+        AppProbeClassList,
+        ASPathList,
+        ClassMapList,
+        ColorList,
+        CommunityList,
+        DataIPv6PrefixList,
+        DataPrefixList,
+        ExpandedCommunityList,
+        FQDNList,
+        GeoLocationList,
+        IPSSignatureList,
+        IPv6PrefixList,
+        LocalAppList,
+        LocalDomainList,
+        MirrorList,
+        PolicerList,
+        PortList,
+        PreferredColorGroupList,
+        PrefixList,
+        ProtocolNameList,
+        RegionList,
+        SiteList,
+        SLAClassList,
+        TLOCList,
+        URLBlockList,
+        URLAllowList,
+        VPNList,
+        ZoneList,
+    ],
+    Field(discriminator="type"),
+]
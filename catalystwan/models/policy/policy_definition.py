@@ -779,6 +779,7 @@ ActionSetEntry = Annotated[
 
 
 class ActionSet(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     type: Literal["set"] = "set"
     parameter: List[ActionSetEntry] = []
 
@@ -897,6 +898,7 @@ MUTUALLY_EXCLUSIVE_FIELD_LOOKUP = _generate_field_name_check_lookup(MUTUALLY_EXC
 
 
 class Match(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     entries: Sequence[MatchEntry]
 
 
@@ -905,6 +907,7 @@ class Action(BaseModel):
 
 
 class PolicyDefinitionSequenceBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     sequence_id: int = Field(default=0, serialization_alias="sequenceId", validation_alias="sequenceId")
     sequence_name: str = Field(serialization_alias="sequenceName", validation_alias="sequenceName")
     base_action: PolicyActionType = Field(
@@ -1024,6 +1027,7 @@ class PolicyReference(BaseModel):
 
 
 class DefinitionWithSequencesCommonBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     default_action: Optional[DefaultAction] = Field(
         default=DefaultAction(type="drop"),
         serialization_alias="defaultAction",
@@ -1078,6 +1082,7 @@ class DefinitionWithSequencesCommonBase(BaseModel):
 
 
 class PolicyDefinitionBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
     name: str = Field(
         pattern="^[a-zA-Z0-9_-]{1,128}$",
         description="Can include only alpha-numeric characters, hyphen '-' or underscore '_'; maximum 128 characters",
@@ -0,0 +1,82 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Pre-building of deferred models.
+
+Model catalog bases (feature templates, feature profile parcels, policy lists and definitions) are declared with
+defer_build, so validators and serializers of a model are built on its first use instead of at import time.
+Long running processes which know what they will use can build it ahead, eg. in background while logging in.
+
+Example:
+    >>> from catalystwan.models.policy import AnyPolicyDefinition, AnyPolicyList
+    >>> thread = warm_up(AnyPolicyDefinition, AnyPolicyList)
+    >>> session = create_manager_session(...)
+"""
+
+from __future__ import annotations
+
+import logging
+from threading import Thread
+from typing import Any, Iterator, List, Optional, Set, Type, get_args
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+def iter_models(annotation: Any) -> Iterator[Type[BaseModel]]:
+    """Yields models found in type annotation (model class, Union or Annotated of models, List[Model] etc.)"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+        return
+    for arg in get_args(annotation):
+        yield from iter_models(arg)
+
+
+def deferred_models() -> List[Type[BaseModel]]:
+    """Lists imported catalystwan models which validators and serializers were not built yet"""
+    found: List[Type[BaseModel]] = []
+    seen: Set[Type[BaseModel]] = set()
+    pending: List[Type[BaseModel]] = [BaseModel]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            if subclass in seen:
+                continue
+            seen.add(subclass)
+            pending.append(subclass)
+            if subclass.__module__.startswith("catalystwan.") and not subclass.__pydantic_complete__:
+                found.append(subclass)
+    return found
+
+
+def build_models(*annotations: Any) -> int:
+    """Builds deferred models from given annotations (all imported deferred models when none is given).
+
+    Returns:
+        int: number of models built
+    """
+    models = [m for a in annotations for m in iter_models(a)] if annotations else deferred_models()
+    built = 0
+    for model in models:
+        if model.__pydantic_complete__:
+            continue
+        try:
+            model.model_rebuild()
+        except Exception as error:  # model with unresolved forward references, built on first use as before
+            logger.debug(f"Cannot build {model.__qualname__}: {error}")
+            continue
+        built += 1
+    return built
+
+
+def warm_up(*annotations: Any, background: bool = True) -> Optional[Thread]:
+    """Builds deferred models (see build_models) in daemon thread started in background or in current thread.
+
+    Returns:
+        Optional[Thread]: started thread or None when models were built in current thread
+    """
+    if not background:
+        build_models(*annotations)
+        return None
+    thread = Thread(target=build_models, args=annotations, name="catalystwan-warm-up", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,91 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Generic, Iterator, Optional, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from catalystwan.typed_list import DataSequence
+
+T = TypeVar("T")
+
+
+class PageInfo(BaseModel):
+    """Page information sent by SDWAN Manager along with paged data (eg. under "pageInfo" key)"""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    scroll_id: Optional[str] = Field(default=None, validation_alias="scrollId")
+    has_more_data: bool = Field(default=False, validation_alias="hasMoreData")
+    count: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Pagination:
+    """Declares scroll-style paged endpoint, to be passed to @request decorator (and @get, @post, etc.).
+
+    First page is requested with parameters given by caller (and page size), next pages are requested with the same
+    arguments and scroll id received in page information until server reports there is no more data.
+    Decorated method must return Iterator[Model] (items are fetched page by page while iterating)
+    or DataSequence[Model] (all pages are collected).
+
+    Args:
+        page_size: number of items requested per page
+        size_param: name of query parameter carrying page size (None if endpoint does not accept it)
+        scroll_param: name of query parameter carrying scroll id of requested page
+        page_info_key: name of the JSON key containing page information in response
+        prefetch: request next page in background while current page is being consumed
+
+    Example:
+        >>> class AuditLog(APIEndpoints):
+        ...     @get("/auditlog/page", "data", pagination=Pagination(page_size=5000))
+        ...     def get_audit_logs(self, params: AuditLogQuery) -> Iterator[AuditLogEntry]:
+        ...         ...
+    """
+
+    page_size: int = 1000
+    size_param: Optional[str] = "count"
+    scroll_param: str = "scrollId"
+    page_info_key: str = "pageInfo"
+    prefetch: bool = True
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: DataSequence[T]
+    info: PageInfo
+
+    @property
+    def last(self) -> bool:
+        return not (self.info.has_more_data and self.info.scroll_id and self.items)
+
+
+def iter_pages(first: Page[T], fetch: Callable[[str], Page[T]], prefetch: bool = True) -> Iterator[DataSequence[T]]:
+    """Yields items of given first page and pages fetched with scroll id of preceding page.
+    With prefetch, request for next page is sent in background thread before current page is yielded,
+    so at most two pages are kept in memory regardless of number of pages.
+    """
+    page = first
+    if not prefetch:
+        while True:
+            yield page.items
+            if page.last:
+                return
+            page = fetch(page.info.scroll_id)  # type: ignore[arg-type]
+    executor = ThreadPoolExecutor(1, thread_name_prefix="catalystwan-prefetch")
+    upcoming: Optional[Future[Page[T]]] = None
+    try:
+        while True:
+            if not page.last:
+                upcoming = executor.submit(fetch, page.info.scroll_id)  # type: ignore[arg-type]
+            yield page.items
+            if upcoming is None:
+                return
+            page, upcoming = upcoming.result(), None
+    finally:
+        if upcoming is not None:
+            upcoming.cancel()  # iteration abandoned, request already sent is left to complete in background
+        executor.shutdown(wait=False)
@@ -0,0 +1,71 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from copy import copy
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple, Type
+
+import attrs  # type: ignore
+from attr import attrib
+from pydantic import BaseModel, ConfigDict, create_model
+
+from catalystwan.utils.creation_tools import FIELD_NAME
+
+
+@lru_cache(maxsize=None)
+def _projection(cls: type, fields: Tuple[str, ...]) -> type:
+    name = f"{cls.__name__}Projection"
+    if isinstance(cls, type) and issubclass(cls, BaseModel):
+        missing = [field for field in fields if field not in cls.model_fields]
+        if missing:
+            raise ValueError(f"{cls.__name__} has no fields: {missing}")
+        definitions: Dict[str, Any] = {
+            field: (cls.model_fields[field].annotation, copy(cls.model_fields[field])) for field in fields
+        }
+        config = ConfigDict(**{**cls.model_config, "extra": "ignore"})  # type: ignore[typeddict-item]
+        return create_model(name, __config__=config, __module__=cls.__module__, **definitions)
+    if attrs.has(cls):
+        attributes = attrs.fields_dict(cls)
+        missing = [field for field in fields if field not in attributes]
+        if missing:
+            raise ValueError(f"{cls.__name__} has no fields: {missing}")
+        definitions = {
+            field: attrib(
+                default=attributes[field].default,
+                converter=attributes[field].converter,
+                metadata=attributes[field].metadata,
+                type=attributes[field].type,
+            )
+            for field in fields
+        }
+        return attrs.make_class(name, definitions, bases=cls.__bases__, kw_only=True)
+    raise ValueError(f"Cannot project {cls}, expected pydantic BaseModel or attrs dataclass")
+
+
+def projection(cls: Type[Any], fields: Sequence[str]) -> Type[Any]:
+    """Returns lean class generated from BaseModel or attrs dataclass containing only given fields.
+
+    Field types, aliases and defaults are kept, so projection is created from the same JSON data as full class,
+    other keys are skipped without validation or conversion. Custom validators of full class are not inherited.
+    Generated classes are cached per class and fields.
+
+    Example:
+        >>> DeviceRow = projection(DeviceData, ["uuid", "system_ip", "host_name", "reachability"])
+        >>> devices = response.dataseq(DeviceRow)
+
+    Raises:
+        ValueError: when class is not BaseModel or attrs dataclass or has no such field
+    """
+    return _projection(cls, tuple(fields))  # type: ignore[arg-type]
+
+
+def projected_columns(cls: Type[Any], fields: Sequence[str]) -> List[str]:
+    """Returns names of JSON keys carrying given fields of BaseModel or attrs dataclass"""
+    if issubclass(cls, BaseModel):
+        columns = []
+        for field in fields:
+            info = cls.model_fields[field]
+            alias = info.validation_alias if isinstance(info.validation_alias, str) else info.alias
+            columns.append(alias or field)
+        return columns
+    attributes = attrs.fields_dict(cls)
+    return [attributes[field].metadata.get(FIELD_NAME, field) for field in fields]
@@ -1,18 +1,246 @@
 from __future__ import annotations
 
-from contextlib import AbstractContextManager
-from threading import Semaphore
+import asyncio
+import re
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from threading import Condition, Lock, Semaphore
+from time import monotonic
+from typing import Dict, Optional, Pattern
+from urllib.parse import urlparse
+
+OVERLOAD_STATUS_CODES = {429, 503}
+MAX_LATENCY_BASELINES = 1024
 
 
 class RequestLimiter(AbstractContextManager):
+    """Limits number of concurrent requests sent by sessions sharing the limiter instance"""
+
     def __init__(self, max_requests: int = 49):
         self._max_requests: int = max_requests
         self._semaphore: Semaphore = Semaphore(value=self._max_requests)
+        self._counter_lock: Lock = Lock()
+        self._waiting: int = 0
+        self._in_flight: int = 0
 
     def __enter__(self) -> RequestLimiter:
-        self._semaphore.acquire()
+        if self._semaphore.acquire(blocking=False):
+            with self._counter_lock:
+                self._in_flight += 1
+            return self
+        # only callers which actually block are counted as queued
+        with self._counter_lock:
+            self._waiting += 1
+        try:
+            self._semaphore.acquire()
+        finally:
+            with self._counter_lock:
+                self._waiting -= 1
+        with self._counter_lock:
+            self._in_flight += 1
         return self
 
     def __exit__(self, *exc_info) -> None:
+        with self._counter_lock:
+            self._in_flight -= 1
         self._semaphore.release()
         return
+
+    def acquire(self, url: str) -> AbstractContextManager:
+        """Returns context manager holding request slot for given url"""
+        return self
+
+    def record_response(self, url: str, status_code: int, latency: float) -> None:
+        """Feedback about completed request, used by adaptive limiters"""
+        return
+
+    def record_overload(self) -> None:
+        """Feedback about server overload (connection errors, timeouts, server not ready), used by adaptive limiters"""
+        return
+
+    @property
+    def limit(self) -> int:
+        return self._max_requests
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+
+class _LimiterSlot(AbstractContextManager):
+    def __init__(self, limiter: AdaptiveRequestLimiter, budget: Optional[Pattern[str]]):
+        self._limiter = limiter
+        self._budget = budget
+
+    def __enter__(self) -> _LimiterSlot:
+        self._limiter._acquire(self._budget)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._limiter._release(self._budget)
+        return
+
+
+class AdaptiveRequestLimiter(RequestLimiter):
+    """Request limiter which adapts concurrency limit to server condition using AIMD algorithm.
+
+    Limit is increased additively (about 'increase_step' per 'limit' successful requests) while server is healthy.
+    Limit is decreased multiplicatively by 'decrease_factor' when server signals overload:
+    HTTP 429/503 status, connection errors and timeouts, server not ready or latency rising above
+    'latency_tolerance' times the baseline observed for the same budget (or url path for requests outside
+    of budgets), so slow endpoints do not look like overload when mixed with fast ones.
+    Decreases are applied at most once per 'cooldown' seconds, so single burst of failed requests
+    is treated as one overload event.
+
+    Budgets allow to cap concurrency of heavy endpoints so they cannot take all slots from lightweight ones.
+
+    Args:
+        max_requests: upper bound of concurrency limit
+        min_requests: lower bound of concurrency limit
+        initial_requests: starting concurrency limit (defaults to max_requests)
+        budgets: maps url path regex patterns to maximum number of concurrent requests matching the pattern
+        decrease_factor: multiplicative decrease applied on overload
+        increase_step: additive increase applied per window of successful requests
+        latency_tolerance: latency to baseline ratio treated as overload (None disables latency tracking)
+        cooldown: minimal time in seconds between consecutive decreases
+
+    Example:
+        >>> budgets = {r"/statistics": 8, r"/template/device/config": 4}
+        >>> limiter = AdaptiveRequestLimiter(max_requests=60, budgets=budgets)
+        >>> session = ManagerSession(base_url=url, auth=auth, request_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 49,
+        min_requests: int = 1,
+        initial_requests: Optional[int] = None,
+        budgets: Optional[Dict[str, int]] = None,
+        decrease_factor: float = 0.5,
+        increase_step: float = 1.0,
+        latency_tolerance: Optional[float] = 3.0,
+        cooldown: float = 1.0,
+    ):
+        super().__init__(max_requests)
+        self.min_requests = min_requests
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self._limit: float = float(initial_requests if initial_requests is not None else max_requests)
+        self._condition: Condition = Condition()
+        self._budgets: Dict[Pattern[str], int] = {re.compile(p): size for p, size in (budgets or {}).items()}
+        self._budgets_in_flight: Dict[Pattern[str], int] = {pattern: 0 for pattern in self._budgets}
+        self._baseline_latency: Dict[str, float] = {}
+        self._last_decrease: float = 0.0
+
+    def _budget_for(self, url: str) -> Optional[Pattern[str]]:
+        if not self._budgets:
+            return None
+        path = urlparse(url).path
+        for pattern in self._budgets:
+            if pattern.search(path):
+                return pattern
+        return None
+
+    def _can_acquire(self, budget: Optional[Pattern[str]]) -> bool:
+        if self._in_flight >= int(self._limit):
+            return False
+        if budget is not None and self._budgets_in_flight[budget] >= self._budgets[budget]:
+            return False
+        return True
+
+    def _acquire(self, budget: Optional[Pattern[str]]) -> None:
+        with self._condition:
+            if not self._can_acquire(budget):
+                self._waiting += 1
+                try:
+                    self._condition.wait_for(lambda: self._can_acquire(budget))
+                finally:
+                    self._waiting -= 1
+            self._in_flight += 1
+            if budget is not None:
+                self._budgets_in_flight[budget] += 1
+
+    def _release(self, budget: Optional[Pattern[str]]) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if budget is not None:
+                self._budgets_in_flight[budget] -= 1
+            self._condition.notify_all()
+
+    def __enter__(self) -> AdaptiveRequestLimiter:
+        self._acquire(None)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._release(None)
+        return
+
+    def acquire(self, url: str) -> AbstractContextManager:
+        return _LimiterSlot(self, self._budget_for(url))
+
+    def _decrease(self) -> None:
+        now = monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_requests), self._limit * self.decrease_factor)
+
+    def _increase(self) -> None:
+        self._limit = min(float(self._max_requests), self._limit + self.increase_step / max(self._limit, 1.0))
+        self._condition.notify_all()
+
+    def _latency_rising(self, url: str, latency: float) -> bool:
+        if self.latency_tolerance is None:
+            return False
+        budget = self._budget_for(url)
+        key = budget.pattern if budget is not None else urlparse(url).path
+        baseline = self._baseline_latency.get(key)
+        if baseline is None:
+            if len(self._baseline_latency) >= MAX_LATENCY_BASELINES:
+                del self._baseline_latency[next(iter(self._baseline_latency))]
+            self._baseline_latency[key] = latency
+            return False
+        # baseline follows decreasing latency immediately and increasing latency slowly
+        self._baseline_latency[key] = latency if latency < baseline else baseline + (latency - baseline) * 0.01
+        return latency > baseline * self.latency_tolerance
+
+    def record_response(self, url: str, status_code: int, latency: float) -> None:
+        with self._condition:
+            if status_code in OVERLOAD_STATUS_CODES or self._latency_rising(url, latency):
+                self._decrease()
+            elif status_code < 500:
+                self._increase()
+
+    def record_overload(self) -> None:
+        with self._condition:
+            self._decrease()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def budget_in_flight(self, pattern: str) -> int:
+        """Returns number of requests in-flight for given budget pattern"""
+        return self._budgets_in_flight[re.compile(pattern)]
+
+
+class AsyncRequestLimiter(AbstractAsyncContextManager):
+    def __init__(self, max_requests: int = 49):
+        self._max_requests: int = max_requests
+        self._semaphore: Optional[asyncio.Semaphore] = None  # created lazily to bind to running event loop
+
+    async def __aenter__(self) -> AsyncRequestLimiter:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(value=self._max_requests)
+        await self._semaphore.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._semaphore is not None:
+            self._semaphore.release()
+        return
@@ -0,0 +1,141 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass
+from random import random
+from time import time
+from typing import Callable, Deque, Dict, List, Optional, Pattern, Union
+from urllib.parse import urlparse
+
+from requests import PreparedRequest, Request, Response
+
+from catalystwan.response import response_debug
+
+TraceRenderer = Callable[[Optional[Response], Union[Request, PreparedRequest, None]], str]
+
+
+class LazyTrace:
+    """Defers rendering of Request-Response debug string until it is actually needed.
+
+    Instance is meant to be passed as logging argument (eg. logger.debug("%s", trace)),
+    so rendering happens only when a handler emits the record. Rendered string is cached
+    as multiple handlers can format the same record.
+    """
+
+    __slots__ = ("_render", "_response", "_request", "_rendered")
+
+    def __init__(
+        self,
+        render: TraceRenderer,
+        response: Optional[Response],
+        request: Union[Request, PreparedRequest, None],
+    ):
+        self._render = render
+        self._response = response
+        self._request = request
+        self._rendered: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._rendered is None:
+            self._rendered = self._render(self._response, self._request)
+        return self._rendered
+
+
+@dataclass(frozen=True)
+class TraceRecord:
+    """Single Request-Response exchange kept in tracer history"""
+
+    timestamp: float
+    response: Optional[Response]
+    request: Union[Request, PreparedRequest, None]
+
+    def __str__(self) -> str:
+        return f"[{self.timestamp:.3f}]\n" + response_debug(self.response, self.request)
+
+
+def _request_url(response: Optional[Response], request: Union[Request, PreparedRequest, None]) -> str:
+    _request = request if request is not None else getattr(response, "request", None)
+    return getattr(_request, "url", None) or ""
+
+
+class RequestTracer:
+    """Collects Request-Response traces for ManagerSession without formatting cost when debug is disabled.
+
+    Args:
+        history_size: number of most recent exchanges kept for post-mortem dumps, history holds whole responses
+            (including content) so it is disabled by default (0)
+        default_sample_rate: fraction (0.0 - 1.0) of exchanges logged for urls without specific sample rate
+        sample_rates: maps url path regex patterns to sample rates, first matching pattern is used
+
+    Example:
+        >>> tracer = RequestTracer(history_size=16, sample_rates={r"/statistics": 0.01})
+        >>> session = ManagerSession(base_url=url, auth=auth, request_tracer=tracer)
+        >>> ...
+        >>> print(tracer.dump())
+    """
+
+    def __init__(
+        self,
+        history_size: int = 0,
+        default_sample_rate: float = 1.0,
+        sample_rates: Optional[Dict[str, float]] = None,
+    ):
+        self.default_sample_rate = default_sample_rate
+        self._sample_rates: Dict[Pattern[str], float] = {}
+        self._history: Deque[TraceRecord] = deque(maxlen=history_size)
+        for pattern, rate in (sample_rates or {}).items():
+            self.set_sample_rate(pattern, rate)
+
+    def set_sample_rate(self, pattern: str, rate: float) -> None:
+        """Sets sample rate for urls which path matches given regex pattern"""
+        self._sample_rates[re.compile(pattern)] = rate
+
+    def sample_rate(self, url: str) -> float:
+        path = urlparse(url).path
+        for pattern, rate in self._sample_rates.items():
+            if pattern.search(path):
+                return rate
+        return self.default_sample_rate
+
+    def sampled(self, url: str) -> bool:
+        rate = self.sample_rate(url)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        return random() < rate
+
+    def record(self, response: Optional[Response], request: Union[Request, PreparedRequest, None]) -> None:
+        """Stores exchange in history, nothing is rendered at this point"""
+        if self._history.maxlen:
+            self._history.append(TraceRecord(time(), response, request))
+
+    def trace(
+        self,
+        logger: logging.Logger,
+        render: TraceRenderer,
+        response: Optional[Response],
+        request: Union[Request, PreparedRequest, None],
+    ) -> None:
+        """Records exchange and logs its lazily rendered trace when debug is enabled and url is sampled"""
+        self.record(response, request)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        if not self.sampled(_request_url(response, request)):
+            return
+        logger.debug("%s", LazyTrace(render, response, request))
+
+    @property
+    def history(self) -> List[TraceRecord]:
+        return list(self._history)
+
+    def clear(self) -> None:
+        self._history.clear()
+
+    def dump(self) -> str:
+        """Renders all exchanges kept in history (oldest first)"""
+        return "\n".join(str(record) for record in self.history)
@@ -3,26 +3,34 @@
 import re
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from functools import wraps
+from functools import cached_property, lru_cache, partial, wraps
+from math import ceil
 from os import environ
 from pprint import pformat
-from typing import Any, Callable, Dict, Optional, Sequence, Type, TypeVar, Union, cast
+from random import random, sample
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Type, TypeVar, Union, cast
 from urllib.parse import urlparse
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from requests import PreparedRequest, Request, Response
 from requests.cookies import RequestsCookieJar
 from requests.exceptions import JSONDecodeError
+from typing_extensions import TypedDict
 
 from catalystwan import with_proc_info_header
 from catalystwan.abstractions import APIEndpointClientResponse
 from catalystwan.exceptions import ManagerErrorInfo
+from catalystwan.projection import projection
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.creation_tools import create_dataclass
+from catalystwan.utils.json_backend import JSONLoads
+from catalystwan.utils.json_stream import iter_json_array
+from catalystwan.validation import Validation, validation_rate
 
 T = TypeVar("T")
 PRINTABLE_CONTENT = re.compile(r"(text\/.+)|(application\/(json|html|xhtml|xml|x-www-form-urlencoded))", re.IGNORECASE)
 SENSITIVE_URL_PATHS = ["/dataservice/settings/configuration/smartaccountcredentials"]
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 def response_debug(response: Optional[Response], request: Union[Request, PreparedRequest, None]) -> str:
@@ -66,21 +74,26 @@ def response_debug(response: Optional[Response], request: Union[Request, Prepare
             "elapsed-seconds": round(float(response.elapsed.microseconds) / 1000000, 3),
             "headers": dict(response.headers.items()),
         }
-        try:
-            json = response.json()
-
-            if isinstance(json, dict):
-                json.pop("header", None)
-
-            response_debug.update({"json": json})
-        except JSONDecodeError:
-            if response.encoding is not None:
-                if len(response.text) <= 1024:
-                    response_debug.update({"text": response.text})
+        if response.__dict__.get("_content") is False:
+            # streamed response, reading content here would load it into memory
+            response_debug.update({"content": "<streamed>"})
+        else:
+            try:
+                json = response.json()
+
+                if isinstance(json, dict):
+                    # do not modify decoded json as it can be cached by response object
+                    json = {key: value for key, value in json.items() if key != "header"}
+
+                response_debug.update({"json": json})
+            except JSONDecodeError:
+                if response.encoding is not None:
+                    if len(response.text) <= 1024:
+                        response_debug.update({"text": response.text})
+                    else:
+                        response_debug.update({"text(trimmed)": response.text[:1024]})
                 else:
-                    response_debug.update({"text(trimmed)": response.text[:1024]})
-            else:
-                response_debug.update({"text(cannot convert to string: unknown encoding)": None})
+                    response_debug.update({"text(cannot convert to string: unknown encoding)": None})
         debug_dict["response"] = response_debug
     return pformat(debug_dict, width=80, sort_dicts=False)
 
@@ -141,18 +154,93 @@ class JsonPayload:
             self.headers = json.get("headers", None)
 
 
+@lru_cache(maxsize=None)
+def sequence_adapter(cls: Type[BaseModel], sourcekey: Optional[str]) -> TypeAdapter:
+    """Returns cached adapter validating JSON document containing list of models (under sourcekey if given)"""
+    if sourcekey is None:
+        return TypeAdapter(List[cls])  # type: ignore[valid-type]
+    return TypeAdapter(TypedDict("SequenceEnvelope", {sourcekey: List[cls]}))  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def object_adapter(cls: Type[BaseModel], sourcekey: Optional[str]) -> TypeAdapter:
+    """Returns cached adapter validating JSON document containing model (under sourcekey if given)"""
+    if sourcekey is None:
+        return TypeAdapter(cls)
+    return TypeAdapter(TypedDict("ObjectEnvelope", {sourcekey: cls}))  # type: ignore
+
+
+def build_models(cls: Type[BaseModel], sequence: Sequence[Any], rate: float) -> List[Any]:
+    """Creates models from decoded items. Items are validated in single pydantic-core call of cached list adapter,
+    fractional rate selects random sample of items to be validated, remaining items are created with model_construct
+    """
+    if rate >= 1:
+        return sequence_adapter(cls, None).validate_python(sequence)
+    if rate <= 0:
+        return [cls.model_construct(**item) for item in sequence]
+    indices = sorted(sample(range(len(sequence)), ceil(len(sequence) * rate)))
+    validated = dict(zip(indices, sequence_adapter(cls, None).validate_python([sequence[i] for i in indices])))
+    return [validated[i] if i in validated else cls.model_construct(**item) for i, item in enumerate(sequence)]
+
+
+def invalid_items(error: ValidationError, sourcekey: Optional[str]) -> bool:
+    """Tells if validation error raised for raw document is caused by contents of parsed items,
+    not by document shape (invalid JSON, missing sourcekey, object instead of array)"""
+    depth = 0 if sourcekey is None else 1
+    return all(len(detail["loc"]) > depth for detail in error.errors())
+
+
 class ManagerResponse(Response, APIEndpointClientResponse):
     """Extends Response object with methods specific to vManage.
-    Object is meant to be created from aready received requests.Response"""
+    Object is meant to be created from aready received requests.Response
 
-    def __init__(self, response: Response):
+    JSON payload is decoded on first access and cached, so binary and text responses are never decoded.
+    Decoded payload is shared by all callers of json() (also by responses served from ResponseCache)
+    and must be treated as read-only, copy it before modification.
+    Custom decoder can be provided with json_loads argument (eg. orjson.loads).
+    """
+
+    def __init__(self, response: Response, json_loads: Optional[JSONLoads] = None):
         self.__dict__.update(response.__dict__)
+        self._json_loads = json_loads
+        self._response_json = response.json
         self.jsessionid_expired = self._detect_expired_jsessionid()
         self.api_gw_unauthorized = self._detect_apigw_unauthorized()
+
+    @cached_property
+    def _decoded_json(self) -> Any:
+        if self._json_loads is None:
+            return self._response_json()
         try:
-            self.payload = JsonPayload(response.json())
+            return self._json_loads(self.content)
+        except ValueError as error:
+            raise JSONDecodeError(str(error), self.text, 0)
+
+    @cached_property
+    def payload(self) -> JsonPayload:
+        try:
+            return JsonPayload(self.json())
         except JSONDecodeError:
-            self.payload = JsonPayload(empty=True)
+            return JsonPayload(empty=True)
+
+    def json(self, **kwargs) -> Any:
+        """Returns decoded JSON payload. Decoded object is cached and shared between calls, it is read-only:
+        use copy.deepcopy(response.json()) to obtain object which can be modified."""
+        if kwargs:
+            return super().json(**kwargs)
+        return self._decoded_json
+
+    def _raw_content(self) -> Optional[bytes]:
+        """Returns already received body bytes as long as JSON payload was not decoded yet"""
+        content = self.__dict__.get("_content")
+        if self.json_decoded or not isinstance(content, bytes):
+            return None
+        return content
+
+    @property
+    def json_decoded(self) -> bool:
+        """Tells if JSON payload was already decoded"""
+        return "_decoded_json" in self.__dict__
 
     def _detect_expired_jsessionid(self) -> bool:
         """Determines if server sent expired JSESSIONID"""
@@ -189,16 +277,39 @@ class ManagerResponse(Response, APIEndpointClientResponse):
             return response_history_debug(self, None)
         return response_debug(self, None)
 
-    def dataseq(self, cls: Type[T], sourcekey: Optional[str] = "data", validate: bool = True) -> DataSequence[T]:
+    def dataseq(
+        self,
+        cls: Type[T],
+        sourcekey: Optional[str] = "data",
+        validate: Validation = True,
+        fields: Optional[Sequence[str]] = None,
+    ) -> DataSequence[T]:
         """Returns data contents from JSON payload parsed as DataSequence of Dataclass/BaseModel instances
         Args:
             cls: Dataclass/BaseModel subtype (eg. Devices)
             sourcekey: name of the JSON key from response payload to be parsed. If None whole JSON payload will be used
+            validate: validate BaseModel items, fraction (0.0 - 1.0) validates random sample of items
+                (items which are not validated are created with model_construct)
+            fields: parse only given fields of cls into lean generated class (see catalystwan.projection)
 
         Returns:
             DataSequence[T] of given type T which is subclassing from Dataclass/BaseModel,
             in case JSON payload was containing a single Object - sequence with one element is returned
         """
+        if fields is not None:
+            cls = projection(cls, fields)
+        rate = validation_rate(validate)
+        if rate >= 1 and issubclass(cls, BaseModel) and (content := self._raw_content()) is not None:
+            # validate directly from raw bytes without building intermediate python objects
+            try:
+                validated = sequence_adapter(cls, sourcekey).validate_json(content)
+                items = validated if sourcekey is None else validated[sourcekey]
+                return DataSequence(cls, items)  # type: ignore
+            except ValidationError as error:
+                if invalid_items(error, sourcekey):
+                    raise
+                # document does not fit the fast path (eg. single object), fall back to generic parsing
+
         if self.payload.empty:
             return DataSequence(cls, [])
 
@@ -213,21 +324,91 @@ class ManagerResponse(Response, APIEndpointClientResponse):
             sequence = [cast(dict, data)]
 
         if issubclass(cls, BaseModel):
-            if validate:
-                return DataSequence(cls, [cls.model_validate(item) for item in sequence])  # type: ignore
-            return DataSequence(cls, [cls.model_construct(**item) for item in sequence])  # type: ignore
+            return DataSequence(cls, build_models(cls, sequence, rate))  # type: ignore
         return DataSequence(cls, [create_dataclass(cls, item) for item in sequence])
 
-    def dataobj(self, cls: Type[T], sourcekey: Optional[str] = "data", validate: bool = True) -> T:
+    def dataiter(
+        self,
+        cls: Type[T],
+        sourcekey: Optional[str] = "data",
+        validate: Validation = True,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[T]:
+        """Yields data contents from JSON payload parsed as Dataclass/BaseModel instances one by one.
+        Response requested with stream=True is decoded incrementally while reading from connection,
+        memory used is bounded by chunk_size plus the size of single item (body is never loaded as a whole).
+        Connection is released when iteration completes.
+
+        Args:
+            cls: Dataclass/BaseModel subtype (eg. Devices)
+            sourcekey: name of the JSON key from response payload to be parsed. If None whole JSON payload will be used
+            validate: validate items (when False BaseModel items are created with model_construct),
+                fraction (0.0 - 1.0) validates random sample of items
+            chunk_size: number of bytes read from connection at once
+            fields: parse only given fields of cls into lean generated class (see catalystwan.projection)
+
+        Returns:
+            Iterator[T] of given type T which is subclassing from Dataclass/BaseModel
+        """
+        if fields is not None:
+            cls = projection(cls, fields)
+        if self.json_decoded:
+            yield from self.dataseq(cls, sourcekey, validate)
+            return
+        if issubclass(cls, BaseModel):
+            model: Any = cls
+            rate = validation_rate(validate)
+
+            def create(item: Any) -> Any:
+                return model.model_validate(item) if rate >= 1 or random() < rate else model.model_construct(**item)
+
+        else:
+            create = partial(create_dataclass, cls)
+        content = self.__dict__.get("_content")
+        if streamed := not isinstance(content, bytes):
+            chunks = self.iter_content(chunk_size)
+        else:
+            chunks = (content[start : start + chunk_size] for start in range(0, len(content), chunk_size))
+        try:
+            for item in iter_json_array(chunks, sourcekey):
+                yield create(item)
+        finally:
+            if streamed:
+                self.close()
+
+    def dataobj(
+        self,
+        cls: Type[T],
+        sourcekey: Optional[str] = "data",
+        validate: Validation = True,
+        fields: Optional[Sequence[str]] = None,
+    ) -> T:
         """Returns data contents from JSON payload parsed as Dataclass/BaseModel instance
         Args:
             cls: Dataclass/BaseModel subtype (eg. Devices)
             sourcekey: name of the JSON key from response payload to be parsed. If None whole JSON payload will be used
+            validate: validate BaseModel, fraction (0.0 - 1.0) is the probability of validation
+            fields: parse only given fields of cls into lean generated class (see catalystwan.projection)
 
         Returns:
             Object of given type T which is subclassing from Dataclass/BaseModel,
 
         """
+        if fields is not None:
+            cls = projection(cls, fields)
+        if 0 < (rate := validation_rate(validate)) < 1:
+            validate = random() < rate
+        if validate and issubclass(cls, BaseModel) and (content := self._raw_content()) is not None:
+            # validate directly from raw bytes without building intermediate python objects
+            try:
+                validated = object_adapter(cls, sourcekey).validate_json(content)
+                return validated if sourcekey is None else validated[sourcekey]
+            except ValidationError as error:
+                if invalid_items(error, sourcekey):
+                    raise
+                # document does not fit the fast path, fall back to generic parsing
+
         if sourcekey is None:
             data = self.payload.json
         else:
@@ -0,0 +1,189 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Mapping, Optional, Pattern, Tuple
+from urllib.parse import urlparse
+
+from requests.structures import CaseInsensitiveDict
+
+if TYPE_CHECKING:
+    from catalystwan.response import ManagerResponse
+
+CACHEABLE_METHODS = {"GET", "HEAD"}
+KEY_HEADERS = ("Accept", "VSessionId")
+CacheKey = Tuple[str, str, Hashable, Hashable, Optional[str]]
+
+
+def freeze(value: Any) -> Hashable:
+    """Converts request params into hashable form independent of dict ordering"""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return value
+    return repr(value)
+
+
+def _path_segments(url: str) -> Tuple[str, ...]:
+    return tuple(segment for segment in urlparse(url).path.split("/") if segment)
+
+
+@dataclass
+class CacheEntry:
+    response: ManagerResponse
+    expires: float
+    segments: Tuple[str, ...]
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.response.headers.get("ETag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.response.headers.get("Last-Modified")
+
+    def fresh(self, now: float) -> bool:
+        return now < self.expires
+
+    def validators(self) -> Dict[str, str]:
+        """Returns headers making conditional request for this entry"""
+        headers = {}
+        if etag := self.etag:
+            headers["If-None-Match"] = etag
+        if last_modified := self.last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+
+class ResponseCache:
+    """Caches responses for GET requests sent by ManagerSession.
+
+    Entries are kept for TTL matched by url path regex pattern (first match wins, 'ttl' when none matches).
+    Expired entries carrying ETag or Last-Modified header are revalidated with conditional request,
+    so unchanged resources are not transferred again. Least recently used entries are evicted above 'max_entries'.
+
+    Modifying requests (POST, PUT, DELETE, PATCH) invalidate cached entries of the same resource:
+    entries sharing first 'resource_segments' path segments and entries which path is a prefix of modified path.
+
+    Responses are cached per url, params, Accept header and tenant view (VSessionId header or tenant session).
+    Cached ManagerResponse objects are shared between callers and must not be modified.
+
+    Args:
+        ttl: time to live in seconds for responses not matched by any pattern (0 - only conditional revalidation)
+        ttls: maps url path regex patterns to time to live in seconds
+        max_entries: maximum number of cached responses
+        resource_segments: number of leading path segments identifying resource for invalidation
+
+    Example:
+        >>> cache = ResponseCache(ttl=10, ttls={r"/template/feature$": 60, r"/device/counters": 0})
+        >>> session = ManagerSession(base_url=url, auth=auth, response_cache=cache)
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 512,
+        resource_segments: int = 3,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.resource_segments = resource_segments
+        self._ttls: Dict[Pattern[str], float] = {re.compile(p): value for p, value in (ttls or {}).items()}
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._lock: Lock = Lock()
+        self._counters: Dict[str, int] = {"hits": 0, "misses": 0, "revalidated": 0, "invalidated": 0, "evicted": 0}
+
+    def ttl_for(self, url: str) -> float:
+        path = urlparse(url).path
+        for pattern, ttl in self._ttls.items():
+            if pattern.search(path):
+                return ttl
+        return self.ttl
+
+    @staticmethod
+    def key(
+        method: str,
+        url: str,
+        params: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+        tenant: Optional[str] = None,
+    ) -> CacheKey:
+        """Returns cache key of request, from request headers only those selecting response representation
+        or tenant view (KEY_HEADERS) are taken, tenant identifies tenant view selected by session credentials"""
+        _headers = CaseInsensitiveDict(headers or {})
+        return (method.upper(), url, freeze(params), tuple(_headers.get(name) for name in KEY_HEADERS), tenant)
+
+    def _count(self, counter: str, value: int = 1) -> None:
+        self._counters[counter] += value
+
+    def get(self, key: CacheKey) -> Tuple[Optional[ManagerResponse], Dict[str, str]]:
+        """Returns fresh cached response or headers for conditional request when stale entry can be revalidated"""
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                self._count("misses")
+                return None, {}
+            self._entries.move_to_end(key)
+            if entry.fresh(monotonic()):
+                self._count("hits")
+                return entry.response, {}
+            self._count("misses")
+            return None, entry.validators()
+
+    def put(self, key: CacheKey, response: ManagerResponse) -> ManagerResponse:
+        """Stores response (or refreshes entry on 304 Not Modified), returns response to be handed to caller"""
+        url = key[1]
+        with self._lock:
+            if response.status_code == 304 and (entry := self._entries.get(key)) is not None:
+                self._count("revalidated")
+                entry.expires = monotonic() + self.ttl_for(url)
+                self._entries.move_to_end(key)
+                return entry.response
+            if response.status_code != 200:
+                return response
+            ttl = self.ttl_for(url)
+            if ttl <= 0 and not (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+                self._entries.pop(key, None)
+                return response
+            self._entries[key] = CacheEntry(response, monotonic() + ttl, _path_segments(url))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._count("evicted")
+        return response
+
+    def invalidate(self, url: str) -> int:
+        """Removes entries of resource addressed by given url, returns number of removed entries"""
+        segments = _path_segments(url)
+        resource = segments[: self.resource_segments]
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if entry.segments[: self.resource_segments] == resource
+                or segments[: len(entry.segments)] == entry.segments
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._count("invalidated", len(stale))
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Snapshot of cache counters: 'hits', 'misses', 'revalidated', 'invalidated' and 'evicted'"""
+        with self._lock:
+            return dict(self._counters)
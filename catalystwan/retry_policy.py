@@ -0,0 +1,149 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import uniform
+from threading import Lock
+from time import monotonic, sleep
+from typing import Callable, Dict, Optional, Set, TypeVar
+
+from requests import Response
+from requests.exceptions import ChunkedEncodingError, ConnectionError, Timeout
+
+from catalystwan.exceptions import ManagerHTTPError, ManagerRequestException
+
+T = TypeVar("T")
+IDEMPOTENT_METHODS: Set[str] = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+TRANSIENT_STATUS_CODES: Set[int] = {429, 502, 503, 504}
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(response: Optional[Response]) -> Optional[float]:
+    """Returns number of seconds to wait based on 'Retry-After' header (delay-seconds or HTTP-date format)"""
+    if response is None or (retry_after := response.headers.get("Retry-After")) is None:
+        return None
+    retry_after = retry_after.strip()
+    if retry_after.isdigit():
+        return float(retry_after)
+    try:
+        retry_date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Decides if and when failed request sent by ManagerSession is repeated.
+
+    Only idempotent methods are retried by default, endpoint can opt-in (or opt-out) using 'retry' keyword argument:
+    >>> @post("/device/action/status/tasks", retry=True)
+
+    Retried failures are: connection errors, timeouts, connection resets during response transfer and
+    responses with transient status code (429, 502, 503, 504). Delay grows exponentially with full jitter,
+    'Retry-After' header sent by server is respected. No attempt is started when it would exceed 'deadline'.
+
+    Args:
+        max_attempts: maximum number of attempts (including first one), 1 disables retries
+        backoff_factor: base delay in seconds, delay before n-th retry is drawn from [0, backoff_factor * 2^(n-1)]
+        max_backoff: maximum delay in seconds computed by backoff (does not limit 'Retry-After')
+        jitter: randomize delays to avoid synchronized retries from many clients
+        deadline: total time in seconds for all attempts of single request (None - no deadline)
+        retry_methods: HTTP methods retried without explicit opt-in
+        retry_status_codes: response status codes considered transient
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        deadline: Optional[float] = 120.0,
+        retry_methods: Optional[Set[str]] = None,
+        retry_status_codes: Optional[Set[int]] = None,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.deadline = deadline
+        self.retry_methods = retry_methods if retry_methods is not None else IDEMPOTENT_METHODS
+        self.retry_status_codes = retry_status_codes if retry_status_codes is not None else TRANSIENT_STATUS_CODES
+        self._lock: Lock = Lock()
+        self._counters: Dict[str, int] = {}
+
+    def allows(self, method: str, retry: Optional[bool] = None) -> bool:
+        """Checks if request with given method can be retried, 'retry' overrides method based decision"""
+        if self.max_attempts <= 1:
+            return False
+        if retry is not None:
+            return retry
+        return method.upper() in self.retry_methods
+
+    def reason(self, exception: ManagerRequestException) -> Optional[str]:
+        """Returns retry reason for transient failure or None when failure should be raised to the caller"""
+        if isinstance(exception, ManagerHTTPError):
+            if exception.response is not None and exception.response.status_code in self.retry_status_codes:
+                return f"status-{exception.response.status_code}"
+            return None
+        cause = exception.__cause__
+        if isinstance(cause, Timeout):
+            return "timeout"
+        if isinstance(cause, (ConnectionError, ChunkedEncodingError)):
+            return "connection-error"
+        return None
+
+    def backoff(self, attempt: int, response: Optional[Response] = None) -> float:
+        """Returns delay in seconds before next attempt (attempt is number of already failed attempts)"""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = uniform(0, delay)
+        if (retry_after := parse_retry_after(response)) is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + 1
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Snapshot of retry counters: total 'retries', 'exhausted' and 'retries:<reason>' per reason"""
+        with self._lock:
+            return dict(self._counters)
+
+    def execute(self, send: Callable[[], T], method: str, url: str, retry: Optional[bool] = None) -> T:
+        """Calls 'send' and repeats it on transient failures according to policy"""
+        if not self.allows(method, retry):
+            return send()
+        start = monotonic()
+        attempt = 0
+        while True:
+            try:
+                return send()
+            except ManagerRequestException as exception:
+                attempt += 1
+                if (reason := self.reason(exception)) is None:
+                    raise
+                delay = self.backoff(attempt, exception.response)
+                out_of_time = self.deadline is not None and monotonic() - start + delay > self.deadline
+                if attempt >= self.max_attempts or out_of_time:
+                    self._count("exhausted")
+                    raise
+                self._count("retries")
+                self._count(f"retries:{reason}")
+                logger.warning(f"Retrying {method} {url} in {delay:.2f} seconds (attempt: {attempt}, reason: {reason})")
+                sleep(delay)
+
+
+class NoRetryPolicy(RetryPolicy):
+    """Retry policy which never repeats requests"""
+
+    def __init__(self):
+        super().__init__(max_attempts=1)
@@ -2,38 +2,58 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from contextlib import contextmanager, nullcontext
 from enum import Enum
-from functools import cached_property
+from functools import cached_property, partial
+from os import replace
 from pathlib import Path
 from time import monotonic, sleep
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar, Union
 from urllib.parse import urljoin, urlparse, urlunparse
 
 from packaging.version import Version  # type: ignore
 from requests import PreparedRequest, Request, Response, Session, get, head
-from requests.exceptions import ConnectionError, HTTPError, RequestException
+from requests.exceptions import ChunkedEncodingError, ConnectionError, HTTPError, RequestException, Timeout
+from requests.sessions import merge_setting
+from requests.structures import CaseInsensitiveDict
 
 from catalystwan import USER_AGENT
 from catalystwan.apigw_auth import ApiGwAuth, ApiGwLogin, LoginMode
+from catalystwan.batch import Batch, BatchProgressCallback, BatchResult
+from catalystwan.cluster import EJECT_STATUS_CODES, ClusterBalancer
 from catalystwan.endpoints import APIEndpointClient
 from catalystwan.endpoints.client import AboutInfo, ServerInfo
 from catalystwan.exceptions import (
     DefaultPasswordError,
+    DownloadChecksumError,
     ManagerHTTPError,
     ManagerReadyTimeout,
     ManagerRequestException,
     SessionNotCreatedError,
     TenantSubdomainNotFound,
 )
+from catalystwan.metrics import MetricsSink, RequestSample, current_endpoint
 from catalystwan.models.tenant import Tenant
 from catalystwan.request_limiter import RequestLimiter
+from catalystwan.request_tracer import RequestTracer
 from catalystwan.response import ManagerResponse, response_history_debug
+from catalystwan.response_cache import CACHEABLE_METHODS, CacheKey, ResponseCache, freeze
+from catalystwan.retry_policy import RetryPolicy
+from catalystwan.singleflight import SingleFlight
+from catalystwan.utils.json_backend import JSONBackend, JSONLoads, get_json_loads
 from catalystwan.utils.session_type import SessionType
+from catalystwan.validation import ValidationPolicy
 from catalystwan.version import NullVersion, parse_api_version
-from catalystwan.vmanage_auth import create_vmanage_auth, vManageAuth
+from catalystwan.vmanage_auth import ProviderAsTenantAuth, create_vmanage_auth, vManageAuth
 
 JSON = Union[Dict[str, "JSON"], List["JSON"], str, int, float, bool, None]
+DownloadProgressCallback = Callable[[int, Optional[int]], None]
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+REQUEST_BODY_ARGS = {"data", "json", "files"}
+MAX_AUTH_RESENDS = 3
+T = TypeVar("T")
 
 if TYPE_CHECKING:
     from catalystwan.api.api_container import APIContainer
@@ -83,6 +103,14 @@ def determine_session_type(
         return SessionType.NOT_DEFINED
 
 
+def _content_range_total(content_range: Optional[str]) -> Optional[int]:
+    """Returns complete length from 'Content-Range: bytes <start>-<end>/<total>' header, None when unknown"""
+    if content_range is None:
+        return None
+    total = content_range.rpartition("/")[2].strip()
+    return int(total) if total.isdigit() else None
+
+
 def create_base_url(url: str, port: Optional[int] = None) -> str:
     """Creates base url based on ip address or domain and port if provided.
 
@@ -184,20 +212,22 @@ def create_manager_session(
 
 
 class ManagerResponseAdapter(Session):
+    json_loads: Optional[JSONLoads] = None
+
     def request(self, method, url, *args, **kwargs) -> ManagerResponse:
-        return ManagerResponse(super().request(method, url, *args, **kwargs))
+        return ManagerResponse(super().request(method, url, *args, **kwargs), self.json_loads)
 
     def get(self, url, *args, **kwargs) -> ManagerResponse:
-        return ManagerResponse(super().get(url, *args, **kwargs))
+        return ManagerResponse(super().get(url, *args, **kwargs), self.json_loads)
 
     def post(self, url, *args, **kwargs) -> ManagerResponse:
-        return ManagerResponse(super().post(url, *args, **kwargs))
+        return ManagerResponse(super().post(url, *args, **kwargs), self.json_loads)
 
     def put(self, url, *args, **kwargs) -> ManagerResponse:
-        return ManagerResponse(super().put(url, *args, **kwargs))
+        return ManagerResponse(super().put(url, *args, **kwargs), self.json_loads)
 
     def delete(self, url, *args, **kwargs) -> ManagerResponse:
-        return ManagerResponse(super().delete(url, *args, **kwargs))
+        return ManagerResponse(super().delete(url, *args, **kwargs), self.json_loads)
 
 
 class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
@@ -216,7 +246,15 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         api: APIContainer: container for API methods
         endpoints: APIEndpointContainter: container for API endpoints
         state: ManagerSessionState: current state of the session can be used to control session flow
-        response_trace: Callable: function that logs response and request details
+        response_trace: Callable: function that renders response and request details for debug logs
+        tracer: RequestTracer: controls debug trace sampling and keeps history of recent exchanges
+        retry_policy: RetryPolicy: decides if and when failed requests are repeated
+        json_backend: Optional[JSONBackend]: JSON decoder used for responses ("json", "orjson"), None - requests default
+        response_cache: Optional[ResponseCache]: opt-in cache for GET responses (see response_caching context manager)
+        single_flight: Optional[SingleFlight]: opt-in coalescing of concurrent identical GET requests
+        cluster_balancer: Optional[ClusterBalancer]: opt-in spreading of read requests across cluster nodes
+        metrics: Optional[MetricsSink]: opt-in per-endpoint request metrics (see catalystwan.metrics)
+        validation_policy: Optional[ValidationPolicy]: per-endpoint response validation rates (see validate_responses)
         server_name: str: server name
         platform_version: str: platform version
         api_version: Version: API version
@@ -229,10 +267,18 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
     def __init__(
         self,
         base_url: str,
-        auth: Union[vManageAuth, ApiGwAuth],
+        auth: Union[vManageAuth, ApiGwAuth, ProviderAsTenantAuth],
         subdomain: Optional[str] = None,
         logger: Optional[logging.Logger] = None,
         request_limiter: Optional[RequestLimiter] = None,
+        request_tracer: Optional[RequestTracer] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_backend: Optional[JSONBackend] = None,
+        response_cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        cluster_balancer: Optional[ClusterBalancer] = None,
+        metrics: Optional[MetricsSink] = None,
+        validation_policy: Optional[ValidationPolicy] = None,
     ) -> None:
         self.base_url = base_url
         self.subdomain = subdomain
@@ -256,6 +302,14 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         self._state: ManagerSessionState = ManagerSessionState.OPERATIVE
         self._last_request: Optional[PreparedRequest] = None
         self._limiter: RequestLimiter = request_limiter or RequestLimiter()
+        self.tracer: RequestTracer = request_tracer or RequestTracer()
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.json_backend = json_backend
+        self.response_cache: Optional[ResponseCache] = response_cache
+        self.single_flight: Optional[SingleFlight] = single_flight
+        self.cluster_balancer: Optional[ClusterBalancer] = cluster_balancer
+        self.metrics: Optional[MetricsSink] = metrics
+        self.validation_policy: Optional[ValidationPolicy] = validation_policy
 
     @cached_property
     def api(self) -> APIContainer:
@@ -328,6 +382,23 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         self._auth.clear(self._last_request)
         self.auth = self._auth
 
+    def _relogin(self, generation: int, reason: str) -> None:
+        """Handles expired auth detected in response to request sent with given auth generation.
+
+        Login is performed only once per auth generation: concurrent threads (also from other sessions sharing
+        the auth) wait for the login in progress and repeat their requests with renewed credentials.
+        """
+        with self._auth.login_lock:
+            if self._auth.generation != generation:
+                self.logger.debug(f"Credentials renewed since generation {generation}, repeating request")
+                return
+            if self.state == ManagerSessionState.LOGIN_IN_PROGRESS:
+                # detected expired auth during login, resync
+                self.state = ManagerSessionState.AUTH_SYNC
+            else:
+                self.logger.warning(f"Logging to session. Reason: {reason}")
+                self.state = ManagerSessionState.LOGIN
+
     def _fetch_server_info(self) -> ServerInfo:
         try:
             server_info = self.server()
@@ -391,11 +462,11 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
                     verify=self.verify,
                     headers={"User-Agent": USER_AGENT},
                 )
-                self.logger.debug(self.response_trace(resp, None))
+                self._trace(resp, None)
                 if resp.status_code != 503:
                     available = True
             except ConnectionError as error:
-                self.logger.debug(self.response_trace(error.response, error.request))
+                self._trace(error.response, error.request)
             if not available:
                 sleep(poll_period)
                 continue
@@ -411,7 +482,7 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
                     verify=self.verify,
                     headers={"User-Agent": USER_AGENT},
                 )
-                self.logger.debug(self.response_trace(resp, None))
+                self._trace(resp, None)
                 if resp.status_code == 200:
                     if resp.json().get("isServerReady") is True:
                         self.logger.debug(f"Waiting for server ready took: {elapsed()} seconds.")
@@ -419,54 +490,234 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
                 sleep(poll_period)
                 continue
             except RequestException as exception:
-                self.logger.debug(self.response_trace(exception.response, exception.request))
+                self._trace(exception.response, exception.request)
                 raise ManagerRequestException(*exception.args)
 
+        self._limiter.record_overload()
         raise ManagerReadyTimeout(f"Waiting for server ready took longer than {timeout} seconds.")
 
     def request(self, method, url, *args, **kwargs) -> ManagerResponse:
+        """Sends request and repeats it on transient failures according to retry policy.
+        Besides regular requests.Session.request arguments accepts 'retry' keyword (Optional[bool])
+        which overrides retry policy decision based on HTTP method (eg. to retry idempotent POST request).
+        GET requests are served from response cache and coalesced by single flight when these are enabled.
+        """
+        _kwargs = dict(kwargs)
+        retry = _kwargs.pop("retry", None)
+        cache = self.response_cache
+        if method.upper() not in CACHEABLE_METHODS:
+            if cache is None:
+                return self._request_with_retry(method, url, retry, *args, **_kwargs)
+            try:
+                return self._request_with_retry(method, url, retry, *args, **_kwargs)
+            finally:
+                cache.invalidate(self.get_full_url(url))
+        if args or _kwargs.get("stream") or (cache is None and self.single_flight is None):
+            return self._request_with_retry(method, url, retry, *args, **_kwargs)
+        headers = _kwargs.get("headers")
+        key = ResponseCache.key(
+            method,
+            self.get_full_url(url),
+            _kwargs.get("params"),
+            merge_setting(headers, self.headers, dict_class=CaseInsensitiveDict),
+            self.subdomain,
+        )
+        validators: Dict[str, str] = {}
+        if cache is not None:
+            cached, validators = cache.get(key)
+            if cached is not None:
+                return cached
+            if validators:
+                _kwargs["headers"] = {**validators, **(headers or {})}
+        response = self._send_cacheable(method, url, retry, key, **_kwargs)
+        if cache is None:
+            return response
+        response = cache.put(key, response)
+        if response.status_code == 304 and validators:
+            # entry was evicted while revalidating, whole representation is requested again
+            _kwargs["headers"] = headers
+            response = cache.put(key, self._send_cacheable(method, url, retry, key, **_kwargs))
+        return response
+
+    def _send_cacheable(self, method, url, retry: Optional[bool], key: CacheKey, **kwargs) -> ManagerResponse:
+        if self.single_flight is not None and not REQUEST_BODY_ARGS.intersection(kwargs):
+            # identical requests are coalesced only within the same authentication context
+            flight_key = (*key, freeze(kwargs.get("headers")), id(self._auth), self.subdomain)
+            send = partial(self._request_with_retry, method, url, retry, **kwargs)
+            return self.single_flight.do(flight_key, send)
+        return self._request_with_retry(method, url, retry, **kwargs)
+
+    def _request_with_retry(self, method, url, retry: Optional[bool], *args, **kwargs) -> ManagerResponse:
+        if self.metrics is None:
+            return self.retry_policy.execute(
+                lambda: self._send_request(method, url, *args, **kwargs), method=method, url=url, retry=retry
+            )
+        attempts = 0
+
+        def send() -> ManagerResponse:
+            nonlocal attempts
+            attempts += 1
+            return self._send_request(method, url, *args, **kwargs)
+
+        try:
+            return self.retry_policy.execute(send, method=method, url=url, retry=retry)
+        finally:
+            if attempts > 1 and self.metrics is not None:
+                self.metrics.record_retries(self._endpoint(method, url), method.upper(), attempts - 1)
+
+    def _endpoint(self, method: str, url: str) -> str:
+        """Name of endpoint for metrics: decorated APIEndpoints method or method and url path"""
+        return current_endpoint.get() or f"{method.upper()} {urlparse(self.get_full_url(url)).path}"
+
+    def _record(
+        self,
+        method: str,
+        url: str,
+        response: Optional[Response],
+        request: Union[Request, PreparedRequest, None],
+        limiter_wait: float,
+        latency: float,
+        error: Optional[str] = None,
+    ) -> None:
+        if self.metrics is None:
+            return
+        body = getattr(request, "body", None)
+        request_bytes = len(body.encode() if isinstance(body, str) else body) if isinstance(body, (str, bytes)) else 0
+        response_bytes = 0
+        if response is not None:
+            content = response.__dict__.get("_content")
+            if isinstance(content, bytes):
+                response_bytes = len(content)
+            elif (length := response.headers.get("Content-Length", "")).isdigit():
+                response_bytes = int(length)
+        self.metrics.record_request(
+            RequestSample(
+                endpoint=self._endpoint(method, url),
+                method=method.upper(),
+                status_code=response.status_code if response is not None else None,
+                latency=latency,
+                limiter_wait=limiter_wait,
+                request_bytes=request_bytes,
+                response_bytes=response_bytes,
+                error=error,
+            )
+        )
+
+    @contextmanager
+    def response_caching(self, cache: Optional[ResponseCache] = None, **kwargs) -> Iterator[ResponseCache]:
+        """Enables GET response caching within the context (applies to all threads using this session).
+
+        Args:
+            cache: cache to be used, when not given new ResponseCache is created with remaining keyword arguments
+
+        Example:
+            >>> with session.response_caching(ttl=60) as cache:
+            ...     session.api.templates.attach(name, device)
+        """
+        previous = self.response_cache
+        self.response_cache = cache if cache is not None else ResponseCache(**kwargs)
+        try:
+            yield self.response_cache
+        finally:
+            self.response_cache = previous
+
+    def batch(
+        self,
+        max_workers: Optional[int] = None,
+        fail_fast: bool = False,
+        progress: Optional[BatchProgressCallback] = None,
+    ) -> Batch:
+        """Creates executor running API calls of this session concurrently (see Batch).
+
+        Example:
+            >>> with session.batch(progress=lambda done, total: print(f"{done}/{total}")) as batch:
+            ...     futures = [batch.submit(session.api.devices.get_device_details, uuid) for uuid in uuids]
+        """
+        return Batch(self, max_workers=max_workers, fail_fast=fail_fast, progress=progress)
+
+    def map(
+        self,
+        function: Callable[[Any], T],
+        items: Iterable[Any],
+        max_workers: Optional[int] = None,
+        fail_fast: bool = False,
+        progress: Optional[BatchProgressCallback] = None,
+        ordered: bool = True,
+    ) -> Iterator[BatchResult[T]]:
+        """Calls function for each item concurrently, yields BatchResult (value or captured error) per item.
+        Calls not started yet are cancelled when iteration is stopped early.
+
+        Example:
+            >>> for result in session.map(session.api.devices.get_device_details, uuids):
+            ...     print(result.item, result.value if result.ok else result.error)
+        """
+        with self.batch(max_workers=max_workers, fail_fast=fail_fast, progress=progress) as batch:
+            yield from batch.map(function, items, ordered=ordered)
+
+    def _send_request(self, method, url, *args, _auth_resends: int = 0, **kwargs) -> ManagerResponse:
         full_url = self.get_full_url(url)
         _kwargs = dict(kwargs)
         if self.request_timeout is not None:  # do not modify user provided kwargs unless property is set
             _kwargs.update(timeout=self.request_timeout)
+        generation = self._auth.generation
+        node = self.base_url
+        if (balancer := self.cluster_balancer) is not None and full_url.startswith(self.base_url):
+            if self.state == ManagerSessionState.OPERATIVE:
+                node = balancer.select(self.base_url, method, full_url)
+                full_url = node + full_url[len(self.base_url) :]
+        queued = begin = monotonic()
         try:
-            with self._limiter:
+            with self._limiter.acquire(full_url), balancer.track(node) if balancer else nullcontext():
+                begin = monotonic()
                 response = super(ManagerSession, self).request(method, full_url, *args, **_kwargs)
-            self.logger.debug(self.response_trace(response, None))
+            latency = monotonic() - begin
+            self._limiter.record_response(full_url, response.status_code, latency)
+            self._record(method, url, response, response.request, begin - queued, latency)
+            self._trace(response, None)
+            if balancer is not None and response.status_code in EJECT_STATUS_CODES:
+                balancer.eject(node, self.base_url, f"status-{response.status_code}")
             if self.state == ManagerSessionState.RESTART_IMMINENT and response.status_code == 503:
                 self.state = ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART
         except RequestException as exception:
-            self.logger.debug(self.response_trace(exception.response, exception.request))
+            self._record(
+                method,
+                url,
+                exception.response,
+                exception.request,
+                begin - queued,
+                monotonic() - begin,
+                type(exception).__name__,
+            )
+            self._trace(exception.response, exception.request)
+            if isinstance(exception, (ConnectionError, Timeout)):
+                self._limiter.record_overload()
+                if balancer is not None:
+                    balancer.eject(node, self.base_url, type(exception).__name__)
             if self.state == ManagerSessionState.RESTART_IMMINENT and isinstance(exception, ConnectionError):
                 self.state = ManagerSessionState.WAIT_SERVER_READY_AFTER_RESTART
-                return self.request(method, url, *args, **_kwargs)
+                return self._send_request(method, url, *args, **_kwargs)
             self.logger.debug(exception)
-            raise ManagerRequestException(*exception.args, request=exception.request, response=exception.response)
+            raise ManagerRequestException(
+                *exception.args, request=exception.request, response=exception.response
+            ) from exception
 
         self._last_request = response.request
-        if response.jsessionid_expired and self.state in [
+        if (response.jsessionid_expired or response.api_gw_unauthorized) and self.state in [
             ManagerSessionState.OPERATIVE,
             ManagerSessionState.LOGIN_IN_PROGRESS,
         ]:
-            # detected expired auth during login, resync
-            if self.state == ManagerSessionState.LOGIN_IN_PROGRESS:
-                self.state = ManagerSessionState.AUTH_SYNC
-            else:
-                self.logger.warning("Logging to session. Reason: expired JSESSIONID detected in response headers")
-                self.state = ManagerSessionState.LOGIN
-            return self.request(method, url, *args, **_kwargs)
-
-        if response.api_gw_unauthorized and self.state in [
-            ManagerSessionState.OPERATIVE,
-            ManagerSessionState.LOGIN_IN_PROGRESS,
-        ]:
-            # detected expired auth during login, resync
-            if self.state == ManagerSessionState.LOGIN_IN_PROGRESS:
-                self.state = ManagerSessionState.AUTH_SYNC
+            if _auth_resends >= MAX_AUTH_RESENDS:
+                raise ManagerRequestException(
+                    f"Request not authorized after {_auth_resends} logins", request=response.request, response=response
+                )
+            if balancer is not None and node != self.base_url:
+                # credentials are renewed on primary node, secondary node rejecting them is not used until recovered
+                balancer.eject(node, self.base_url, "authentication")
+            elif response.jsessionid_expired:
+                self._relogin(generation, "expired JSESSIONID detected in response headers")
             else:
-                self.logger.warning("Logging to API GW session. Reason: unauthorized detected in response headers")
-                self.state = ManagerSessionState.LOGIN
-            return self.request(method, url, *args, **_kwargs)
+                self._relogin(generation, "unauthorized detected in API GW response")
+            return self._send_request(method, url, *args, _auth_resends=_auth_resends + 1, **_kwargs)
 
         if response.request.url and "passwordReset.html" in response.request.url:
             raise DefaultPasswordError("Password must be changed to use this session.")
@@ -479,6 +730,9 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
             raise ManagerHTTPError(*error.args, error_info=error_info, request=error.request, response=error.response)
         return response
 
+    def _trace(self, response: Optional[Response], request: Union[Request, PreparedRequest, None]) -> None:
+        self.tracer.trace(self.logger, self.response_trace, response, request)
+
     def get_full_url(self, url_path: str) -> str:
         """Returns base API url plus given url path."""
         return urljoin(self.base_url, url_path)
@@ -498,25 +752,108 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
         response = self.get(url)
         return response.json()
 
-    def get_file(self, url: str, filename: Path) -> Response:
-        """Get a file using session get.
+    def get_file(
+        self,
+        url: str,
+        filename: Union[Path, str],
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        progress: Optional[DownloadProgressCallback] = None,
+        checksum: Optional[str] = None,
+        resume: bool = True,
+        max_resumes: int = 3,
+    ) -> Response:
+        """Downloads a file in chunks using session get, without loading whole content into memory.
+
+        Content is written to "<filename>.part" file which is atomically renamed to filename on completion.
+        When transfer is interrupted it is resumed with HTTP Range request, partial file left by failed call
+        is also resumed by next call for the same filename.
 
         Args:
             url: dataservice api.
             filename: Filename to write download file to.
+            chunk_size: size of chunks in bytes read from connection and written to file.
+            progress: called after each chunk with number of downloaded bytes and total size (None when unknown).
+            checksum: expected digest in "<algorithm>:<hexdigest>" format (eg. "sha256:9f86d0..."),
+                computed while downloading and verified before rename.
+            resume: resume interrupted transfers (when False partial file is discarded).
+            max_resumes: maximum number of resumes after connection breaks during single call.
 
         Returns:
-            http response.
+            http response of the last downloaded part, status is 206 (Partial Content) when download was resumed.
 
         Example usage:
-            response = self.session.get_file(url, filename)
+            response = self.session.get_file(url, filename, progress=lambda done, total: print(done, total))
 
         """
-        with self.get(url) as response:
-            with open(filename, "wb") as file:
-                file.write(response.content)
+        filename = Path(filename)
+        part = filename.with_name(filename.name + ".part")
+        if not resume:
+            part.unlink(missing_ok=True)
+        algorithm, _, expected_digest = checksum.partition(":") if checksum else ("", "", "")
+        resumes = 0
+        while True:
+            offset = part.stat().st_size if part.exists() else 0
+            try:
+                response, digest = self._download_part(url, part, offset, chunk_size, progress, algorithm)
+                break
+            except (ChunkedEncodingError, ConnectionError) as exception:
+                if not resume or resumes >= max_resumes:
+                    raise ManagerRequestException(*exception.args, request=exception.request) from exception
+                resumes += 1
+                self.logger.warning(f"Resuming download of {url} at byte {part.stat().st_size}. Reason: {exception}")
+        if digest is not None:
+            if digest != expected_digest.lower():
+                part.unlink(missing_ok=True)
+                raise DownloadChecksumError(f"{algorithm} checksum mismatch for {url}: {digest} != {expected_digest}")
+            self.logger.debug(f"Verified {algorithm} checksum of {filename}: {digest}")
+        replace(part, filename)
         return response
 
+    def _download_part(
+        self,
+        url: str,
+        part: Path,
+        offset: int,
+        chunk_size: int,
+        progress: Optional[DownloadProgressCallback],
+        algorithm: str,
+    ) -> Tuple[Response, Optional[str]]:
+        """Streams content starting at given offset to partial file, returns response and hexdigest of whole file"""
+        headers = {"Accept-Encoding": "identity"}  # range offsets must match bytes written to file
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        try:
+            response = self.get(url, stream=True, headers=headers)
+        except ManagerHTTPError as error:
+            if offset and error.response is not None and error.response.status_code == 416:
+                self.logger.warning(f"Server rejected range of partial download {part}, downloading from start")
+                part.unlink()
+                return self._download_part(url, part, 0, chunk_size, progress, algorithm)
+            raise
+        with response:
+            hasher = hashlib.new(algorithm) if algorithm else None
+            if response.status_code == 206:
+                total = _content_range_total(response.headers.get("Content-Range"))
+                mode = "ab"
+                if hasher is not None:
+                    with open(part, "rb") as existing:
+                        for chunk in iter(lambda: existing.read(chunk_size), b""):
+                            hasher.update(chunk)
+            else:
+                length = response.headers.get("Content-Length")
+                total = int(length) if length and length.isdigit() else None
+                offset, mode = 0, "wb"
+            downloaded = offset
+            with open(part, mode) as file:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    file.write(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
+                    downloaded += len(chunk)
+                    if progress is not None:
+                        progress(downloaded, total)
+        return response, hasher.hexdigest() if hasher is not None else None
+
     def get_tenant_id(self) -> str:
         """Gets tenant UUID for its subdomain.
 
@@ -531,9 +868,50 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
 
         return tenant.tenant_id
 
+    def create_tenant_session(self, subdomain: str, tenant_id: Optional[str] = None) -> ManagerSession:
+        """Creates provider as tenant session sharing credentials, request limiter and policies of this session.
+
+        Tenant view is selected with VSessionId header, no additional login is performed
+        and server info known by provider session is reused. HTTP connections are shared with provider session.
+
+        Args:
+            subdomain: subdomain of the tenant
+            tenant_id: tenant UUID (looked up by subdomain when not given)
+
+        Returns:
+            ManagerSession: provider as tenant session
+        """
+        auth = self._auth
+        if self.session_type is not SessionType.PROVIDER or not isinstance(auth, vManageAuth):
+            raise SessionNotCreatedError(
+                f"Session not created. Tenant session can be created only from logged provider session, not {self}"
+            )
+        session = ManagerSession(
+            base_url=self.base_url,
+            auth=ProviderAsTenantAuth(auth, subdomain, tenant_id),
+            subdomain=subdomain,
+            logger=self.logger,
+            request_limiter=self._limiter,
+            request_tracer=self.tracer,
+            retry_policy=self.retry_policy,
+            json_backend=self.json_backend,
+            single_flight=self.single_flight,
+            metrics=self.metrics,
+            validation_policy=self.validation_policy,
+        )
+        session.verify = self.verify
+        # reuse connections of provider session, closing tenant session closes them (reopened on demand)
+        session.adapters = self.adapters
+        session._sync_auth()
+        session.server_name = self.server_name
+        session.platform_version = self.platform_version
+        session._session_type = SessionType.PROVIDER_AS_TENANT
+        return session
+
     def logout(self) -> None:
         if self._added_to_auth:
             self._auth.decrease_session_count()
+            self._added_to_auth = False
         self._auth.logout(self)
 
     def close(self) -> None:
@@ -575,6 +953,15 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
     def validate_responses(self, value: bool):
         self._validate_responses = value
 
+    @property
+    def json_backend(self) -> Optional[JSONBackend]:
+        return self._json_backend
+
+    @json_backend.setter
+    def json_backend(self, backend: Optional[JSONBackend]) -> None:
+        self.json_loads = get_json_loads(backend) if backend is not None else None
+        self._json_backend = backend
+
     def __copy__(self) -> ManagerSession:
         return ManagerSession(
             base_url=self.base_url,
@@ -582,6 +969,14 @@ class ManagerSession(ManagerResponseAdapter, APIEndpointClient):
             subdomain=self.subdomain,
             logger=self.logger,
             request_limiter=self._limiter,
+            request_tracer=self.tracer,
+            retry_policy=self.retry_policy,
+            json_backend=self.json_backend,
+            response_cache=self.response_cache,
+            single_flight=self.single_flight,
+            cluster_balancer=self.cluster_balancer,
+            metrics=self.metrics,
+            validation_policy=self.validation_policy,
         )
 
     def __str__(self) -> str:
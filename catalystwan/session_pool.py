@@ -0,0 +1,160 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import RLock
+from time import monotonic
+from typing import Dict, List, Optional
+
+from catalystwan.exceptions import CatalystwanException, TenantSubdomainNotFound
+from catalystwan.session import ManagerSession
+
+
+@dataclass
+class PooledSession:
+    session: ManagerSession
+    checked: float
+
+
+class ManagerSessionPool:
+    """Keeps provider as tenant sessions created from single provider session, keyed by tenant subdomain.
+
+    Tenant sessions share provider credentials, request limiter, policies and HTTP connections
+    (see ManagerSession.create_tenant_session), tenant view is selected with VSessionId header
+    instead of a full login. Tenant list is fetched once for the pool.
+
+    At most 'max_sessions' are kept, least recently used session is evicted and logged out when limit is exceeded.
+    Session which was not used for 'health_check_interval' seconds is checked before being handed out
+    and replaced with a new one when the check fails.
+
+    Args:
+        provider: logged in provider session
+        max_sessions: maximum number of kept tenant sessions
+        health_check_interval: seconds after which idle session is checked before use (None - no checks)
+
+    Example:
+        >>> with create_manager_session(url=url, username=username, password=password) as provider:
+        ...     with ManagerSessionPool(provider, max_sessions=32) as pool:
+        ...         for tenant in provider.api.tenant_management.get():
+        ...             devices = pool.get(tenant.subdomain).api.devices.get()
+    """
+
+    def __init__(
+        self,
+        provider: ManagerSession,
+        max_sessions: int = 64,
+        health_check_interval: Optional[float] = 300.0,
+    ):
+        self.provider = provider
+        self.max_sessions = max_sessions
+        self.health_check_interval = health_check_interval
+        self._sessions: OrderedDict[str, PooledSession] = OrderedDict()
+        self._tenant_ids: Optional[Dict[str, str]] = None
+        self._lock: RLock = RLock()
+        self._counters: Dict[str, int] = {"created": 0, "reused": 0, "evicted": 0, "unhealthy": 0}
+
+    def get(self, subdomain: str) -> ManagerSession:
+        """Returns session for tenant with given subdomain, creates it when not present in the pool"""
+        with self._lock:
+            if (pooled := self._sessions.get(subdomain)) is None:
+                return self._create(subdomain)
+            self._sessions.move_to_end(subdomain)
+            self._counters["reused"] += 1
+        interval = self.health_check_interval
+        if interval is None or monotonic() - pooled.checked < interval or self._healthy(pooled):
+            return pooled.session
+        with self._lock:
+            self._counters["unhealthy"] += 1
+            if self._sessions.get(subdomain) is pooled:
+                del self._sessions[subdomain]
+                self._logout(pooled.session)
+            return self.get(subdomain)
+
+    def __getitem__(self, subdomain: str) -> ManagerSession:
+        return self.get(subdomain)
+
+    def tenant_id(self, subdomain: str) -> str:
+        """Returns tenant UUID for subdomain, tenant list is fetched again only when subdomain is not known"""
+        with self._lock:
+            if self._tenant_ids is None or subdomain not in self._tenant_ids:
+                tenants = self.provider.endpoints.tenant_management.get_all_tenants()
+                self._tenant_ids = {t.subdomain: t.tenant_id for t in tenants if t.subdomain and t.tenant_id}
+            if (tenant_id := self._tenant_ids.get(subdomain)) is None:
+                raise TenantSubdomainNotFound(f"Tenant ID for sub-domain: {subdomain} not found")
+            return tenant_id
+
+    def _create(self, subdomain: str) -> ManagerSession:
+        session = self.provider.create_tenant_session(subdomain, self.tenant_id(subdomain))
+        self._sessions[subdomain] = PooledSession(session, monotonic())
+        self._counters["created"] += 1
+        while len(self._sessions) > self.max_sessions:
+            _, evicted = self._sessions.popitem(last=False)
+            self._counters["evicted"] += 1
+            self._logout(evicted.session)
+        return session
+
+    def _healthy(self, pooled: PooledSession) -> bool:
+        try:
+            pooled.session.get("/dataservice/client/about")
+        except CatalystwanException as error:
+            self.provider.logger.warning(f"Health check of {pooled.session.subdomain} session failed: {error}")
+            return False
+        pooled.checked = monotonic()
+        return True
+
+    def _logout(self, session: ManagerSession) -> None:
+        # connections are shared with provider session, so tenant session is logged out but not closed
+        try:
+            session.logout()
+        except CatalystwanException as error:
+            self.provider.logger.warning(f"Logout of {session.subdomain} session failed: {error}")
+
+    def check_health(self) -> Dict[str, bool]:
+        """Checks all sessions in the pool, unhealthy sessions are evicted. Returns health per subdomain"""
+        with self._lock:
+            pooled_sessions = list(self._sessions.items())
+        health = {subdomain: self._healthy(pooled) for subdomain, pooled in pooled_sessions}
+        for subdomain, healthy in health.items():
+            if not healthy and self.evict(subdomain):
+                with self._lock:
+                    self._counters["unhealthy"] += 1
+        return health
+
+    def evict(self, subdomain: str) -> bool:
+        """Removes and logs out session of given tenant, returns False when session was not in the pool"""
+        with self._lock:
+            if (pooled := self._sessions.pop(subdomain, None)) is None:
+                return False
+            self._logout(pooled.session)
+            return True
+
+    def close(self) -> None:
+        """Logs out all tenant sessions, provider session is left open"""
+        with self._lock:
+            for subdomain in list(self._sessions):
+                self.evict(subdomain)
+
+    @property
+    def subdomains(self) -> List[str]:
+        """Subdomains of pooled sessions, from least to most recently used"""
+        return list(self._sessions)
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Snapshot of counters: 'created', 'reused', 'evicted' and 'unhealthy' sessions"""
+        with self._lock:
+            return dict(self._counters)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, subdomain: object) -> bool:
+        return subdomain in self._sessions
+
+    def __enter__(self) -> ManagerSessionPool:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
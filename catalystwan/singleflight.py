@@ -0,0 +1,79 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+from threading import Event, Lock
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done: Event = Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.waiters: int = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key, so only one of them is executed.
+
+    First caller for a key (leader) executes the function, callers arriving while it is in progress wait
+    for the leader and receive the same result (or exception). Waiting callers do not execute anything,
+    so they do not hold request limiter slots. Key is released as soon as the leader finishes,
+    results are never reused by later calls (see ResponseCache for caching).
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> session = ManagerSession(base_url=url, auth=auth, single_flight=flight)
+        >>> with ThreadPoolExecutor(8) as pool:
+        ...     organizations = list(pool.map(lambda _: session.endpoints.configuration_settings.get_organizations(),
+        ...                                   range(8)))
+        >>> flight.counters
+        {'executed': 1, 'coalesced': 7}
+    """
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self._calls: Dict[Hashable, _Call[Any]] = {}
+        self._counters: Dict[str, int] = {"executed": 0, "coalesced": 0}
+
+    def do(self, key: Hashable, function: Callable[[], T]) -> T:
+        """Executes function or waits for result of identical call already in progress"""
+        with self._lock:
+            if (call := self._calls.get(key)) is not None:
+                call.waiters += 1
+                self._counters["coalesced"] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._counters["executed"] += 1
+                leader = True
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+        try:
+            call.result = function()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        """Snapshot of counters: 'executed' calls and 'coalesced' callers which reused result of other call"""
+        with self._lock:
+            return dict(self._counters)
@@ -0,0 +1,17 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Offline stand-in for SDWAN Manager and record/replay of its responses, for tests and benchmarks"""
+
+from catalystwan.testing.cassette import Cassette, CassetteRecorder, Interaction, scrub
+from catalystwan.testing.server import FakeManager, FakeRequest, error_response, json_response
+
+__all__ = [
+    "Cassette",
+    "CassetteRecorder",
+    "FakeManager",
+    "FakeRequest",
+    "Interaction",
+    "error_response",
+    "json_response",
+    "scrub",
+]
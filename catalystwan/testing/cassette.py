@@ -0,0 +1,196 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+import json
+import re
+from base64 import b64decode, b64encode
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Pattern, Union
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from requests import Response
+
+if TYPE_CHECKING:
+    from catalystwan.session import ManagerSession
+
+SCRUBBED = "<scrubbed>"
+SCRUBBED_HEADERS = {"authorization", "cookie", "set-cookie", "vsessionid", "x-xsrf-token"}
+SENSITIVE_KEYS: Pattern[str] = re.compile(
+    r"pass(word|phrase)|secret|token|credential|community|psk|private.?key|api.?key", re.I
+)
+# regenerated by server when interaction is played back
+UNRECORDED_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "date",
+    "keep-alive",
+    "server",
+    "transfer-encoding",
+}
+UNRECORDED_PATHS = ("/j_security_check", "/dataservice/client/token", "/logout")
+
+
+def scrub(value: Any, keys: Pattern[str] = SENSITIVE_KEYS) -> Any:
+    """Replaces values of JSON object members with names matching 'keys' pattern (recursively)"""
+    if isinstance(value, dict):
+        return {k: SCRUBBED if keys.search(k) and v not in (None, "") else scrub(v, keys) for k, v in value.items()}
+    if isinstance(value, list):
+        return [scrub(item, keys) for item in value]
+    return value
+
+
+def scrub_query(query: str, keys: Pattern[str] = SENSITIVE_KEYS) -> str:
+    params = parse_qsl(query, keep_blank_values=True)
+    return urlencode([(k, SCRUBBED if keys.search(k) else v) for k, v in params])
+
+
+@dataclass
+class Interaction:
+    """Recorded request-response exchange, body is UTF-8 text or base64 encoded bytes"""
+
+    method: str
+    path: str
+    status: int
+    body: str = ""
+    query: str = ""
+    headers: Dict[str, str] = field(default_factory=dict)
+    base64: bool = False
+    latency: float = 0.0
+
+    @property
+    def content(self) -> bytes:
+        return b64decode(self.body) if self.base64 else self.body.encode()
+
+    @classmethod
+    def from_response(cls, response: Response, keys: Pattern[str] = SENSITIVE_KEYS) -> Interaction:
+        """Creates interaction from response of sent request, secrets are scrubbed from headers and JSON body"""
+        request = response.request
+        url = urlparse(request.url or "")
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in SCRUBBED_HEADERS | UNRECORDED_HEADERS}
+        content = response.content or b""
+        body, base64 = "", False
+        if "json" in headers.get("Content-Type", ""):
+            try:
+                body = json.dumps(scrub(json.loads(content), keys))
+            except ValueError:
+                pass
+        if not body and content:
+            try:
+                body = content.decode()
+            except UnicodeDecodeError:
+                body, base64 = b64encode(content).decode(), True
+        return cls(
+            method=str(request.method).upper(),
+            path=url.path,
+            query=scrub_query(url.query, keys),
+            status=response.status_code,
+            headers=headers,
+            body=body,
+            base64=base64,
+            latency=response.elapsed.total_seconds(),
+        )
+
+
+class Cassette:
+    """Ordered collection of recorded interactions, played back by FakeManager.
+
+    Interaction is matched by method, path and query, when no query matches any interaction with the same path is used.
+    Subsequent requests matching the same interactions get them in recorded order, the last one is repeated.
+
+    Example:
+        >>> cassette = Cassette.load("devices.json")
+        >>> with FakeManager(cassette=cassette) as manager:
+        ...     session = create_manager_session(url=manager.url, username="admin", password="admin")
+    """
+
+    def __init__(self, interactions: Optional[List[Interaction]] = None):
+        self.interactions: List[Interaction] = list(interactions or [])
+        self._played: Dict[tuple, int] = {}
+        self._lock: Lock = Lock()
+
+    def add(self, interaction: Interaction) -> None:
+        with self._lock:
+            self.interactions.append(interaction)
+
+    def match(self, method: str, path: str, query: str = "") -> Optional[Interaction]:
+        """Returns next recorded interaction for the request, None when nothing was recorded"""
+        query = urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+        with self._lock:
+            for key in ((method, path, query), (method, path, None)):
+                candidates = [i for i in self.interactions if self._matches(i, *key)]
+                if candidates:
+                    played = self._played.get(key, 0)
+                    self._played[key] = played + 1
+                    return candidates[min(played, len(candidates) - 1)]
+        return None
+
+    @staticmethod
+    def _matches(interaction: Interaction, method: str, path: str, query: Optional[str]) -> bool:
+        if interaction.method != method or interaction.path != path:
+            return False
+        if query is None:
+            return True
+        return urlencode(sorted(parse_qsl(interaction.query, keep_blank_values=True))) == query
+
+    def rewind(self) -> None:
+        """Starts playback from the first recorded interactions"""
+        with self._lock:
+            self._played.clear()
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def save(self, path: Union[str, Path]) -> None:
+        with self._lock:
+            data = {"interactions": [asdict(interaction) for interaction in self.interactions]}
+        Path(path).write_text(json.dumps(data, indent=2))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> Cassette:
+        data = json.loads(Path(path).read_text())
+        return cls([Interaction(**interaction) for interaction in data["interactions"]])
+
+
+class CassetteRecorder:
+    """Records exchanges of ManagerSession into cassette (login and logout exchanges are not recorded).
+
+    Values of headers carrying credentials and JSON members with names matching 'keys' pattern
+    (passwords, secrets, tokens) are replaced with '<scrubbed>'. Streamed responses (file downloads) are skipped.
+
+    Example:
+        >>> with CassetteRecorder(session) as recorder:
+        ...     session.endpoints.monitoring_device_details.list_all_devices()
+        >>> recorder.cassette.save("devices.json")
+    """
+
+    def __init__(
+        self, session: ManagerSession, cassette: Optional[Cassette] = None, keys: Pattern[str] = SENSITIVE_KEYS
+    ):
+        self.session = session
+        self.cassette = cassette if cassette is not None else Cassette()
+        self.keys = keys
+
+    def __call__(self, response: Response, *args, **kwargs) -> Response:
+        # requests response hook, called with raw response before it is wrapped by ManagerResponse
+        path = urlparse(response.url).path
+        if not kwargs.get("stream") and not path.endswith(UNRECORDED_PATHS):
+            self.cassette.add(Interaction.from_response(response, self.keys))
+        return response
+
+    def start(self) -> None:
+        self.session.hooks["response"].append(self)
+
+    def stop(self) -> None:
+        if self in self.session.hooks["response"]:
+            self.session.hooks["response"].remove(self)
+
+    def __enter__(self) -> CassetteRecorder:
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
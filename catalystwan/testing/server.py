@@ -0,0 +1,327 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+from __future__ import annotations
+
+import json
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from random import Random
+from secrets import token_hex
+from threading import Lock, Thread
+from time import sleep
+from typing import Any, Callable, Dict, List, Mapping, Optional, Pattern, Union
+from urllib.parse import parse_qs, parse_qsl, urlparse
+
+from requests.structures import CaseInsensitiveDict
+
+from catalystwan.testing.cassette import Cassette, Interaction
+
+LOGIN_PAGE = "<html><head><title>Cisco vManage</title></head><body>login</body></html>"
+EXPIRED_COOKIE = "JSESSIONID=expired; Expires=Thu, 01 Jan 1970 00:00:00 GMT; Path=/"
+DEFAULT_SERVER_INFO: Dict[str, Any] = {
+    "server": "vmanage-fake",
+    "platformVersion": "20.12.1",
+    "tenancyMode": "SingleTenant",
+    "userMode": "tenant",
+    "viewMode": "tenant",
+    "roles": ["netadmin"],
+}
+
+
+@dataclass
+class FakeRequest:
+    """Request received by FakeManager, passed to route handlers (headers are case-insensitive)"""
+
+    method: str
+    path: str
+    query: str
+    headers: Mapping[str, str]
+    body: bytes
+
+    @property
+    def params(self) -> Dict[str, List[str]]:
+        return parse_qs(self.query, keep_blank_values=True)
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+RouteHandler = Callable[[FakeRequest], Union[Interaction, Any]]
+
+
+@dataclass
+class Route:
+    method: str
+    pattern: Pattern[str]
+    handler: RouteHandler
+    latency: Optional[float] = None
+
+
+@dataclass
+class ErrorInjection:
+    """Fault returned instead of regular response: HTTP status or dropped connection when status is None"""
+
+    status: Optional[int]
+    rate: float
+    pattern: Pattern[str]
+    count: Optional[int] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def json_response(payload: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> Interaction:
+    return Interaction(
+        method="",
+        path="",
+        status=status,
+        body=json.dumps(payload),
+        headers={"Content-Type": "application/json", **(headers or {})},
+    )
+
+
+def error_response(status: int, message: str) -> Interaction:
+    return json_response({"error": {"message": message, "details": message, "code": f"HTTP{status}"}}, status)
+
+
+class FakeManager:
+    """Local stand-in for SDWAN Manager serving login flow, client info and recorded or programmed responses.
+
+    Server emulates form login (/j_security_check), XSRF token (/dataservice/client/token), server info
+    (/dataservice/client/server) and logout. Other requests must carry session cookie (expired session
+    is reported like SDWAN Manager does, so sessions re-login) and are answered by routes added with 'route'
+    or from cassette recorded by CassetteRecorder, unmatched requests get 404.
+    Latency is added to every response and faults can be injected to exercise retries and failover.
+
+    Args:
+        username: accepted username
+        password: accepted password
+        cassette: recorded interactions played back for requests not matched by routes
+        server_info: data returned by /dataservice/client/server (session type and platform version)
+        latency: seconds added to every response (besides login flow)
+        jitter: maximum random seconds added to latency
+        replay_latency: add latency recorded in cassette instead of 'latency'
+        seed: seed of random generator used by jitter and error injection (for reproducible runs)
+        port: listening port on 127.0.0.1 (0 - any free port)
+
+    Example:
+        >>> with FakeManager(cassette=Cassette.load("devices.json"), latency=0.05) as manager:
+        ...     manager.inject_error(503, rate=0.1)
+        ...     session = create_manager_session(url=manager.url, username="admin", password="admin")
+        ...     session.endpoints.monitoring_device_details.list_all_devices()
+    """
+
+    def __init__(
+        self,
+        username: str = "admin",
+        password: str = "admin",  # pragma: allowlist secret
+        cassette: Optional[Cassette] = None,
+        server_info: Optional[Dict[str, Any]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        replay_latency: bool = False,
+        seed: Optional[int] = None,
+        port: int = 0,
+    ):
+        self.username = username
+        self.password = password
+        self.cassette = cassette if cassette is not None else Cassette()
+        self.server_info: Dict[str, Any] = {**DEFAULT_SERVER_INFO, **(server_info or {})}
+        self.latency = latency
+        self.jitter = jitter
+        self.replay_latency = replay_latency
+        self.requests: Counter = Counter()
+        self.logins: int = 0
+        self._random = Random(seed)
+        self._routes: List[Route] = []
+        self._errors: List[ErrorInjection] = []
+        self._sessions: Dict[str, str] = {}
+        self._lock: Lock = Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def route(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        status: int = 200,
+        handler: Optional[RouteHandler] = None,
+        latency: Optional[float] = None,
+    ) -> None:
+        """Programs response for requests with given method and url path (regular expression matching whole path).
+
+        Response is JSON 'payload' with 'status' code or result of 'handler' called with FakeRequest
+        (Interaction used as is, other values are returned as JSON). 'latency' overrides server latency.
+        Routes added later take precedence.
+        """
+        if handler is None:
+            response = json_response(payload, status)
+
+            def handler(_: FakeRequest) -> Interaction:
+                return response
+
+        self._routes.insert(0, Route(method.upper(), re.compile(path), handler, latency))
+
+    def inject_error(
+        self,
+        status: Optional[int] = 503,
+        rate: float = 1.0,
+        path: str = ".*",
+        count: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Answers fraction ('rate') of requests matching 'path' with error status,
+        None drops connection without response. When 'count' is given, injection stops after that many errors.
+        """
+        self._errors.append(ErrorInjection(status, rate, re.compile(path), count, headers or {}))
+
+    def clear_errors(self) -> None:
+        self._errors.clear()
+
+    def expire_sessions(self) -> None:
+        """Invalidates all sessions, next requests are answered as with expired session cookie"""
+        with self._lock:
+            self._sessions.clear()
+
+    def start(self) -> FakeManager:
+        self._thread = Thread(target=self._server.serve_forever, args=(0.05,), name="fake-manager", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> FakeManager:
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def _login(self, request: FakeRequest) -> Interaction:
+        form = dict(parse_qsl(request.body.decode()))
+        if form.get("j_username") != self.username or form.get("j_password") != self.password:
+            return Interaction("", "", 200, LOGIN_PAGE, headers={"Content-Type": "text/html"})
+        jsessionid, token = token_hex(16), token_hex(32)
+        with self._lock:
+            self._sessions[jsessionid] = token
+            self.logins += 1
+        return Interaction("", "", 200, headers={"Set-Cookie": f"JSESSIONID={jsessionid}; Path=/; HttpOnly"})
+
+    def _session_token(self, request: FakeRequest) -> Optional[str]:
+        cookies = dict(
+            cookie.strip().split("=", 1) for cookie in request.headers.get("Cookie", "").split(";") if "=" in cookie
+        )
+        with self._lock:
+            return self._sessions.get(cookies.get("JSESSIONID", ""))
+
+    def _logout(self, request: FakeRequest) -> Interaction:
+        cookie = request.headers.get("Cookie", "")
+        with self._lock:
+            for jsessionid in [s for s in self._sessions if f"JSESSIONID={s}" in cookie]:
+                del self._sessions[jsessionid]
+        return Interaction("", "", 200, headers={"Set-Cookie": EXPIRED_COOKIE})
+
+    def _injected_error(self, request: FakeRequest) -> Optional[ErrorInjection]:
+        with self._lock:
+            for error in self._errors:
+                if error.count == 0 or not error.pattern.fullmatch(request.path):
+                    continue
+                if self._random.random() < error.rate:
+                    if error.count is not None:
+                        error.count -= 1
+                    return error
+        return None
+
+    def _delay(self, latency: Optional[float]) -> None:
+        delay = self.latency if latency is None else latency
+        if self.jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            sleep(delay)
+
+    def _dispatch(self, request: FakeRequest) -> Optional[Interaction]:
+        """Returns response for the request, None when connection should be dropped"""
+        path = request.path
+        with self._lock:
+            self.requests[(request.method, path)] += 1
+        if path == "/j_security_check" and request.method == "POST":
+            return self._login(request)
+        if path == "/logout":
+            return self._logout(request)
+        if path == "/dataservice/client/server/ready":
+            return json_response({"isServerReady": True})
+        if (token := self._session_token(request)) is None:
+            # SDWAN Manager answers requests with expired session with login page and expired cookie
+            headers = {"Content-Type": "text/html", "Set-Cookie": EXPIRED_COOKIE}
+            return Interaction("", "", 200, LOGIN_PAGE, headers=headers)
+        if path == "/dataservice/client/token":
+            return Interaction("", "", 200, token, headers={"Content-Type": "text/plain"})
+        if request.method not in ("GET", "HEAD") and request.headers.get("X-XSRF-TOKEN") != token:
+            return error_response(403, "Invalid XSRF token")
+        if (error := self._injected_error(request)) is not None:
+            self._delay(None)
+            if error.status is None:
+                return None
+            response = error_response(error.status, "Injected error")
+            response.headers.update(error.headers)
+            return response
+        if path == "/dataservice/client/server":
+            self._delay(None)
+            return json_response({"data": {**self.server_info, "CSRFToken": token}})
+        for route in self._routes:
+            if route.method == request.method and route.pattern.fullmatch(path):
+                self._delay(route.latency)
+                result = route.handler(request)
+                return result if isinstance(result, Interaction) else json_response(result)
+        if (interaction := self.cassette.match(request.method, path, request.query)) is not None:
+            self._delay(interaction.latency if self.replay_latency else None)
+            return interaction
+        self._delay(None)
+        return error_response(404, f"No response recorded for {request.method} {path}")
+
+    def _handler_class(self) -> type:
+        manager = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def handle_request(self) -> None:
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                request = FakeRequest(
+                    method=self.command,
+                    path=url.path,
+                    query=url.query,
+                    headers=CaseInsensitiveDict(self.headers.items()),
+                    body=self.rfile.read(length) if length else b"",
+                )
+                response = manager._dispatch(request)
+                if response is None:
+                    self.close_connection = True
+                    return
+                content = response.content
+                self.send_response(response.status)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                if self.command != "HEAD":
+                    self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = do_HEAD = handle_request
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
@@ -6,6 +6,8 @@ import unittest
 from pathlib import Path
 from unittest.mock import ANY, MagicMock, patch
 
+from parameterized import parameterized  # type: ignore
+
 from catalystwan.api.admin_tech_api import (
     AdminTechAPI,
     DownloadAdminTechLogError,
@@ -170,14 +172,15 @@ class TestAdminTechAPI(unittest.TestCase):
         with self.assertRaises(RequestTokenIdNotFound):
             AdminTechAPI(mock_session).delete("fake-filename.tar.gz", timeout=0.01, interval=0.01)
 
+    @parameterized.expand([(200,), (206,)])
     @patch("catalystwan.session.ManagerSession")
     @patch("catalystwan.response.ManagerResponse")
-    def test_download(self, mock_session, mock_response):
+    def test_download(self, status_code, mock_session, mock_response):
         # Arrange
         filename = self.admin_tech_generate_response["fileName"]
         mock_session.get_file.return_value = mock_response
         mock_session.get.return_value = mock_response
-        mock_response.status_code = 200
+        mock_response.status_code = status_code
         mock_response.content = self.download_file_content
         with tempfile.TemporaryDirectory() as tmpdir:
             # Act
@@ -0,0 +1,69 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from requests import Request
+
+from catalystwan.apigw_auth import ApiGwAuth, ApiGwLogin
+
+
+class TestApiGwAuth(unittest.TestCase):
+    def setUp(self):
+        login = ApiGwLogin(client_id="client", client_secret="secret", org_name="org", token_duration=10)
+        self.auth = ApiGwAuth(login, refresh_margin=60)
+        self.request = Request(method="GET", url="https://example.com/dataservice/device").prepare()
+
+    @patch("catalystwan.apigw_auth.monotonic", return_value=1000.0)
+    @patch.object(ApiGwAuth, "get_token", side_effect=["token1", "token2"])
+    def test_token_reused_before_refresh_margin(self, get_token_mock, monotonic_mock):
+        # Arrange
+        self.auth(self.request)
+        monotonic_mock.return_value = 1000.0 + 600 - 61
+        # Act
+        self.auth(self.request)
+        # Assert
+        assert get_token_mock.call_count == 1
+        assert self.request.headers["Authorization"] == "Bearer token1"
+        assert self.auth.generation == 1
+
+    @patch("catalystwan.apigw_auth.monotonic", return_value=1000.0)
+    @patch.object(ApiGwAuth, "get_token", side_effect=["token1", "token2"])
+    def test_token_refreshed_ahead_of_expiration(self, get_token_mock, monotonic_mock):
+        # Arrange
+        self.auth(self.request)
+        monotonic_mock.return_value = 1000.0 + 600 - 59
+        # Act
+        self.auth(self.request)
+        # Assert
+        assert get_token_mock.call_count == 2
+        assert self.request.headers["Authorization"] == "Bearer token2"
+        assert self.auth.generation == 2
+
+    def test_refresh_margin_limited_to_half_of_token_lifetime(self):
+        # Arrange
+        self.auth.refresh_margin = 3600
+        # Act
+        with patch.object(ApiGwAuth, "get_token", return_value="token"), patch(
+            "catalystwan.apigw_auth.monotonic", return_value=0.0
+        ):
+            self.auth(self.request)
+        # Assert
+        assert self.auth.token_expires == 300.0
+
+    @patch.object(ApiGwAuth, "get_token", return_value="token")
+    def test_headers_applied_without_lock(self, _):
+        # Arrange
+        self.auth(self.request)
+        self.auth.lock = MagicMock()
+        request = Request(method="GET", url="https://example.com/dataservice/device").prepare()
+        # Act
+        self.auth(request)
+        # Assert
+        self.auth.lock.__enter__.assert_not_called()
+        assert request.headers["Authorization"] == "Bearer token"
+        assert request.headers["sdwan-org"] == "org"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import asyncio
+import unittest
+from typing import List, Optional
+
+import httpx
+from pydantic import BaseModel
+from requests import PreparedRequest
+
+from catalystwan.async_session import AsyncManagerSession
+from catalystwan.endpoints import APIEndpoints, get
+from catalystwan.exceptions import ManagerHTTPError, ManagerRequestException
+from catalystwan.session import MAX_AUTH_RESENDS, ManagerSessionState
+from catalystwan.typed_list import DataSequence
+from catalystwan.utils.session_type import SessionType
+
+SERVER_INFO = {
+    "data": {
+        "server": "vmanage",
+        "tenancyMode": "SingleTenant",
+        "userMode": "tenant",
+        "viewMode": "tenant",
+        "platformVersion": "20.12.1",
+    }
+}
+SERVER_DATE = "Mon, 01 Jan 2024 00:00:00 GMT"
+EXPIRED_JSESSIONID = "JSESSIONID=old; Expires=Thu, 01 Jan 1970 00:00:00 GMT"
+
+
+class TokenAuth:
+    """Minimal auth object attaching token which changes after each clear"""
+
+    def __init__(self):
+        self.generation = 0
+        self.logins = 0
+        self.session_count = 0
+
+    def __call__(self, request: PreparedRequest) -> PreparedRequest:
+        request.headers["x-token"] = str(self.generation)
+        return request
+
+    def clear(self, last_request: Optional[PreparedRequest]) -> None:
+        if last_request is None or last_request.headers.get("x-token") == str(self.generation):
+            self.generation += 1
+            self.logins += 1
+
+    def logout(self, client) -> None:
+        pass
+
+    def increase_session_count(self) -> None:
+        self.session_count += 1
+
+    def decrease_session_count(self) -> None:
+        self.session_count -= 1
+
+
+class Item(BaseModel):
+    name: str
+
+
+class ExampleAPI(APIEndpoints):
+    @get("/items", "data")
+    def get_items(self) -> DataSequence[Item]:  # type: ignore [empty-body]
+        ...
+
+    @get("/broken")
+    def broken(self) -> None:
+        ...
+
+
+class TestAsyncManagerSession(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.auth = TokenAuth()
+        self.expire_token: Optional[str] = None
+        self.always_expired = False
+        self.requests: List[httpx.Request] = []
+        transport = httpx.MockTransport(self.handler)
+        self.session = AsyncManagerSession(
+            base_url="https://example.com",
+            auth=self.auth,  # type: ignore[arg-type]
+            http_client=httpx.AsyncClient(transport=transport),
+        )
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/dataservice/client/server":
+            return httpx.Response(200, json=SERVER_INFO)
+        if self.always_expired or request.headers.get("x-token") == self.expire_token:
+            return httpx.Response(200, json={}, headers={"set-cookie": EXPIRED_JSESSIONID, "date": SERVER_DATE})
+        if request.url.path == "/dataservice/items":
+            return httpx.Response(200, json={"data": [{"name": "a"}, {"name": "b"}]})
+        return httpx.Response(500, json={"error": {"message": "failed", "details": "details", "code": "X"}})
+
+    async def asyncTearDown(self):
+        await self.session.close()
+
+    async def test_login(self):
+        # Act
+        await self.session.login()
+        # Assert
+        assert self.session.state == ManagerSessionState.OPERATIVE
+        assert self.session.session_type == SessionType.SINGLE_TENANT
+        assert str(self.session.api_version) == "20.12"
+        assert self.auth.logins == 1
+
+    async def test_endpoint_returns_awaitable(self):
+        # Arrange
+        await self.session.login()
+        api = ExampleAPI(self.session)
+        # Act
+        items = await api.get_items()
+        # Assert
+        assert isinstance(items, DataSequence)
+        assert [item.name for item in items] == ["a", "b"]
+
+    async def test_expired_auth_single_login(self):
+        # Arrange
+        await self.session.login()
+        api = ExampleAPI(self.session)
+        self.expire_token = str(self.auth.generation)
+        # Act
+        results = await asyncio.gather(*[api.get_items() for _ in range(10)])
+        # Assert
+        assert all(len(items) == 2 for items in results)
+        assert self.auth.logins == 2
+
+    async def test_expired_auth_after_login_not_resent_without_limit(self):
+        # Arrange
+        await self.session.login()
+        api = ExampleAPI(self.session)
+        self.always_expired = True
+        # Act
+        with self.assertRaises(ManagerRequestException):
+            await api.get_items()
+        # Assert
+        items_requests = [request for request in self.requests if request.url.path == "/dataservice/items"]
+        assert len(items_requests) == MAX_AUTH_RESENDS + 1
+        assert self.auth.logins == MAX_AUTH_RESENDS + 1
+
+    async def test_http_error(self):
+        # Arrange
+        await self.session.login()
+        api = ExampleAPI(self.session)
+        # Act / Assert
+        with self.assertRaises(ManagerHTTPError) as context:
+            await api.broken()
+        assert context.exception.info.code == "X"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from threading import Event
+from typing import List, Tuple
+from unittest.mock import patch
+
+from requests import Response
+
+from catalystwan.batch import Batch
+from catalystwan.exceptions import ManagerHTTPError
+from catalystwan.request_limiter import RequestLimiter
+from catalystwan.session import ManagerSession
+from catalystwan.vmanage_auth import vManageAuth
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        auth = vManageAuth("admin", "admin")  # pragma: allowlist secret
+        auth.cookies.set("JSESSIONID", "session")
+        auth.xsrftoken = "token"
+        self.limiter = RequestLimiter(max_requests=4)
+        self.session = ManagerSession("https://example.com", auth=auth, request_limiter=self.limiter)
+        self.session.auth = auth
+        self.progress: List[Tuple[int, int]] = []
+
+    def send(self, request, **kwargs):
+        response = Response()
+        response.request = request
+        response.status_code = 404 if request.path_url.endswith("/missing") else 200
+        response._content = f'{{"data": "{request.path_url}"}}'.encode()
+        return response
+
+    def get_data(self, name: str):
+        return self.session.get_data(f"/dataservice/{name}")
+
+    @patch("requests.sessions.Session.send")
+    def test_map_captures_errors_and_keeps_order(self, send_mock):
+        # Arrange
+        send_mock.side_effect = self.send
+        items = ["device", "missing", "template", "policy"]
+        # Act
+        results = list(self.session.map(self.get_data, items, progress=lambda *p: self.progress.append(p)))
+        # Assert
+        assert [result.item for result in results] == items
+        assert [result.ok for result in results] == [True, False, True, True]
+        assert results[0].unwrap() == "/dataservice/device"
+        assert isinstance(results[1].error, ManagerHTTPError)
+        assert sorted(self.progress) == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+    def test_workers_capped_by_request_limiter(self):
+        assert Batch(self.session).max_workers == 4
+        assert Batch(self.session, max_workers=16).max_workers == 16
+
+    def test_fail_fast_cancels_remaining_calls(self):
+        # Arrange
+        release = Event()
+
+        def call(item):
+            if item == 0:
+                raise ValueError("failed")
+            release.wait(5)
+            return item
+
+        # Act
+        with self.session.batch(max_workers=1, fail_fast=True) as batch:
+            with self.assertRaises(ValueError):
+                list(batch.map(call, range(5)))
+            release.set()
+        # Assert
+        assert batch.counters == {"submitted": 5, "succeeded": 0, "failed": 1, "cancelled": 4}
+
+    def test_cancel(self):
+        # Arrange
+        started, release = Event(), Event()
+
+        def call(item):
+            started.set()
+            release.wait(5)
+            return item
+
+        # Act
+        with self.session.batch(max_workers=1) as batch:
+            futures = [batch.submit(call, item) for item in range(3)]
+            started.wait(5)
+            batch.cancel()
+            late = batch.submit(call, 3)
+            release.set()
+        # Assert
+        assert futures[0].result() == 0
+        assert all(future.cancelled() for future in futures[1:] + [late])
+        assert batch.counters["cancelled"] == 3
+
+    def test_unordered_map(self):
+        results = list(self.session.map(lambda item: item * 2, range(10), ordered=False))
+        assert sorted(result.value for result in results) == [i * 2 for i in range(10)]
+
+
+if __name__ == "__main__":
+    unittest.main()
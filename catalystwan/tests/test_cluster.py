@@ -0,0 +1,208 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from collections import Counter
+from unittest.mock import MagicMock, patch
+from urllib.parse import urlparse
+
+from requests import ConnectionError, Response
+
+from catalystwan.cluster import ClusterBalancer, node_url
+from catalystwan.endpoints.cluster_management import VManageHealthStatus
+from catalystwan.exceptions import ManagerRequestException
+from catalystwan.session import MAX_AUTH_RESENDS, ManagerSession, ManagerSessionState
+from catalystwan.typed_list import DataSequence
+from catalystwan.vmanage_auth import vManageAuth
+
+PRIMARY = "https://10.0.0.1:8443"
+NODES = ["https://10.0.0.2:8443", "https://10.0.0.3:8443"]
+EXPIRED_COOKIE = "JSESSIONID=expired; Expires=Thu, 01 Jan 1970 00:00:00 GMT"
+
+
+class TestClusterBalancer(unittest.TestCase):
+    def setUp(self):
+        self.balancer = ClusterBalancer(health_check_interval=None)
+        self.balancer.update(["10.0.0.2", "10.0.0.3"], PRIMARY)
+
+    def test_node_url(self):
+        assert node_url("10.0.0.2", PRIMARY) == NODES[0]
+        assert node_url("fd00::2", "https://[fd00::1]") == "https://[fd00::2]"
+        assert node_url("https://vmanage2.example.com/", PRIMARY) == "https://vmanage2.example.com"
+
+    def test_reads_spread_by_least_outstanding_requests(self):
+        # Arrange
+        busy = self.balancer.select(PRIMARY, "GET", "/dataservice/device")
+        # Act
+        with self.balancer.track(busy):
+            selected = [self.balancer.select(PRIMARY, "GET", "/dataservice/device") for _ in range(4)]
+        # Assert
+        assert busy == PRIMARY
+        assert selected == [NODES[0], NODES[1], NODES[0], NODES[1]]
+
+    def test_mutating_and_pinned_requests_sent_to_primary(self):
+        assert self.balancer.select(PRIMARY, "POST", "/dataservice/template/device") == PRIMARY
+        assert self.balancer.select(PRIMARY, "GET", "/dataservice/device/action/status/123") == PRIMARY
+        assert self.balancer.select(PRIMARY, "GET", "/dataservice/client/server") == PRIMARY
+
+    def test_ejected_node_skipped_until_healthy(self):
+        # Arrange
+        self.balancer.eject(NODES[0], PRIMARY, "ConnectionError")
+        self.balancer.eject(PRIMARY, PRIMARY, "ConnectionError")
+        # Act
+        selected = {self.balancer.select(PRIMARY, "GET", "/dataservice/device") for _ in range(4)}
+        with patch.object(ClusterBalancer, "probe", return_value=True):
+            health = self.balancer.check_health()
+        # Assert
+        assert selected == {PRIMARY, NODES[1]}
+        assert health == {NODES[0]: True, NODES[1]: True}
+        assert all(node.healthy for node in self.balancer.nodes)
+
+    def test_check_health_ejects_failing_node(self):
+        # Arrange
+        response = Response()
+        response.status_code = 200
+        response._content = b'{"isServerReady": false}'
+        # Act
+        with patch("catalystwan.cluster.get", return_value=response):
+            health = self.balancer.check_health()
+        # Assert
+        assert health == {NODES[0]: False, NODES[1]: False}
+        assert [node.healthy for node in self.balancer.nodes] == [True, False, False]
+
+    def test_discover(self):
+        # Arrange
+        session = MagicMock(base_url=PRIMARY)
+        session.endpoints.cluster_management.health_status_info.return_value = DataSequence(
+            VManageHealthStatus,
+            [
+                VManageHealthStatus(device_ip="10.0.0.1", application_server=True),
+                VManageHealthStatus(device_ip="10.0.0.2", application_server=True),
+                VManageHealthStatus(device_ip="10.0.0.3", application_server=False),
+            ],
+        )
+        # Act
+        nodes = ClusterBalancer().discover(session)
+        # Assert
+        assert nodes == [NODES[0]]
+
+    def test_discover_uses_management_addresses(self):
+        # Arrange
+        session = MagicMock(base_url=PRIMARY)
+        session.endpoints.cluster_management.health_status_info.return_value = DataSequence(
+            VManageHealthStatus,
+            [
+                VManageHealthStatus(device_ip="169.254.0.1", system_ip="1.1.1.1", application_server=True),
+                VManageHealthStatus(device_ip="169.254.0.2", system_ip="1.1.1.2", application_server=True),
+                VManageHealthStatus(device_ip="169.254.0.3", uuid="vmanage-3", application_server=True),
+            ],
+        )
+        addresses = {"1.1.1.1": "10.0.0.1", "1.1.1.2": "10.0.0.2", "vmanage-3": "10.0.0.3"}
+        # Act
+        nodes = ClusterBalancer().discover(session, addresses)
+        # Assert
+        assert nodes == NODES
+
+
+class TestSessionClusterBalancing(unittest.TestCase):
+    def setUp(self):
+        auth = vManageAuth("admin", "admin")  # pragma: allowlist secret
+        auth.cookies.set("JSESSIONID", "session")
+        auth.xsrftoken = "token"
+        self.session = ManagerSession(
+            PRIMARY, auth=auth, cluster_balancer=ClusterBalancer(NODES, health_check_interval=None)
+        )
+        self.session.auth = auth
+        self.hosts: Counter = Counter()
+        self.down = set()
+
+    def send(self, request, **kwargs):
+        host = urlparse(request.url).hostname
+        if host in self.down:
+            raise ConnectionError("connection refused")
+        self.hosts[(request.method, host)] += 1
+        response = Response()
+        response.request = request
+        response.status_code = 200
+        response._content = b"{}"
+        return response
+
+    @patch("catalystwan.retry_policy.sleep")
+    @patch("requests.sessions.Session.send")
+    def test_requests_balanced(self, send_mock, _):
+        # Arrange
+        send_mock.side_effect = self.send
+        # Act
+        for _ in range(3):
+            self.session.get("/dataservice/device")
+        self.session.post("/dataservice/device")
+        # Assert
+        assert self.hosts == {
+            ("GET", "10.0.0.1"): 1,
+            ("GET", "10.0.0.2"): 1,
+            ("GET", "10.0.0.3"): 1,
+            ("POST", "10.0.0.1"): 1,
+        }
+
+    @patch("catalystwan.retry_policy.sleep")
+    @patch("requests.sessions.Session.send")
+    def test_failed_node_ejected_and_request_repeated(self, send_mock, _):
+        # Arrange
+        send_mock.side_effect = self.send
+        self.down.add("10.0.0.2")
+        # Act
+        responses = [self.session.get("/dataservice/device") for _ in range(4)]
+        # Assert
+        assert all(response.status_code == 200 for response in responses)
+        assert ("GET", "10.0.0.2") not in self.hosts
+        assert [node.failures for node in self.session.cluster_balancer.nodes] == [0, 1, 0]
+
+    @patch("catalystwan.retry_policy.sleep")
+    @patch("requests.sessions.Session.send")
+    def test_node_rejecting_auth_ejected_and_request_repeated(self, send_mock, _):
+        # Arrange
+        def send(request, **kwargs):
+            response = self.send(request, **kwargs)
+            if urlparse(request.url).hostname == "10.0.0.2":
+                response.headers.update({"set-cookie": EXPIRED_COOKIE, "date": "Sat, 17 Oct 2026 00:00:00 GMT"})
+                response._content = b"<html>login</html>"
+            return response
+
+        send_mock.side_effect = send
+        # Act
+        responses = [self.session.get("/dataservice/device") for _ in range(4)]
+        # Assert
+        assert all(response.json() == {} for response in responses)
+        assert self.hosts[("GET", "10.0.0.2")] == 1
+        assert [node.healthy for node in self.session.cluster_balancer.nodes] == [True, False, True]
+        assert self.session.state == ManagerSessionState.OPERATIVE
+
+    @patch("requests.sessions.Session.send")
+    def test_request_not_resent_without_limit_when_auth_rejected(self, send_mock):
+        # Arrange
+        def send(request, **kwargs):
+            response = self.send(request, **kwargs)
+            response.headers.update({"set-cookie": EXPIRED_COOKIE, "date": "Sat, 17 Oct 2026 00:00:00 GMT"})
+            return response
+
+        send_mock.side_effect = send
+        # Act
+        with patch.object(self.session, "_relogin") as relogin_mock, self.assertRaises(ManagerRequestException):
+            self.session.post("/dataservice/device")
+        # Assert
+        assert self.hosts == {("POST", "10.0.0.1"): MAX_AUTH_RESENDS + 1}
+        assert relogin_mock.call_count == MAX_AUTH_RESENDS
+
+    @patch("requests.sessions.Session.send")
+    def test_requests_pinned_to_primary_when_not_operative(self, send_mock):
+        # Arrange
+        send_mock.side_effect = self.send
+        self.session._state = ManagerSessionState.LOGIN_IN_PROGRESS
+        # Act
+        for _ in range(3):
+            self.session.get("/dataservice/device")
+        # Assert
+        assert self.hosts == {("GET", "10.0.0.1"): 3}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,7 @@ import tempfile
 import unittest
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Union
+from typing import Dict, Iterator, List, Literal, Optional, Union
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
@@ -23,6 +23,7 @@ from catalystwan.endpoints import (
     CustomPayloadType,
     PreparedPayload,
     TypeSpecifier,
+    compile_url,
     delete,
     get,
 )
@@ -66,6 +67,7 @@ class TestAPIEndpoints(unittest.TestCase):
         self.session_mock.request = MagicMock(return_value=MagicMock())
         self.session_mock.api_version = None
         self.session_mock.session_type = None
+        self.session_mock.validation_policy = None
         self.endpoints = APIEndpoints(self.session_mock)
         self.dict_payload = {
             "id": "XYZ-189",
@@ -134,6 +136,31 @@ class TestAPIEndpoints(unittest.TestCase):
             assert supported_versions in log.output[0]
             assert current_version in log.output[0]
 
+    def test_versions_decorator_resolves_compatibility_once_per_version(self):
+        # Arrange
+        decorator = versions(supported_versions="<2.0", raises=True)
+        specifier = decorator.supported_versions
+        decorator.supported_versions = MagicMock()
+        decorator.supported_versions.__contains__.side_effect = lambda version: version in specifier
+
+        class ExampleAPI(APIEndpoints):
+            @decorator
+            def versions_decorated_method(self):
+                pass
+
+        api = ExampleAPI(self.session_mock)
+        # Act
+        for current_version in ["1.9", "1.9", "2.1", "1.9"]:
+            self.session_mock.api_version = Version(current_version)
+            for _ in range(3):
+                if current_version == "2.1":
+                    with self.assertRaises(APIVersionError):
+                        api.versions_decorated_method()
+                else:
+                    api.versions_decorated_method()
+        # Assert
+        assert decorator.supported_versions.__contains__.call_count == 2
+
     @parameterized.expand(
         [
             ({ProviderView}, ProviderView),
@@ -443,6 +470,27 @@ class TestAPIEndpoints(unittest.TestCase):
             headers={"content-type": "application/json"},
         )
 
+    def test_request_decorator_sends_through_endpoints_send(self):
+        # Arrange
+        sent = []
+
+        class TestAPI(APIEndpoints):
+            def _send(self, method, url, **kwargs):
+                sent.append((method, url))
+                return super()._send(method, url, **kwargs)
+
+            @request("GET", "/v1/data/{id}")
+            def get_data(self, id: str) -> None:  # type: ignore [empty-body]
+                ...
+
+        api = TestAPI(self.session_mock)
+        # Act
+        api.get_data("ID123")
+        api._request("GET", "/v1/other")
+        # Assert
+        assert sent == [("GET", "/v1/data/ID123"), ("GET", "/v1/other")]
+        self.session_mock.request.assert_called_with("GET", self.base_path + "/v1/other")
+
     def test_request_decorator_call_with_mixed_positional_arguments(self):
         # Arrange
         class TestAPI(APIEndpoints):
@@ -550,6 +598,24 @@ class TestAPIEndpoints(unittest.TestCase):
         self.session_mock.request.return_value.dataseq.assert_called_once()
         assert retval == self.basemodel_sequence_payload
 
+    def test_request_decorator_call_and_return_model_iterator(self):
+        # Arrange
+        class TestAPI(APIEndpoints):
+            @request("GET", "/v1/items", "data")
+            def get_data(self) -> Iterator[BaseModelExample]:  # type: ignore [empty-body]
+                ...
+
+        self.session_mock.request.return_value.dataiter = MagicMock(return_value=iter(self.basemodel_sequence_payload))
+        api = TestAPI(self.session_mock)
+        # Act
+        retval = api.get_data()
+        # Assert
+        self.session_mock.request.assert_called_once_with("GET", self.base_path + "/v1/items", stream=True)
+        self.session_mock.request.return_value.dataiter.assert_called_once_with(
+            BaseModelExample, "data", validate=self.session_mock.validate_responses
+        )
+        assert list(retval) == self.basemodel_sequence_payload
+
     def test_request_decorator_call_and_return_str(self):
         # Arrange
         expected = "This is String!"
@@ -799,6 +865,27 @@ class TestAPIEndpoints(unittest.TestCase):
         # Assert
         self.session_mock.request.assert_called_once_with("GET", self.base_path + "/v1/data/orange", data="not a fruit")
 
+    @parameterized.expand(
+        [
+            ("",),
+            ("/v1/data",),
+            ("/v1/data/{id}",),
+            ("{id}/items/{category}",),
+            ("/v1/{{literal}}/{id}/{{literal}}",),
+            ("/v1/{id}/{category!r}/{id:>8}",),
+        ]
+    )
+    def test_compile_url(self, url):
+        class FruitEnum(str, Enum):
+            ORANGE = "orange"
+
+        for kwargs in [{"id": "ID123", "category": FruitEnum.ORANGE}, {"id": uuid4()}]:
+            # Act
+            formatted_url = compile_url(url)(kwargs)
+            # Assert
+            values = {name: value.value if isinstance(value, Enum) else str(value) for name, value in kwargs.items()}
+            assert formatted_url == url.format_map({"category": "None", **values})
+
     def test_request_decorator_format_url_with_uuid(self):
         test_uuid = uuid4()
 
@@ -0,0 +1,59 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from threading import Thread
+from traceback import extract_stack
+from typing import Any, Dict
+from unittest.mock import patch
+
+from catalystwan import Caller, get_external_caller, get_first_external_stack_frame, with_proc_info_header
+
+# code compiled with file name outside of the package stands for user script calling the SDK
+EXTERNAL_SCRIPT = """
+def user_function():
+    result["value"] = sdk_function()
+"""
+
+
+@with_proc_info_header
+def sdk_function() -> str:
+    return "body"
+
+
+def run_external(target: Any) -> Dict[str, Any]:
+    """Runs 'target' called by external user_function in new thread (so no package frames are below)"""
+    result: Dict[str, Any] = {}
+    namespace: Dict[str, Any] = {"sdk_function": target, "result": result}
+    exec(compile(EXTERNAL_SCRIPT, "/home/user/script.py", "exec"), namespace)
+    thread = Thread(target=namespace["user_function"])
+    thread.start()
+    thread.join()
+    return result
+
+
+class TestExternalCaller(unittest.TestCase):
+    def test_caller_of_outermost_package_frame(self):
+        # Act
+        result = run_external(lambda: (get_external_caller(), get_first_external_stack_frame(extract_stack())))
+        # Assert
+        caller, frame_summary = result["value"]
+        assert caller == Caller("/home/user/script.py", 3, "user_function")
+        assert (caller.filename, caller.lineno, caller.function) == (
+            frame_summary.filename,
+            frame_summary.lineno,
+            frame_summary.name,
+        )
+
+    @patch("linecache.checkcache", side_effect=AssertionError("source lines read"))
+    @patch("linecache.getline", side_effect=AssertionError("source lines read"))
+    def test_proc_info_header(self, *_):
+        # Act
+        result = run_external(sdk_function)
+        # Assert
+        header, body = result["value"].splitlines()
+        assert header.endswith(" /home/user/script.py:3 user_function(...)")
+        assert body == "body"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import unittest
+from json import JSONDecodeError
+from typing import Any, List
+
+from parameterized import parameterized  # type: ignore
+
+from catalystwan.utils.json_stream import iter_json_array
+
+DOCUMENT = {
+    "header": {"columns": [{"title": "}]", "property": "id"}], "generatedOn": 1700000000000},
+    "data": [{"id": i, "name": f'żółw "{i}"', "ratio": -1.25e-5 * i, "up": i % 2 == 0} for i in range(20)],
+    "trailing": [1, 2, 3],
+}
+
+
+def chunked(document: Any, size: int) -> List[bytes]:
+    content = json.dumps(document, ensure_ascii=False).encode()
+    return [content[start : start + size] for start in range(0, len(content), size)]
+
+
+class TestJsonStream(unittest.TestCase):
+    @parameterized.expand([(1,), (2,), (3,), (7,), (64,), (1 << 16,)])
+    def test_items_under_sourcekey(self, chunk_size):
+        # Act
+        items = list(iter_json_array(chunked(DOCUMENT, chunk_size), "data"))
+        # Assert
+        assert items == DOCUMENT["data"]
+
+    @parameterized.expand([(1,), (3,), (64,)])
+    def test_top_level_array(self, chunk_size):
+        # Arrange
+        document = [123456789, 1.5e-7, -0.5, True, None, "text", {"a": [1]}, 10]
+        # Act
+        items = list(iter_json_array(chunked(document, chunk_size), None))
+        # Assert
+        assert items == document
+
+    @parameterized.expand(
+        [
+            ({"data": []}, []),
+            ({}, []),
+            ({"other": [1]}, []),
+            ({"data": None}, []),
+            ({"data": {"id": 1}}, [{"id": 1}]),
+        ]
+    )
+    def test_document_without_items(self, document, expected):
+        assert list(iter_json_array(chunked(document, 3), "data")) == expected
+
+    def test_empty_body(self):
+        assert list(iter_json_array([b"", b" \n"], "data")) == []
+
+    def test_stops_reading_after_array(self):
+        # Arrange
+        chunks = iter(chunked(DOCUMENT, 16))
+        # Act
+        items = list(iter_json_array(chunks, "data"))
+        # Assert
+        assert len(items) == 20
+        assert next(chunks, None) is not None
+
+    @parameterized.expand(
+        [
+            (b'{"data": [1, 2',),
+            (b'{"data": [1 2]}',),
+            (b'{"data" [1]}',),
+            (b'{"data": [1,]}',),
+            (b"[1]",),
+        ]
+    )
+    def test_malformed_document(self, content: bytes):
+        with self.assertRaises(JSONDecodeError):
+            list(iter_json_array([content[:5], content[5:]], "data"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import subprocess
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+from catalystwan.api.api_container import APIContainer
+from catalystwan.endpoints.endpoints_container import APIEndpointContainter
+
+# seconds, cumulative import time of catalystwan.session reported by -X importtime (about 0.3s on developer machine)
+IMPORT_BUDGET = 1.5
+
+PROBE = """
+import json, sys
+from unittest.mock import MagicMock
+
+import catalystwan
+from catalystwan.api.api_container import APIContainer
+from catalystwan.endpoints.endpoints_container import APIEndpointContainter
+
+APIContainer(MagicMock())
+APIEndpointContainter(MagicMock())
+print(json.dumps({
+    "modules": [m for m in sys.modules if m.startswith("catalystwan")],
+    "package_sources_listed": catalystwan.package_sources.cache_info().currsize,
+}))
+"""
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_containers_do_not_import_api_modules(self):
+        # Act
+        probe = json.loads(run_python("-c", PROBE).stdout)
+        # Assert
+        assert "catalystwan.api.template_api" not in probe["modules"]
+        assert "catalystwan.endpoints.configuration.policy.list.app" not in probe["modules"]
+        assert not [m for m in probe["modules"] if m.startswith("catalystwan.models.policy")]
+        assert probe["package_sources_listed"] == 0
+
+    def test_import_time_budget(self):
+        # Act
+        report = run_python("-X", "importtime", "-c", "import catalystwan.session").stderr
+        # Assert
+        lines = [line.split("|") for line in report.splitlines() if line.startswith("import time:")]
+        cumulative = {name.strip(): int(us) for _, us, name in lines[1:]}
+        assert cumulative["catalystwan.session"] / 1e6 < IMPORT_BUDGET
+
+    def test_container_attributes_created_once(self):
+        # Arrange
+        session = MagicMock()
+        api = APIContainer(session)
+        # Act
+        templates = api.templates
+        # Assert
+        assert api.templates is templates
+        assert templates.session is session
+        assert "templates" in dir(api)
+
+    def test_load_all_creates_nested_containers(self):
+        # Arrange
+        endpoints = APIEndpointContainter(MagicMock())
+        # Act
+        endpoints.load_all()
+        # Assert
+        assert "list" in vars(endpoints.configuration.policy)
+        assert "app" in vars(endpoints.configuration.policy.list)
+        assert "sdwan" in vars(endpoints.configuration.feature_profile)
+
+    def test_lazy_package_exports(self):
+        # Arrange
+        from catalystwan.models import policy
+
+        namespace: dict = {}
+        # Act
+        exec("from catalystwan.models.policy import *", namespace)
+        # Assert
+        assert set(policy.__all__) <= set(namespace)
+        assert policy.TrafficDataPolicy is namespace["TrafficDataPolicy"]
+        with self.assertRaises(AttributeError):
+            policy.NotAPolicy
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,42 @@
 # Copyright 2023 Cisco Systems, Inc. and its affiliates
 
+import json
 import unittest
 from pathlib import Path
+from typing import Any, Dict, List
 from unittest.mock import patch
 
 from parameterized import parameterized  # type: ignore
+from requests import Response
 
 from catalystwan.api.logs_api import LogsAPI
+from catalystwan.endpoints.monitoring.audit_log import AuditLogEntry, MonitoringAuditLog
+from catalystwan.response import ManagerResponse
+
+
+class AuditLogClient:
+    """Serves audit log entries one per page, next page is addressed by scroll id"""
+
+    api_version = None
+    session_type = None
+    validate_responses = True
+
+    def __init__(self, logs: List[Dict[str, Any]]):
+        self.logs = logs
+        self.requests: List[Dict[str, Any]] = []
+
+    def request(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        self.requests.append(dict(kwargs, method=method, url=url))
+        index = int(kwargs["params"].get("scrollId", 0))
+        has_more_data = index + 1 < len(self.logs)
+        document = {
+            "data": self.logs[index : index + 1],
+            "pageInfo": {"scrollId": str(index + 1), "hasMoreData": has_more_data, "count": 1},
+        }
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps(document).encode()
+        return ManagerResponse(response)
 
 
 class TestLogsAPI(unittest.TestCase):
@@ -19,7 +49,9 @@ class TestLogsAPI(unittest.TestCase):
     @patch("catalystwan.session.ManagerSession")
     def test_get_auditlogs_file_path_not_provided(self, mock_session):
         # Arrange
-        mock_session.get_data.return_value = self.logs
+        mock_session.endpoints.monitoring_audit_log.get_audit_logs.return_value = iter(
+            AuditLogEntry(**log) for log in self.logs
+        )
         default_file_path = Path(__file__).parents[1].joinpath("api").joinpath("audit.log")
         # Act
         LogsAPI(mock_session).get_auditlogs()
@@ -31,10 +63,29 @@ class TestLogsAPI(unittest.TestCase):
     @patch("catalystwan.session.ManagerSession")
     def test_get_auditlogs_file_path(self, file_name, mock_session):
         # Arrange
-        mock_session.get_data.return_value = self.logs
+        mock_session.endpoints.monitoring_audit_log.get_audit_logs.return_value = iter(
+            AuditLogEntry(**log) for log in self.logs
+        )
         file_path = Path(__file__).parents[2].joinpath(file_name)
         # Act
         LogsAPI(mock_session).get_auditlogs(file_path=file_name)
         does_file_exist = file_path.is_file()
         # Assert
         self.assertTrue(does_file_exist)
+
+    @patch("catalystwan.session.ManagerSession")
+    def test_get_auditlogs_requested_page_by_page(self, mock_session):
+        # Arrange
+        client = AuditLogClient(self.logs)
+        mock_session.endpoints.monitoring_audit_log = MonitoringAuditLog(client)
+        file_path = Path(__file__).parents[2].joinpath("test_file.log")
+        # Act
+        LogsAPI(mock_session).get_auditlogs(file_path=str(file_path), n_hours=2)
+        # Assert
+        assert [request["params"] for request in client.requests] == [
+            {"count": 5000},
+            {"count": 5000, "scrollId": "1"},
+        ]
+        assert all(request["url"] == "/dataservice/auditlog/page" for request in client.requests)
+        assert json.loads(client.requests[0]["data"])["query"]["rules"][0]["value"] == ["2"]
+        assert "LogId: 67890 - Log message: message from log 2" in file_path.read_text()
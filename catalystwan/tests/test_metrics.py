@@ -0,0 +1,167 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from pydantic import BaseModel, ValidationError
+from requests import Response
+
+from catalystwan.endpoints import APIEndpoints, get
+from catalystwan.metrics import OVERFLOW_ENDPOINT, Histogram, InMemoryMetrics, OpenTelemetryMetrics, RequestSample
+from catalystwan.session import ManagerSession
+from catalystwan.typed_list import DataSequence
+from catalystwan.vmanage_auth import vManageAuth
+
+
+class Device(BaseModel):
+    name: str
+
+
+class DeviceEndpoints(APIEndpoints):
+    @get("/devices", "data")
+    def get_devices(self) -> DataSequence[Device]:  # type: ignore [empty-body]
+        ...
+
+
+def sample(endpoint: str = "Endpoints.get", status_code: int = 200, latency: float = 0.02) -> RequestSample:
+    return RequestSample(endpoint, "GET", status_code, latency, 0.001, 0, 64)
+
+
+class TestInMemoryMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = InMemoryMetrics(max_endpoints=2)
+
+    def test_histogram_quantiles(self):
+        # Arrange
+        histogram = Histogram()
+        # Act
+        for value in [0.003] * 98 + [0.7, 100.0]:
+            histogram.observe(value)
+        # Assert
+        assert histogram.quantile(0.5) == 0.005
+        assert histogram.quantile(0.99) == 1.0
+        assert histogram.quantile(1.0) == float("inf")
+        assert Histogram().quantile(0.5) is None
+
+    def test_aggregation_per_endpoint(self):
+        # Act
+        self.metrics.record_request(sample(latency=0.02))
+        self.metrics.record_request(sample(status_code=500, latency=0.2))
+        self.metrics.record_retries("Endpoints.get", "GET", 1)
+        self.metrics.record_parse("Endpoints.get", "validation", 0.001)
+        self.metrics.record_validation_failure("Endpoints.get", 3)
+        self.metrics.record_request(sample("GET /dataservice/a"))
+        self.metrics.record_request(sample("GET /dataservice/b"))
+        # Assert
+        snapshot = self.metrics.snapshot()
+        assert list(snapshot) == ["Endpoints.get", "GET /dataservice/a", OVERFLOW_ENDPOINT]
+        stats = snapshot["Endpoints.get"]
+        assert (stats["requests"], stats["errors"], stats["retries"]) == (2, 1, 1)
+        assert stats["status_codes"] == {200: 1, 500: 1}
+        assert stats["response_bytes"] == 128
+        assert stats["latency"]["count"] == 2 and stats["latency"]["p99"] == 0.25
+        assert stats["parse"]["validation"]["count"] == 1
+        assert (stats["validation_failures"], stats["validation_errors"]) == (1, 3)
+
+    def test_prometheus(self):
+        # Arrange
+        self.metrics.record_request(sample())
+        self.metrics.record_parse("Endpoints.get", "decode", 0.001)
+        self.metrics.record_validation_failure("Endpoints.get", 2)
+        # Act
+        text = self.metrics.prometheus()
+        # Assert
+        labels = 'endpoint="Endpoints.get",method="GET"'
+        assert f'catalystwan_requests_total{{{labels},status="200"}} 1' in text
+        assert f'catalystwan_request_duration_seconds_bucket{{{labels},le="0.025"}} 1' in text
+        assert f'catalystwan_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+        assert f'catalystwan_parse_duration_seconds_count{{{labels},stage="decode"}} 1' in text
+        assert "# TYPE catalystwan_limiter_wait_seconds histogram" in text
+        assert f"catalystwan_validation_failures_total{{{labels}}} 1" in text
+        assert f"catalystwan_validation_errors_total{{{labels}}} 2" in text
+
+
+class TestOpenTelemetryMetrics(unittest.TestCase):
+    def test_instruments_recorded_with_attributes(self):
+        # Arrange
+        meter = MagicMock()
+        metrics = OpenTelemetryMetrics(meter)
+        # Act
+        metrics.record_request(sample())
+        metrics.record_retries("Endpoints.get", "GET", 2)
+        metrics.record_validation_failure("Endpoints.get", 4)
+        # Assert
+        attributes = {"endpoint": "Endpoints.get", "http.request.method": "GET", "http.response.status_code": 200}
+        metrics.requests.add.assert_any_call(1, attributes)
+        metrics.duration.record.assert_any_call(0.02, attributes)
+        metrics.retries.add.assert_any_call(2, {"endpoint": "Endpoints.get", "http.request.method": "GET"})
+        metrics.validation_failures.add.assert_any_call(1, {"endpoint": "Endpoints.get"})
+        metrics.validation_errors.add.assert_any_call(4, {"endpoint": "Endpoints.get"})
+
+
+class TestSessionMetrics(unittest.TestCase):
+    def setUp(self):
+        auth = vManageAuth("admin", "admin")  # pragma: allowlist secret
+        auth.cookies.set("JSESSIONID", "session")
+        auth.xsrftoken = "token"
+        self.metrics = InMemoryMetrics()
+        self.session = ManagerSession("https://example.com", auth=auth, metrics=self.metrics)
+        self.session.auth = auth
+        self.statuses = [503, 200]
+        self.content = b'{"data": [{"name": "edge"}]}'
+
+    def send(self, request, **kwargs):
+        response = Response()
+        response.request = request
+        response.status_code = self.statuses.pop(0) if self.statuses else 200
+        response._content = self.content
+        return response
+
+    @patch("catalystwan.retry_policy.sleep")
+    @patch("requests.sessions.Session.send")
+    def test_requests_attributed_to_endpoints(self, send_mock, _):
+        # Arrange
+        send_mock.side_effect = self.send
+        # Act
+        devices = DeviceEndpoints(self.session).get_devices()
+        self.session.post("/dataservice/template", json={"name": "template"})
+        # Assert
+        snapshot = self.metrics.snapshot()
+        assert devices[0].name == "edge"
+        assert list(snapshot) == ["DeviceEndpoints.get_devices", "POST /dataservice/template"]
+        stats = snapshot["DeviceEndpoints.get_devices"]
+        assert stats["status_codes"] == {503: 1, 200: 1}
+        assert (stats["requests"], stats["errors"], stats["retries"]) == (2, 1, 1)
+        assert stats["response_bytes"] == 56
+        assert stats["parse"]["validation"]["count"] == 1
+        assert snapshot["POST /dataservice/template"]["request_bytes"] == len(b'{"name": "template"}')
+
+    @patch("requests.sessions.Session.send")
+    def test_validation_failures_recorded(self, send_mock):
+        # Arrange
+        send_mock.side_effect = self.send
+        self.statuses = []
+        self.content = b'{"data": [{"name": 1}, {}]}'
+        # Act
+        with self.assertRaises(ValidationError):
+            DeviceEndpoints(self.session).get_devices()
+        # Assert
+        stats = self.metrics.snapshot()["DeviceEndpoints.get_devices"]
+        assert (stats["validation_failures"], stats["validation_errors"]) == (1, 2)
+        assert stats["parse"]["validation"]["count"] == 1
+
+    @patch("requests.sessions.Session.send")
+    def test_nothing_recorded_without_sink(self, send_mock):
+        # Arrange
+        send_mock.side_effect = self.send
+        self.statuses = []
+        self.session.metrics = None
+        # Act
+        devices = DeviceEndpoints(self.session).get_devices()
+        # Assert
+        assert devices[0].name == "edge"
+        assert self.metrics.snapshot() == {}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from typing import Any, List, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+from typing_extensions import Annotated
+
+from catalystwan.api.configuration_groups.parcel import _ParcelBase
+from catalystwan.api.templates.feature_template import FeatureTemplate
+from catalystwan.models.policy.lists import PolicyListBase
+from catalystwan.models.policy.policy_definition import PolicyDefinitionBase
+from catalystwan.models.warmup import build_models, deferred_models, iter_models, warm_up
+
+
+def deferred_union() -> Any:
+    class Apple(BaseModel):
+        model_config = ConfigDict(defer_build=True)
+        type: str = "apple"
+
+    class Pear(BaseModel):
+        model_config = ConfigDict(defer_build=True)
+        type: str = "pear"
+
+    return Annotated[Union[Apple, Pear], Field(discriminator="type")]
+
+
+class TestModelWarmUp(unittest.TestCase):
+    def test_catalog_bases_defer_build(self):
+        for base in (FeatureTemplate, _ParcelBase, PolicyListBase, PolicyDefinitionBase):
+            assert base.model_config.get("defer_build") is True, base
+
+    def test_iter_models(self):
+        # Arrange
+        fruit = deferred_union()
+        # Act
+        models = list(iter_models(List[fruit]))  # type: ignore[valid-type]
+        # Assert
+        assert [model.__name__ for model in models] == ["Apple", "Pear"]
+
+    def test_build_models(self):
+        # Arrange
+        fruit = deferred_union()
+        models = list(iter_models(fruit))
+        assert not any(model.__pydantic_complete__ for model in models)
+        assert set(models) <= set(deferred_models())
+        # Act
+        built = build_models(fruit)
+        # Assert
+        assert built == 2
+        assert all(model.__pydantic_complete__ for model in models)
+        assert build_models(fruit) == 0
+
+    def test_warm_up_in_background(self):
+        # Arrange
+        models = list(iter_models(deferred_union()))
+        # Act
+        thread = warm_up(*models)
+        assert thread is not None
+        thread.join()
+        # Assert
+        assert all(model.__pydantic_complete__ for model in models)
+        assert models[0].model_validate({"type": "apple"}).type == "apple"
+
+
+if __name__ == "__main__":
+    unittest.main()
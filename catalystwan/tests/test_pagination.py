@@ -0,0 +1,133 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import unittest
+from threading import Event
+from typing import Any, Dict, Iterator, List, Optional
+
+from pydantic import BaseModel
+from requests import Response
+
+from catalystwan.endpoints import APIEndpoints, get, post
+from catalystwan.exceptions import APIEndpointError
+from catalystwan.pagination import Pagination
+from catalystwan.response import ManagerResponse
+from catalystwan.typed_list import DataSequence
+
+
+class AuditLog(BaseModel):
+    id: int
+
+
+class AuditLogQuery(BaseModel):
+    query: str
+
+
+class PagedClient:
+    """Serves 'total' audit log records in pages of requested size, next page is addressed by scroll id"""
+
+    api_version = None
+    session_type = None
+    validate_responses = True
+
+    def __init__(self, total: int, page_info: bool = True, array: bool = False):
+        self.total = total
+        self.page_info = page_info
+        self.array = array
+        self.requests: List[Dict[str, Any]] = []
+        self.requested = Event()
+
+    def request(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        self.requests.append(kwargs)
+        self.requested.set()
+        params = kwargs["params"]
+        start = int(params.get("scrollId", 0))
+        end = min(start + int(params["count"]), self.total)
+        document: Dict[str, Any] = {"data": [{"id": i} for i in range(start, end)]}
+        if self.page_info:
+            document["pageInfo"] = {"scrollId": str(end), "hasMoreData": end < self.total, "count": end - start}
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps(document["data"] if self.array else document).encode()
+        return ManagerResponse(response)
+
+
+class AuditLogEndpoints(APIEndpoints):
+    @get("/auditlog/page", "data", pagination=Pagination(page_size=10))
+    def get_audit_logs(self) -> Iterator[AuditLog]:  # type: ignore [empty-body]
+        ...
+
+    @get("/auditlog", pagination=Pagination(page_size=10))
+    def get_audit_logs_array(self) -> Iterator[AuditLog]:  # type: ignore [empty-body]
+        ...
+
+    @post("/auditlog/page", "data", pagination=Pagination(page_size=10, prefetch=False))
+    def query_logs(self, payload: AuditLogQuery, params: dict) -> DataSequence[AuditLog]:  # type: ignore [empty-body]
+        ...
+
+
+class TestPagination(unittest.TestCase):
+    def test_iterator_requests_pages_lazily(self):
+        # Arrange
+        client = PagedClient(total=35)
+        endpoints = AuditLogEndpoints(client)
+        # Act
+        logs = endpoints.get_audit_logs()
+        assert len(client.requests) == 1
+        client.requested.clear()
+        first = next(logs)
+        client.requested.wait(1)
+        # Assert
+        assert first.id == 0
+        assert len(client.requests) == 2  # first page and prefetched second page
+        assert [log.id for log in logs] == list(range(1, 35))
+        assert [request["params"] for request in client.requests] == [
+            {"count": 10},
+            {"count": 10, "scrollId": "10"},
+            {"count": 10, "scrollId": "20"},
+            {"count": 10, "scrollId": "30"},
+        ]
+
+    def test_data_sequence_collects_all_pages(self):
+        # Arrange
+        client = PagedClient(total=25)
+        endpoints = AuditLogEndpoints(client)
+        # Act
+        logs = endpoints.query_logs(AuditLogQuery(query="all"), params={"count": "5"})
+        # Assert
+        assert isinstance(logs, DataSequence)
+        assert [log.id for log in logs] == list(range(25))
+        assert len(client.requests) == 5
+        assert all(request["data"] == '{"query":"all"}' for request in client.requests)
+
+    def test_missing_page_info_ends_pagination(self):
+        # Arrange
+        client = PagedClient(total=25, page_info=False)
+        endpoints = AuditLogEndpoints(client)
+        # Act
+        logs = list(endpoints.get_audit_logs())
+        # Assert
+        assert len(logs) == 10
+        assert len(client.requests) == 1
+
+    def test_array_payload_ends_pagination(self):
+        # Arrange
+        client = PagedClient(total=25, array=True)
+        endpoints = AuditLogEndpoints(client)
+        # Act
+        logs = list(endpoints.get_audit_logs_array())
+        # Assert
+        assert [log.id for log in logs] == list(range(10))
+        assert len(client.requests) == 1
+
+    def test_paginated_endpoint_return_type(self):
+        with self.assertRaises(APIEndpointError):
+
+            class TestAPI(APIEndpoints):
+                @get("/v1/data", "data", pagination=Pagination())
+                def get_data(self) -> Optional[AuditLog]:  # type: ignore [empty-body]
+                    ...
+
+
+if __name__ == "__main__":
+    unittest.main()
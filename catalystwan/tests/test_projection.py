@@ -0,0 +1,146 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import unittest
+from typing import Any, Dict, Iterator, List
+
+from requests import Response
+
+from catalystwan.dataclasses import Device
+from catalystwan.endpoints import APIEndpoints, get
+from catalystwan.endpoints.monitoring.device_details import DeviceData, MonitoringDeviceDetails
+from catalystwan.exceptions import APIEndpointError
+from catalystwan.projection import projected_columns, projection
+from catalystwan.response import ManagerResponse
+from catalystwan.typed_list import DataSequence
+from catalystwan.utils.reachability import Reachability
+
+DEVICES = [
+    {
+        "deviceId": f"10.0.0.{i}",
+        "uuid": f"uuid-{i}",
+        "system-ip": f"10.0.0.{i}",
+        "host-name": f"edge-{i}",
+        "reachability": "reachable",
+        "personality": "vedge",
+        "local-system-ip": f"10.0.0.{i}",
+        "connectedVManages": ["10.0.0.100"],
+    }
+    for i in range(3)
+]
+FIELDS = ["uuid", "system_ip", "host_name", "reachability"]
+
+
+def make_response(document: Any) -> ManagerResponse:
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps(document).encode()
+    return ManagerResponse(response)
+
+
+class DeviceClient:
+    api_version = None
+    session_type = None
+    validate_responses = True
+
+    def __init__(self):
+        self.requests: List[Dict[str, Any]] = []
+
+    def request(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        self.requests.append(kwargs)
+        return make_response({"data": DEVICES})
+
+
+class DeviceEndpoints(APIEndpoints):
+    @get("/device", "data")
+    def list_all_devices(self) -> DataSequence[DeviceData]:  # type: ignore [empty-body]
+        ...
+
+    @get("/device", "data", columns_param="columns")
+    def iter_devices(self, params: dict) -> Iterator[DeviceData]:  # type: ignore [empty-body]
+        ...
+
+    @get("/device/count")
+    def count_devices(self) -> dict:  # type: ignore [empty-body]
+        ...
+
+
+class TestProjection(unittest.TestCase):
+    def test_model_projection_keeps_aliases_and_types(self):
+        # Act
+        lean = projection(DeviceData, FIELDS)
+        device = lean.model_validate(DEVICES[0])
+        # Assert
+        assert list(lean.model_fields) == FIELDS
+        assert device.model_dump() == {
+            "uuid": "uuid-0",
+            "system_ip": "10.0.0.0",
+            "host_name": "edge-0",
+            "reachability": "reachable",
+        }
+        assert projection(DeviceData, tuple(FIELDS)) is lean
+
+    def test_dataclass_projection_keeps_field_names_and_converters(self):
+        # Act
+        devices = make_response({"data": DEVICES}).dataseq(Device, fields=["uuid", "hostname", "reachability"])
+        # Assert
+        assert devices[1].hostname == "edge-1"
+        assert devices[1].reachability is Reachability.REACHABLE
+        assert not hasattr(devices[1], "personality")
+
+    def test_projected_columns(self):
+        assert projected_columns(DeviceData, FIELDS) == ["uuid", "system-ip", "host-name", "reachability"]
+        assert projected_columns(Device, ["hostname", "uuid"]) == ["host-name", "uuid"]
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            projection(DeviceData, ["uuid", "hostname"])
+
+    def test_dataseq_and_dataiter_with_fields(self):
+        # Act
+        devices = make_response({"data": DEVICES}).dataseq(DeviceData, fields=FIELDS)
+        streamed = list(make_response({"data": DEVICES}).dataiter(DeviceData, fields=FIELDS))
+        # Assert
+        assert [device.host_name for device in devices] == ["edge-0", "edge-1", "edge-2"]
+        assert streamed == list(devices)
+        assert not hasattr(devices[0], "device_id")
+
+
+class TestEndpointProjection(unittest.TestCase):
+    def setUp(self):
+        self.client = DeviceClient()
+        self.endpoints = DeviceEndpoints(self.client)
+
+    def test_endpoint_call_with_fields(self):
+        # Act
+        devices = self.endpoints.list_all_devices(fields=FIELDS)  # type: ignore [call-arg]
+        full = self.endpoints.list_all_devices()
+        # Assert
+        assert devices.first().system_ip == "10.0.0.0"
+        assert not hasattr(devices.first(), "connected_vmanages")
+        assert full.first().connected_vmanages == ["10.0.0.100"]
+        assert self.client.requests == [{}, {}]
+
+    def test_endpoint_requests_selected_columns(self):
+        # Act
+        devices = list(self.endpoints.iter_devices({"status": "normal"}, fields=["uuid", "host_name"]))
+        # Assert
+        assert [device.uuid for device in devices] == ["uuid-0", "uuid-1", "uuid-2"]
+        assert self.client.requests[0]["params"] == {"status": "normal", "columns": "uuid,host-name"}
+
+    def test_device_listing_requests_selected_columns(self):
+        # Act
+        devices = MonitoringDeviceDetails(self.client).list_all_devices(fields=FIELDS)  # type: ignore [call-arg]
+        full = MonitoringDeviceDetails(self.client).list_all_devices()
+        # Assert
+        assert devices.first().host_name == "edge-0"
+        assert self.client.requests == [{"params": {"columns": "uuid,system-ip,host-name,reachability"}}, {}]
+        assert full.first().connected_vmanages == ["10.0.0.100"]
+
+    def test_fields_of_endpoint_not_returning_model(self):
+        with self.assertRaises(APIEndpointError):
+            self.endpoints.count_devices(fields=["count"])  # type: ignore [call-arg]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from threading import Event, Thread
+from time import monotonic, sleep
+
+from catalystwan.request_limiter import AdaptiveRequestLimiter, RequestLimiter
+
+URL = "https://example.com/dataservice/device"
+STATISTICS_URL = "https://example.com/dataservice/statistics/interface"
+
+
+class TestRequestLimiter(unittest.TestCase):
+    def test_in_flight(self):
+        # Arrange
+        limiter = RequestLimiter(max_requests=2)
+        # Act
+        with limiter.acquire(URL):
+            in_flight = limiter.in_flight
+        # Assert
+        assert in_flight == 1
+        assert limiter.in_flight == 0
+        assert limiter.limit == 2
+
+    def test_queue_depth_counts_only_blocked_callers(self):
+        # Arrange
+        limiter = RequestLimiter(max_requests=1)
+        released = Event()
+
+        def blocked():
+            with limiter.acquire(URL):
+                released.set()
+
+        # Act
+        with limiter.acquire(URL):
+            free_queue_depth = limiter.queue_depth
+            thread = Thread(target=blocked)
+            thread.start()
+            deadline = monotonic() + 5
+            while limiter.queue_depth != 1 and monotonic() < deadline:
+                sleep(0.01)
+            blocked_queue_depth = limiter.queue_depth
+            blocked_in_flight = limiter.in_flight
+        thread.join()
+        # Assert
+        assert free_queue_depth == 0
+        assert blocked_queue_depth == 1
+        assert blocked_in_flight == 1
+        assert released.is_set()
+        assert limiter.queue_depth == 0
+        assert limiter.in_flight == 0
+
+
+class TestAdaptiveRequestLimiter(unittest.TestCase):
+    def test_decrease_on_overload_status(self):
+        # Arrange
+        limiter = AdaptiveRequestLimiter(max_requests=40, cooldown=0)
+        # Act
+        limiter.record_response(URL, 503, 0.1)
+        limiter.record_response(URL, 429, 0.1)
+        # Assert
+        assert limiter.limit == 10
+
+    def test_decrease_once_per_cooldown(self):
+        # Arrange
+        limiter = AdaptiveRequestLimiter(max_requests=40, cooldown=60)
+        # Act
+        for _ in range(5):
+            limiter.record_overload()
+        # Assert
+        assert limiter.limit == 20
+
+    def test_limit_bounds(self):
+        # Arrange
+        limiter = AdaptiveRequestLimiter(max_requests=4, min_requests=2, cooldown=0)
+        # Act
+        for _ in range(10):
+            limiter.record_overload()
+        lowest = limiter.limit
+        for _ in range(100):
+            limiter.record_response(URL, 200, 0.1)
+        # Assert
+        assert lowest == 2
+        assert limiter.limit == 4
+
+    def test_additive_increase(self):
+        # Arrange
+        limiter = AdaptiveRequestLimiter(max_requests=40, initial_requests=10)
+        # Act
+        for _ in range(15):
+            limiter.record_response(URL, 200, 0.1)
+        # Assert
+        assert limiter.limit == 11
+
+    def test_decrease_on_rising_latency(self):
+        # Arrange
+        limiter = AdaptiveRequestLimiter(max_requests=40, latency_tolerance=2.0, cooldown=0)
+        limiter.record_response(URL, 200, 0.1)
+        # Act
+        limiter.record_response(URL, 200, 0.5)
+        # Assert
+        assert limiter.limit == 20
+
+    def test_latency_baseline_tracked_per_endpoint(self):
+        # Arrange
+        limiter = AdaptiveRequestLimiter(max_requests=40, latency_tolerance=2.0, cooldown=0)
+        limiter.record_response(URL, 200, 0.1)
+        # Act
+        limiter.record_response(STATISTICS_URL, 200, 5.0)
+        limiter.record_response(STATISTICS_URL, 200, 5.5)
+        # Assert
+        assert limiter.limit == 40
+
+    def test_budget_does_not_block_other_endpoints(self):
+        # Arrange
+        limiter = AdaptiveRequestLimiter(max_requests=10, budgets={r"/statistics": 1})
+        started = Event()
+        finish = Event()
+
+        def heavy():
+            with limiter.acquire(STATISTICS_URL):
+                started.set()
+                finish.wait(5)
+
+        first = Thread(target=heavy)
+        second = Thread(target=heavy)
+        first.start()
+        started.wait(5)
+        second.start()
+        # Act
+        deadline = monotonic() + 5
+        while limiter.queue_depth != 1 and monotonic() < deadline:
+            sleep(0.01)
+        with limiter.acquire(URL):
+            in_flight = limiter.in_flight
+        finish.set()
+        first.join()
+        second.join()
+        # Assert
+        assert in_flight == 2
+        assert limiter.budget_in_flight(r"/statistics") == 0
+        assert limiter.in_flight == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import logging
+import unittest
+from unittest.mock import MagicMock
+
+from requests import Request
+
+from catalystwan.request_tracer import LazyTrace, RequestTracer
+
+
+class TestRequestTracer(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger(f"{__name__}.{self.id()}")
+        self.render = MagicMock(return_value="rendered")
+        self.request = Request(method="GET", url="https://example.com/dataservice/statistics/interface")
+
+    def test_trace_not_rendered_when_debug_disabled(self):
+        # Arrange
+        self.logger.setLevel(logging.INFO)
+        tracer = RequestTracer(history_size=1)
+        # Act
+        tracer.trace(self.logger, self.render, None, self.request)
+        # Assert
+        self.render.assert_not_called()
+        assert len(tracer.history) == 1
+
+    def test_trace_rendered_once_when_emitted(self):
+        # Arrange
+        self.logger.setLevel(logging.DEBUG)
+        tracer = RequestTracer()
+        # Act
+        with self.assertLogs(self.logger, level=logging.DEBUG) as logs:
+            tracer.trace(self.logger, self.render, None, self.request)
+        # Assert
+        assert logs.output == [f"DEBUG:{self.logger.name}:rendered"]
+        self.render.assert_called_once_with(None, self.request)
+
+    def test_trace_not_sampled(self):
+        # Arrange
+        self.logger.setLevel(logging.DEBUG)
+        tracer = RequestTracer(sample_rates={r"/statistics": 0.0})
+        # Act
+        tracer.trace(self.logger, self.render, None, self.request)
+        # Assert
+        self.render.assert_not_called()
+        assert tracer.sample_rate("https://example.com/dataservice/device") == 1.0
+
+    def test_history_is_bounded(self):
+        # Arrange
+        tracer = RequestTracer(history_size=2)
+        requests = [Request(method="GET", url=f"https://example.com/{i}") for i in range(3)]
+        # Act
+        for request in requests:
+            tracer.record(None, request)
+        # Assert
+        assert [record.request for record in tracer.history] == requests[1:]
+        assert "https://example.com/2" in tracer.dump()
+
+    def test_history_disabled(self):
+        # Arrange
+        tracer = RequestTracer()
+        # Act
+        tracer.record(None, self.request)
+        # Assert
+        assert tracer.history == []
+
+    def test_lazy_trace_caches_rendered_string(self):
+        # Arrange
+        trace = LazyTrace(self.render, None, self.request)
+        # Act
+        str(trace)
+        str(trace)
+        # Assert
+        self.render.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
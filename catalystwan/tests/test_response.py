@@ -1,5 +1,7 @@
 # Copyright 2023 Cisco Systems, Inc. and its affiliates
 
+import io
+import json as jsonlib
 import unittest
 from typing import Any, List, Optional
 from unittest.mock import patch
@@ -7,10 +9,12 @@ from unittest.mock import patch
 from attr import define, field  # type: ignore
 from parameterized import parameterized  # type: ignore
 from pydantic import BaseModel, Field, ValidationError
+from requests import Request, Response
 from requests.exceptions import JSONDecodeError
+from urllib3.response import HTTPResponse
 
 from catalystwan.dataclasses import DataclassBase
-from catalystwan.response import ManagerErrorInfo, ManagerResponse
+from catalystwan.response import ManagerErrorInfo, ManagerResponse, response_debug
 from catalystwan.typed_list import DataSequence
 
 
@@ -181,3 +185,209 @@ class TestResponse(unittest.TestCase):
         # Assert
         assert isinstance(dataseq, DataSequence)
         assert len(dataseq) == 0
+
+
+def make_response(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers.update({"Content-Type": "application/json"})
+    response._content = content
+    response.request = Request(method="GET", url="https://example.com/dataservice/device").prepare()
+    return response
+
+
+class TestResponseLazyJson(unittest.TestCase):
+    def test_payload_not_decoded_until_accessed(self):
+        # Arrange
+        response = make_response(b"not json")
+        # Act
+        vmng_response = ManagerResponse(response)
+        # Assert
+        assert not vmng_response.json_decoded
+        assert vmng_response.payload.empty
+
+    def test_json_decoded_once(self):
+        # Arrange
+        loads_calls = []
+
+        def loads(content):
+            loads_calls.append(content)
+            return jsonlib.loads(content)
+
+        vmng_response = ManagerResponse(make_response(b'{"data": []}'), json_loads=loads)
+        # Act
+        first = vmng_response.json()
+        second = vmng_response.payload.json
+        # Assert
+        assert first is second
+        assert len(loads_calls) == 1
+
+    def test_custom_decoder_error_raises_json_decode_error(self):
+        vmng_response = ManagerResponse(make_response(b"{broken"), json_loads=jsonlib.loads)
+        with self.assertRaises(JSONDecodeError):
+            vmng_response.json()
+        assert vmng_response.payload.empty
+
+    def test_response_debug_does_not_modify_decoded_json(self):
+        # Arrange
+        vmng_response = ManagerResponse(make_response(b'{"header": {"title": "x"}, "data": []}'))
+        # Act
+        debug = response_debug(vmng_response, None)
+        # Assert
+        assert "title" not in debug
+        assert "header" in vmng_response.json()
+
+    @parameterized.expand(PARSE_DATASEQ_TEST_DATA)
+    def test_dataseq_from_raw_content(self, raises: bool, json: Any, expected_len: int, sourcekey: str):
+        vmng_response = ManagerResponse(make_response(jsonlib.dumps(json).encode()))
+        if not raises:
+            data_sequence = vmng_response.dataseq(ParsedDataTypePydanticV2, sourcekey)
+            assert isinstance(data_sequence, DataSequence)
+            assert len(data_sequence) == expected_len
+            assert all(isinstance(item, ParsedDataTypePydanticV2) for item in data_sequence)
+        else:
+            with self.assertRaises(Exception):
+                vmng_response.dataseq(ParsedDataTypePydanticV2, sourcekey)
+
+    @parameterized.expand(PARSE_DATAOBJ_TEST_DATA)
+    def test_dataobj_from_raw_content(self, raises: bool, json: Any, sourcekey: str):
+        vmng_response = ManagerResponse(make_response(jsonlib.dumps(json).encode()))
+        if not raises:
+            data_object = vmng_response.dataobj(ParsedDataTypePydanticV2, sourcekey)
+            assert isinstance(data_object, ParsedDataTypePydanticV2)
+        else:
+            with self.assertRaises(Exception):
+                vmng_response.dataobj(ParsedDataTypePydanticV2, sourcekey)
+
+    def test_dataseq_from_raw_content_skips_decoding(self):
+        # Arrange
+        content = jsonlib.dumps({"data": [{"key1": "a", "key2": 1}, {"key1": "b", "key2": 2}]}).encode()
+        vmng_response = ManagerResponse(make_response(content))
+        # Act
+        data_sequence = vmng_response.dataseq(ParsedDataTypePydanticV2)
+        # Assert
+        assert [item.key1 for item in data_sequence] == ["a", "b"]
+        assert not vmng_response.json_decoded
+
+    def test_dataseq_from_raw_content_validation_error(self):
+        content = jsonlib.dumps({"data": VALIDATE_DATASEQ_TEST_DATA}).encode()
+        vmng_response = ManagerResponse(make_response(content))
+        with self.assertRaises(ValidationError):
+            vmng_response.dataseq(DataForValidateTest)
+        assert len(vmng_response.dataseq(DataForValidateTest, validate=False)) == 2
+
+    def test_raw_content_validation_error_raised_without_decoding(self):
+        # Arrange
+        content = jsonlib.dumps({"data": VALIDATE_DATASEQ_TEST_DATA}).encode()
+        vmng_response = ManagerResponse(make_response(content))
+        # Act
+        with self.assertRaises(ValidationError):
+            vmng_response.dataseq(DataForValidateTest)
+        with self.assertRaises(ValidationError):
+            vmng_response.dataobj(DataForValidateTest, None)
+        # Assert
+        assert not vmng_response.json_decoded
+
+
+def make_streamed_response(content: bytes) -> Response:
+    response = Response()
+    response.status_code = 200
+    response.headers.update({"Content-Type": "application/json"})
+    response.raw = HTTPResponse(body=io.BytesIO(content), preload_content=False)
+    response.request = Request(method="GET", url="https://example.com/dataservice/device").prepare()
+    return response
+
+
+class TestResponseDataIter(unittest.TestCase):
+    @parameterized.expand([args for args in PARSE_DATASEQ_TEST_DATA if not args[0] and args[1] is not None])
+    def test_dataiter_yields_same_items_as_dataseq(self, _, json: Any, expected_len: int, sourcekey: str):
+        # Arrange
+        content = jsonlib.dumps(json).encode()
+        expected = list(ManagerResponse(make_response(content)).dataseq(ParsedDataTypePydanticV2, sourcekey))
+        # Act
+        loaded = list(ManagerResponse(make_response(content)).dataiter(ParsedDataTypePydanticV2, sourcekey))
+        streamed = list(ManagerResponse(make_streamed_response(content)).dataiter(ParsedDataTypePydanticV2, sourcekey))
+        # Assert
+        assert loaded == streamed == expected
+        assert len(expected) == expected_len
+
+    def test_dataiter_reads_streamed_body_incrementally(self):
+        # Arrange
+        content = jsonlib.dumps({"data": [{"key1": str(i), "key2": i} for i in range(1000)]}).encode()
+        vmng_response = ManagerResponse(make_streamed_response(content))
+        # Act
+        items = vmng_response.dataiter(ParsedDataTypePydanticV2, chunk_size=1024)
+        first = next(items)
+        # Assert
+        assert first.key1 == "0"
+        assert vmng_response.raw.tell() < len(content)
+        assert sum(1 for _ in items) == 999
+        assert vmng_response.raw.closed
+        assert vmng_response.__dict__["_content"] is False
+
+    def test_dataiter_without_validation(self):
+        content = jsonlib.dumps({"data": VALIDATE_DATASEQ_TEST_DATA}).encode()
+        with self.assertRaises(ValidationError):
+            list(ManagerResponse(make_streamed_response(content)).dataiter(DataForValidateTest))
+        items = list(ManagerResponse(make_streamed_response(content)).dataiter(DataForValidateTest, validate=False))
+        assert len(items) == 2
+
+    def test_dataiter_of_decoded_json(self):
+        # Arrange
+        vmng_response = ManagerResponse(make_response(b'{"data": [{"key1": "a", "key2": 1}]}'))
+        vmng_response.json()
+        # Act
+        items = list(vmng_response.dataiter(ParsedDataTypeAttrs))
+        # Assert
+        assert items == [ParsedDataTypeAttrs(key1="a", key2=1)]
+
+
+class TestResponseValidationSampling(unittest.TestCase):
+    def setUp(self):
+        # key2 is coerced to int only by validation, constructed items keep the string
+        self.content = jsonlib.dumps({"data": [{"key1": str(i), "key2": str(i)} for i in range(40)]}).encode()
+
+    @parameterized.expand([(True, 40), (1.0, 40), (0.25, 10), (0.01, 1), (0.0, 0), (False, 0)])
+    def test_dataseq_validates_sample_of_items(self, validate, expected_validated: int):
+        # Act
+        items = ManagerResponse(make_response(self.content)).dataseq(ParsedDataTypePydanticV2, validate=validate)
+        # Assert
+        assert [item.key1 for item in items] == [str(i) for i in range(40)]
+        assert sum(isinstance(item.key2, int) for item in items) == expected_validated
+
+    def test_dataseq_of_decoded_json_validated_in_batch(self):
+        # Arrange
+        vmng_response = ManagerResponse(make_response(self.content))
+        vmng_response.json()
+        # Act
+        with patch.object(ParsedDataTypePydanticV2, "model_validate") as model_validate:
+            items = vmng_response.dataseq(ParsedDataTypePydanticV2)
+        # Assert
+        model_validate.assert_not_called()
+        assert all(isinstance(item.key2, int) for item in items)
+
+    def test_sampled_validation_error(self):
+        # Arrange
+        content = jsonlib.dumps({"data": VALIDATE_DATASEQ_TEST_DATA * 10}).encode()
+        # Act & Assert
+        with self.assertRaises(ValidationError):
+            ManagerResponse(make_response(content)).dataseq(DataForValidateTest, validate=0.1)
+        assert len(ManagerResponse(make_response(content)).dataseq(DataForValidateTest, validate=0.0)) == 20
+
+    @patch("catalystwan.response.random")
+    def test_dataiter_and_dataobj_validate_with_probability(self, random_mock):
+        # Arrange
+        random_mock.side_effect = [0.9, 0.1, 0.9, 0.1]
+        content = b'{"data": [{"key1": "a", "key2": "1"}, {"key1": "b", "key2": "2"}]}'
+        object_content = b'{"data": {"key1": "a", "key2": "1"}}'
+        # Act
+        items = list(ManagerResponse(make_response(content)).dataiter(ParsedDataTypePydanticV2, validate=0.5))
+        constructed = ManagerResponse(make_response(object_content)).dataobj(ParsedDataTypePydanticV2, validate=0.5)
+        validated = ManagerResponse(make_response(object_content)).dataobj(ParsedDataTypePydanticV2, validate=0.5)
+        # Assert
+        assert [item.key2 for item in items] == ["1", 2]
+        assert (constructed.key2, validated.key2) == ("1", 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from typing import Optional
+from unittest.mock import patch
+
+from requests import Request, Response
+
+from catalystwan.response import ManagerResponse
+from catalystwan.response_cache import ResponseCache
+from catalystwan.session import ManagerSession
+from catalystwan.vmanage_auth import vManageAuth
+
+BASE_URL = "https://example.com"
+
+
+def make_response(status_code: int = 200, etag: Optional[str] = None, content: bytes = b"{}") -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = content
+    if etag is not None:
+        response.headers["ETag"] = etag
+    response.request = Request(method="GET", url=f"{BASE_URL}/dataservice/template/feature").prepare()
+    return response
+
+
+class TestResponseCache(unittest.TestCase):
+    def test_ttl_for_url_pattern(self):
+        cache = ResponseCache(ttl=5, ttls={r"/template/feature$": 60, r"/statistics": 0})
+        assert cache.ttl_for(f"{BASE_URL}/dataservice/template/feature") == 60
+        assert cache.ttl_for(f"{BASE_URL}/dataservice/statistics/interface") == 0
+        assert cache.ttl_for(f"{BASE_URL}/dataservice/device") == 5
+
+    def test_key_independent_of_params_order(self):
+        assert ResponseCache.key("get", "url", {"a": "1", "b": "2"}) == ResponseCache.key(
+            "GET", "url", {"b": "2", "a": "1"}
+        )
+
+    def test_lru_eviction(self):
+        # Arrange
+        cache = ResponseCache(max_entries=2)
+        keys = [cache.key("GET", f"{BASE_URL}/dataservice/device/{i}") for i in range(3)]
+        for key in keys[:2]:
+            cache.put(key, ManagerResponse(make_response()))
+        cache.get(keys[0])
+        # Act
+        cache.put(keys[2], ManagerResponse(make_response()))
+        # Assert
+        assert cache.get(keys[0])[0] is not None
+        assert cache.get(keys[1])[0] is None
+        assert cache.counters["evicted"] == 1
+
+    def test_invalidate_resource(self):
+        # Arrange
+        cache = ResponseCache()
+        urls = [
+            "/dataservice/template/feature",
+            "/dataservice/template/feature/object/1",
+            "/dataservice/template/device",
+            "/dataservice/device",
+        ]
+        for url in urls:
+            cache.put(cache.key("GET", BASE_URL + url), ManagerResponse(make_response()))
+        # Act
+        feature_removed = cache.invalidate(f"{BASE_URL}/dataservice/template/feature/1")
+        device_removed = cache.invalidate(f"{BASE_URL}/dataservice/device/action/install")
+        # Assert
+        assert feature_removed == 2
+        assert device_removed == 1
+        assert len(cache) == 1
+
+    def test_stale_entry_with_etag_provides_validators(self):
+        # Arrange
+        cache = ResponseCache(ttl=0)
+        key = cache.key("GET", f"{BASE_URL}/dataservice/device")
+        cache.put(key, ManagerResponse(make_response(etag='"v1"')))
+        # Act
+        cached, validators = cache.get(key)
+        # Assert
+        assert cached is None
+        assert validators == {"If-None-Match": '"v1"'}
+
+
+class TestSessionResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.session = ManagerSession(
+            base_url=BASE_URL,
+            auth=vManageAuth(username="admin", password="admin"),  # pragma: allowlist secret
+            response_cache=ResponseCache(ttl=60),
+        )
+
+    @patch("requests.sessions.Session.request")
+    def test_get_served_from_cache(self, request_mock):
+        # Arrange
+        request_mock.return_value = make_response(content=b'{"data": [1]}')
+        # Act
+        first = self.session.get("/dataservice/template/feature", params={"summary": "true"})
+        second = self.session.get("/dataservice/template/feature", params={"summary": "true"})
+        other = self.session.get("/dataservice/template/feature", params={"summary": "false"})
+        # Assert
+        assert first.json() == second.json() == {"data": [1]}
+        assert other.status_code == 200
+        assert request_mock.call_count == 2
+
+    @patch("requests.sessions.Session.request")
+    def test_modification_invalidates_cache(self, request_mock):
+        # Arrange
+        request_mock.side_effect = lambda *args, **kwargs: make_response()
+        self.session.get("/dataservice/template/feature")
+        # Act
+        self.session.put("/dataservice/template/feature/123", json={})
+        self.session.get("/dataservice/template/feature")
+        # Assert
+        assert request_mock.call_count == 3
+
+    @patch("requests.sessions.Session.request")
+    def test_conditional_revalidation(self, request_mock):
+        # Arrange
+        self.session.response_cache = ResponseCache(ttl=0)
+        request_mock.side_effect = [make_response(etag='"v1"', content=b'{"data": [1]}'), make_response(304)]
+        # Act
+        first = self.session.get("/dataservice/device")
+        second = self.session.get("/dataservice/device")
+        # Assert
+        assert second.status_code == 200
+        assert second.json() == first.json() == {"data": [1]}
+        assert request_mock.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert self.session.response_cache.counters["revalidated"] == 1
+
+    @patch("requests.sessions.Session.request")
+    def test_not_modified_after_eviction_requested_again(self, request_mock):
+        # Arrange
+        cache = self.session.response_cache = ResponseCache(ttl=0)
+        responses = iter(
+            [
+                make_response(etag='"v1"', content=b'{"data": [1]}'),
+                make_response(304),
+                make_response(etag='"v2"', content=b'{"data": [2]}'),
+            ]
+        )
+
+        def send(*args, **kwargs):
+            response = next(responses)
+            if response.status_code == 304:
+                cache.clear()  # entry evicted by concurrent request
+            return response
+
+        request_mock.side_effect = send
+        self.session.get("/dataservice/device")
+        # Act
+        response = self.session.get("/dataservice/device")
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"data": [2]}
+        assert request_mock.call_count == 3
+        assert "If-None-Match" not in (request_mock.call_args.kwargs["headers"] or {})
+
+    @patch("requests.sessions.Session.request")
+    def test_cached_per_accept_header_and_tenant(self, request_mock):
+        # Arrange
+        request_mock.side_effect = lambda *args, **kwargs: make_response()
+        tenant_session = ManagerSession(
+            base_url=BASE_URL,
+            auth=vManageAuth(username="admin", password="admin"),  # pragma: allowlist secret
+            subdomain="tenant.example.com",
+            response_cache=self.session.response_cache,
+        )
+        # Act
+        self.session.get("/dataservice/device")
+        self.session.get("/dataservice/device", headers={"accept": "application/json"})
+        self.session.get("/dataservice/device", headers={"VSessionId": "tenant-1"})
+        tenant_session.get("/dataservice/device")
+        self.session.get("/dataservice/device", headers={"Accept": "application/json"})
+        # Assert
+        assert request_mock.call_count == 4
+
+    @patch("requests.sessions.Session.request")
+    def test_response_caching_context(self, request_mock):
+        # Arrange
+        self.session.response_cache = None
+        request_mock.side_effect = lambda *args, **kwargs: make_response()
+        # Act
+        with self.session.response_caching(ttl=30) as cache:
+            self.session.get("/dataservice/device")
+            self.session.get("/dataservice/device")
+        self.session.get("/dataservice/device")
+        # Assert
+        assert request_mock.call_count == 2
+        assert cache.counters["hits"] == 1
+        assert self.session.response_cache is None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,165 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from unittest.mock import patch
+
+from parameterized import parameterized  # type: ignore
+from requests import ConnectionError, ReadTimeout, Request, Response
+
+from catalystwan.exceptions import ManagerHTTPError, ManagerRequestException
+from catalystwan.retry_policy import NoRetryPolicy, RetryPolicy, parse_retry_after
+from catalystwan.session import ManagerSession
+from catalystwan.vmanage_auth import vManageAuth
+
+
+def make_response(status_code: int, headers=None) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = b"{}"
+    response.request = Request(method="GET", url="https://example.com/dataservice/device").prepare()
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    @parameterized.expand(
+        [
+            ("GET", None, True),
+            ("delete", None, True),
+            ("POST", None, False),
+            ("POST", True, True),
+            ("GET", False, False),
+        ]
+    )
+    def test_allows(self, method, retry, expected):
+        assert RetryPolicy().allows(method, retry) is expected
+
+    def test_no_retry_policy(self):
+        assert NoRetryPolicy().allows("GET") is False
+
+    def test_backoff_without_jitter(self):
+        # Arrange
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, jitter=False)
+        # Act
+        delays = [policy.backoff(attempt) for attempt in range(1, 6)]
+        # Assert
+        assert delays == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_backoff_respects_retry_after(self):
+        # Arrange
+        policy = RetryPolicy(backoff_factor=1.0, jitter=False)
+        response = make_response(503, {"Retry-After": "7"})
+        # Act
+        delay = policy.backoff(1, response)
+        # Assert
+        assert delay == 7.0
+
+    def test_parse_retry_after_http_date(self):
+        response = make_response(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert parse_retry_after(response) == 0.0
+
+    @patch("catalystwan.retry_policy.sleep")
+    def test_execute_retries_transient_errors(self, sleep_mock):
+        # Arrange
+        policy = RetryPolicy(max_attempts=3)
+        results = [ManagerRequestException("reset"), make_response(200)]
+        results[0].__cause__ = ConnectionError()
+
+        def send():
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        # Act
+        response = policy.execute(send, "GET", "/device")
+        # Assert
+        assert response.status_code == 200
+        assert sleep_mock.call_count == 1
+        assert policy.counters == {"retries": 1, "retries:connection-error": 1}
+
+    @patch("catalystwan.retry_policy.sleep")
+    def test_execute_gives_up_after_max_attempts(self, sleep_mock):
+        # Arrange
+        policy = RetryPolicy(max_attempts=3)
+        error = ManagerHTTPError(error_info=None, response=make_response(503))
+
+        def send():
+            raise error
+
+        # Act / Assert
+        with self.assertRaises(ManagerHTTPError):
+            policy.execute(send, "GET", "/device")
+        assert sleep_mock.call_count == 2
+        assert policy.counters["exhausted"] == 1
+
+    @patch("catalystwan.retry_policy.sleep")
+    def test_execute_respects_deadline(self, sleep_mock):
+        # Arrange
+        policy = RetryPolicy(max_attempts=10, deadline=5.0)
+        error = ManagerHTTPError(error_info=None, response=make_response(429, {"Retry-After": "60"}))
+
+        def send():
+            raise error
+
+        # Act / Assert
+        with self.assertRaises(ManagerHTTPError):
+            policy.execute(send, "GET", "/device")
+        sleep_mock.assert_not_called()
+
+    def test_execute_does_not_retry_permanent_error(self):
+        # Arrange
+        policy = RetryPolicy()
+        error = ManagerHTTPError(error_info=None, response=make_response(400))
+
+        def send():
+            raise error
+
+        # Act / Assert
+        with self.assertRaises(ManagerHTTPError):
+            policy.execute(send, "GET", "/device")
+        assert policy.counters == {}
+
+
+class TestSessionRetry(unittest.TestCase):
+    def setUp(self):
+        self.session = ManagerSession(
+            base_url="https://example.com",
+            auth=vManageAuth(username="admin", password="admin"),  # pragma: allowlist secret
+        )
+
+    @patch("catalystwan.retry_policy.sleep")
+    @patch("requests.sessions.Session.request")
+    def test_get_retried_on_service_unavailable(self, request_mock, _):
+        # Arrange
+        request_mock.side_effect = [make_response(503), make_response(200)]
+        # Act
+        response = self.session.get("/dataservice/device")
+        # Assert
+        assert response.status_code == 200
+        assert request_mock.call_count == 2
+
+    @patch("catalystwan.retry_policy.sleep")
+    @patch("requests.sessions.Session.request")
+    def test_post_not_retried_without_opt_in(self, request_mock, _):
+        # Arrange
+        request_mock.side_effect = [ReadTimeout(), make_response(200)]
+        # Act / Assert
+        with self.assertRaises(ManagerRequestException):
+            self.session.post("/dataservice/device")
+        assert request_mock.call_count == 1
+
+    @patch("catalystwan.retry_policy.sleep")
+    @patch("requests.sessions.Session.request")
+    def test_post_retried_with_opt_in(self, request_mock, _):
+        # Arrange
+        request_mock.side_effect = [ReadTimeout(), make_response(200)]
+        # Act
+        response = self.session.post("/dataservice/device", retry=True)
+        # Assert
+        assert response.status_code == 200
+        assert "retry" not in request_mock.call_args.kwargs
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,25 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
+import hashlib
+import tempfile
 import unittest
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from pathlib import Path
+from threading import Barrier
+from typing import List, Optional
 from unittest.mock import patch
 
 from parameterized import parameterized  # type: ignore
 from requests import HTTPError, Request, RequestException, Response
+from urllib3.exceptions import ProtocolError
 
-from catalystwan.exceptions import CatalystwanException, ManagerHTTPError, ManagerRequestException
+from catalystwan.exceptions import (
+    CatalystwanException,
+    DownloadChecksumError,
+    ManagerHTTPError,
+    ManagerRequestException,
+)
 from catalystwan.session import ManagerSession, create_base_url
 from catalystwan.vmanage_auth import vManageAuth
 
@@ -60,6 +72,172 @@ class TestSession(unittest.TestCase):
         # Assert
         self.assertEqual(session.get_full_url(url), expected_url)
 
+    @patch("requests.sessions.Session.request")
+    def test_json_backend(self, mock_request_base):
+        # Arrange
+        response = Response()
+        response.status_code = 200
+        response._content = b'{"data": [1, 2]}'
+        response.request = Request(method="GET", url=f"{self.url}/dataservice/device")
+        mock_request_base.return_value = response
+        session = ManagerSession(self.url, auth=vManageAuth(self.username, self.password), json_backend="orjson")
+
+        # Act
+        copied = copy(session)
+        result = session.get("/dataservice/device")
+
+        # Assert
+        self.assertEqual(result.json(), {"data": [1, 2]})
+        self.assertIs(result._json_loads, session.json_loads)
+        self.assertEqual(copied.json_backend, "orjson")
+        with self.assertRaises(ValueError):
+            session.json_backend = "unknown"  # type: ignore
+
+
+class StreamedContent:
+    """Raw response stream which breaks connection after given number of bytes"""
+
+    def __init__(self, content: bytes, break_at: Optional[int] = None):
+        self.content = content
+        self.break_at = break_at
+
+    def stream(self, chunk_size, decode_content=True):
+        sent = 0
+        while sent < len(self.content):
+            if self.break_at is not None and sent >= self.break_at:
+                raise ProtocolError("Connection broken")
+            chunk = self.content[sent : sent + min(chunk_size, len(self.content))]
+            sent += len(chunk)
+            yield chunk
+
+    def close(self):
+        pass
+
+
+class TestSessionGetFile(unittest.TestCase):
+    def setUp(self):
+        self.content = bytes(range(256)) * 64
+        self.session = ManagerSession(
+            "https://example.com", auth=vManageAuth("admin", "admin")  # pragma: allowlist secret
+        )
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = Path(self.tmpdir.name) / "admintech.tar.gz"
+        self.ranges: List[Optional[str]] = []
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def serve(self, break_at: Optional[int] = None):
+        def request(method, url, headers, **kwargs):
+            range_header = headers.get("Range")
+            self.ranges.append(range_header)
+            offset = int(range_header[len("bytes=") : -1]) if range_header else 0
+            response = Response()
+            response.request = Request(method=method, url=url).prepare()
+            response.status_code = 206 if offset else 200
+            response.headers["Content-Length"] = str(len(self.content) - offset)
+            if offset:
+                response.headers["Content-Range"] = f"bytes {offset}-{len(self.content) - 1}/{len(self.content)}"
+            response.raw = StreamedContent(self.content[offset:], break_at if not offset else None)
+            return response
+
+        return request
+
+    @patch("requests.sessions.Session.request")
+    def test_get_file_streams_chunks(self, mock_request_base):
+        # Arrange
+        mock_request_base.side_effect = self.serve()
+        progress: List = []
+        # Act
+        self.session.get_file(
+            "/dataservice/file", self.filename, chunk_size=4096, progress=lambda *p: progress.append(p)
+        )
+        # Assert
+        assert self.filename.read_bytes() == self.content
+        assert mock_request_base.call_args.kwargs["stream"] is True
+        assert progress[-1] == (len(self.content), len(self.content))
+        assert len(progress) == 4
+
+    @patch("requests.sessions.Session.request")
+    def test_get_file_resumes_broken_transfer(self, mock_request_base):
+        # Arrange
+        mock_request_base.side_effect = self.serve(break_at=8192)
+        digest = hashlib.sha256(self.content).hexdigest()
+        # Act
+        self.session.get_file("/dataservice/file", self.filename, chunk_size=4096, checksum=f"sha256:{digest}")
+        # Assert
+        assert self.filename.read_bytes() == self.content
+        assert self.ranges == [None, "bytes=8192-"]
+        assert not self.filename.with_name("admintech.tar.gz.part").exists()
+
+    @patch("requests.sessions.Session.request")
+    def test_get_file_keeps_partial_file_when_resume_disabled(self, mock_request_base):
+        # Arrange
+        mock_request_base.side_effect = self.serve(break_at=8192)
+        # Act / Assert
+        with self.assertRaises(ManagerRequestException):
+            self.session.get_file("/dataservice/file", self.filename, chunk_size=4096, resume=False)
+        assert not self.filename.exists()
+        assert self.filename.with_name("admintech.tar.gz.part").stat().st_size == 8192
+
+    @patch("requests.sessions.Session.request")
+    def test_get_file_checksum_mismatch(self, mock_request_base):
+        # Arrange
+        mock_request_base.side_effect = self.serve()
+        # Act / Assert
+        with self.assertRaises(DownloadChecksumError):
+            self.session.get_file("/dataservice/file", self.filename, checksum="sha256:0123")
+        assert not self.filename.exists()
+        assert not self.filename.with_name("admintech.tar.gz.part").exists()
+
+
+class TestSessionRelogin(unittest.TestCase):
+    THREADS = 8
+
+    def setUp(self):
+        self.auth = vManageAuth("admin", "admin")  # pragma: allowlist secret
+        self.auth.cookies.set("JSESSIONID", "s1")
+        self.auth.xsrftoken = "token"
+        self.session = ManagerSession("https://example.com", auth=self.auth)
+        self.session.auth = self.auth
+        self.barrier = Barrier(self.THREADS)
+        self.logins: List[str] = []
+
+    def get_jsessionid(self) -> str:
+        jsessionid = f"s{len(self.logins) + 2}"
+        self.logins.append(jsessionid)
+        self.auth.cookies.set("JSESSIONID", jsessionid)
+        return jsessionid
+
+    def send(self, request, **kwargs):
+        response = Response()
+        response.request = request
+        response.status_code = 200
+        response._content = b"{}"
+        response.headers["date"] = "Wed, 16 Oct 2024 10:00:00 GMT"
+        if "JSESSIONID=s1" in request.headers.get("Cookie", ""):
+            # all threads use expired session at the same time
+            self.barrier.wait(5)
+            response.headers["set-cookie"] = "JSESSIONID=s1; Expires=Thu, 01 Jan 1970 00:00:00 GMT"
+        return response
+
+    @patch.object(ManagerSession, "_finalize_login")
+    @patch.object(ManagerSession, "_fetch_server_info")
+    @patch.object(vManageAuth, "get_xsrftoken", return_value="token")
+    @patch("requests.sessions.Session.send")
+    def test_concurrent_expiry_single_login(self, send_mock, _, fetch_server_info_mock, finalize_login_mock):
+        # Arrange
+        send_mock.side_effect = self.send
+        # Act
+        with patch.object(vManageAuth, "get_jsessionid", side_effect=self.get_jsessionid):
+            with ThreadPoolExecutor(self.THREADS) as pool:
+                responses = list(pool.map(lambda _: self.session.get("/dataservice/device"), range(self.THREADS)))
+        # Assert
+        assert self.logins == ["s2"]
+        assert fetch_server_info_mock.call_count == 1
+        assert all(not response.jsessionid_expired for response in responses)
+        assert send_mock.call_count == 2 * self.THREADS
+
 
 class TestSessionExceptions(unittest.TestCase):
     def setUp(self):
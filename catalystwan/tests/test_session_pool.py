@@ -0,0 +1,143 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import unittest
+from collections import Counter
+from typing import Set
+from unittest.mock import patch
+
+from requests import Response
+
+from catalystwan.exceptions import SessionNotCreatedError, TenantSubdomainNotFound
+from catalystwan.session import ManagerSession
+from catalystwan.session_pool import ManagerSessionPool
+from catalystwan.utils.session_type import SessionType
+from catalystwan.vmanage_auth import ProviderAsTenantAuth, vManageAuth
+
+TENANTS = [
+    {"name": f"tenant{i}", "desc": "", "orgName": "org", "subDomain": f"tenant{i}.example.com", "tenantId": f"id{i}"}
+    for i in range(1, 4)
+]
+
+
+class TestManagerSessionPool(unittest.TestCase):
+    def setUp(self):
+        self.auth = vManageAuth("admin", "admin")  # pragma: allowlist secret
+        self.auth._base_url = "https://example.com"
+        self.auth.cookies.set("JSESSIONID", "provider")
+        self.auth.xsrftoken = "token"
+        self.provider = ManagerSession("https://example.com", auth=self.auth)
+        self.provider._sync_auth()
+        self.provider.platform_version = "20.12.1"
+        self.provider._session_type = SessionType.PROVIDER
+        self.requests: Counter = Counter()
+        self.unhealthy: Set[str] = set()
+        send_patch = patch("requests.sessions.Session.send", side_effect=self.send)
+        send_patch.start()
+        self.addCleanup(send_patch.stop)
+
+    def send(self, request, **kwargs):
+        path = request.path_url
+        vsessionid = request.headers.get("VSessionId")
+        self.requests[(request.method, path)] += 1
+        response = Response()
+        response.request = request
+        response.status_code = 200
+        response.headers["date"] = "Wed, 16 Oct 2024 10:00:00 GMT"
+        if path == "/dataservice/tenant":
+            body = {"data": TENANTS}
+        elif path.endswith("/vsessionid"):
+            body = {"VSessionId": f"vsession-{path.split('/')[3]}"}
+        elif vsessionid in self.unhealthy:
+            response.status_code = 500
+            body = {"error": {"message": "failed"}}
+        else:
+            body = {
+                "data": {
+                    "vsessionid": vsessionid,
+                    "jsessionid": "JSESSIONID=provider" in request.headers.get("Cookie", ""),
+                }
+            }
+        response._content = json.dumps(body).encode()
+        return response
+
+    def test_tenant_sessions_share_provider_login(self):
+        # Arrange
+        pool = ManagerSessionPool(self.provider)
+        # Act
+        data = [pool.get(tenant["subDomain"]).get_data("/dataservice/device") for tenant in TENANTS]
+        pool.get("tenant1.example.com").get_data("/dataservice/device")
+        # Assert
+        assert data == [{"vsessionid": f"vsession-id{i}", "jsessionid": True} for i in range(1, 4)]
+        assert self.requests[("GET", "/dataservice/tenant")] == 1
+        assert self.requests[("POST", "/dataservice/tenant/id1/vsessionid")] == 1
+        assert pool.counters == {"created": 3, "reused": 1, "evicted": 0, "unhealthy": 0}
+        assert self.auth.session_count == 4
+        session = pool.get("tenant2.example.com")
+        assert session.session_type is SessionType.PROVIDER_AS_TENANT
+        assert session.api_version == self.provider.api_version
+        assert session.adapters is self.provider.adapters
+
+    def test_least_recently_used_session_evicted(self):
+        # Arrange
+        pool = ManagerSessionPool(self.provider, max_sessions=2)
+        pool.get("tenant1.example.com")
+        pool.get("tenant2.example.com")
+        pool.get("tenant1.example.com")
+        # Act
+        pool.get("tenant3.example.com")
+        # Assert
+        assert pool.subdomains == ["tenant1.example.com", "tenant3.example.com"]
+        assert pool.counters["evicted"] == 1
+        assert self.auth.session_count == 3
+        assert self.auth.jsessionid == "provider"
+
+    def test_unhealthy_session_replaced(self):
+        # Arrange
+        pool = ManagerSessionPool(self.provider, health_check_interval=0)
+        session = pool.get("tenant1.example.com")
+        session.get("/dataservice/device")
+        self.unhealthy.add("vsession-id1")
+        # Act
+        with patch.object(ProviderAsTenantAuth, "get_vsessionid", return_value="vsession-new"):
+            replaced = pool.get("tenant1.example.com")
+            data = replaced.get_data("/dataservice/device")
+        # Assert
+        assert replaced is not session
+        assert data["vsessionid"] == "vsession-new"
+        assert pool.counters["unhealthy"] == 1
+
+    def test_check_health_evicts_unhealthy_sessions(self):
+        # Arrange
+        pool = ManagerSessionPool(self.provider)
+        for tenant in TENANTS:
+            pool.get(tenant["subDomain"]).get("/dataservice/device")
+        self.unhealthy.add("vsession-id2")
+        # Act
+        health = pool.check_health()
+        # Assert
+        assert health == {"tenant1.example.com": True, "tenant2.example.com": False, "tenant3.example.com": True}
+        assert "tenant2.example.com" not in pool
+
+    def test_unknown_subdomain(self):
+        pool = ManagerSessionPool(self.provider)
+        with self.assertRaises(TenantSubdomainNotFound):
+            pool.get("unknown.example.com")
+
+    def test_tenant_session_requires_provider_session(self):
+        self.provider._session_type = SessionType.TENANT
+        with self.assertRaises(SessionNotCreatedError):
+            ManagerSessionPool(self.provider).get("tenant1.example.com")
+
+    def test_close_keeps_provider_logged_in(self):
+        # Arrange
+        with ManagerSessionPool(self.provider) as pool:
+            pool.get("tenant1.example.com").get("/dataservice/device")
+        # Assert
+        assert len(pool) == 0
+        assert self.auth.session_count == 1
+        assert self.auth.jsessionid == "provider"
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from time import monotonic, sleep
+from unittest.mock import patch
+
+from requests import Request, Response
+
+from catalystwan.request_limiter import RequestLimiter
+from catalystwan.session import ManagerSession
+from catalystwan.singleflight import SingleFlight
+from catalystwan.vmanage_auth import vManageAuth
+
+CALLERS = 5
+
+
+def wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = monotonic() + timeout
+    while not condition() and monotonic() < deadline:
+        sleep(0.01)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_coalesced(self):
+        # Arrange
+        flight = SingleFlight()
+        release = Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            release.wait(5)
+            return object()
+
+        # Act
+        with ThreadPoolExecutor(CALLERS) as pool:
+            futures = [pool.submit(flight.do, "key", function) for _ in range(CALLERS)]
+            wait_for(lambda: flight.counters["coalesced"] == CALLERS - 1)
+            release.set()
+            results = [future.result() for future in futures]
+        # Assert
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.counters == {"executed": 1, "coalesced": CALLERS - 1}
+        assert flight.in_flight == 0
+
+    def test_error_propagated_to_waiters(self):
+        # Arrange
+        flight = SingleFlight()
+        release = Event()
+
+        def function():
+            release.wait(5)
+            raise ValueError("failed")
+
+        # Act
+        with ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(flight.do, "key", function) for _ in range(2)]
+            wait_for(lambda: flight.counters["coalesced"] == 1)
+            release.set()
+        # Assert
+        for future in futures:
+            with self.assertRaises(ValueError):
+                future.result()
+
+    def test_sequential_calls_not_coalesced(self):
+        flight = SingleFlight()
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 2
+
+
+class TestSessionSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.limiter = RequestLimiter()
+        self.session = ManagerSession(
+            base_url="https://example.com",
+            auth=vManageAuth(username="admin", password="admin"),  # pragma: allowlist secret
+            request_limiter=self.limiter,
+            single_flight=SingleFlight(),
+        )
+        self.release = Event()
+
+    def respond(self, method, url, **kwargs):
+        self.release.wait(5)
+        response = Response()
+        response.status_code = 200
+        response._content = b'{"data": [{"org": "example"}]}'
+        response.request = Request(method=method, url=url).prepare()
+        return response
+
+    @patch("requests.sessions.Session.request")
+    def test_identical_gets_coalesced(self, request_mock):
+        # Arrange
+        request_mock.side_effect = self.respond
+        flight = self.session.single_flight
+        # Act
+        with ThreadPoolExecutor(CALLERS) as pool:
+            futures = [
+                pool.submit(self.session.get, "/dataservice/settings/configuration/organization")
+                for _ in range(CALLERS)
+            ]
+            wait_for(lambda: flight.counters["coalesced"] == CALLERS - 1)
+            in_flight = self.limiter.in_flight
+            self.release.set()
+            responses = [future.result() for future in futures]
+        # Assert
+        assert request_mock.call_count == 1
+        assert in_flight == 1
+        assert all(response.json() == {"data": [{"org": "example"}]} for response in responses)
+
+    @patch("requests.sessions.Session.request")
+    def test_different_params_not_coalesced(self, request_mock):
+        # Arrange
+        request_mock.side_effect = self.respond
+        self.release.set()
+        # Act
+        with ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(self.session.get, "/dataservice/device", params={"id": i}) for i in range(2)]
+            [future.result() for future in futures]
+        # Assert
+        assert request_mock.call_count == 2
+        assert self.session.single_flight.counters["coalesced"] == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 # Copyright 2023 Cisco Systems, Inc. and its affiliates
 
+import io
 import tempfile
 import unittest
 from pathlib import Path
@@ -7,11 +8,14 @@ from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 from packaging.version import Version  # type: ignore
+from requests import Request, Response
 
 from catalystwan.api.task_status_api import Task
 from catalystwan.api.tenant_migration_api import ImportTask, TenantMigrationAPI
 from catalystwan.endpoints.tenant_migration import ImportInfo, MigrationInfo
 from catalystwan.models.tenant import Tenant, TenantExport
+from catalystwan.session import ManagerSession
+from catalystwan.vmanage_auth import vManageAuth
 
 
 class TestTenantMigrationAPI(unittest.TestCase):
@@ -37,13 +41,36 @@ class TestTenantMigrationAPI(unittest.TestCase):
         task = self.api.export_tenant(tenant=tenant)
         self.assertIsInstance(task, Task)
 
-    def test_download(self):
+    @patch("requests.sessions.Session.request")
+    def test_download(self, request_mock):
+        # Arrange
         content = b"\xFFtest_data"
+        response = Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(content)
+        response.request = Request("GET", "https://example.com/dataservice/tenantmigration/download").prepare()
+        request_mock.return_value = response
+        session = ManagerSession("https://example.com", auth=vManageAuth("admin", "admin"))  # pragma: allowlist secret
+        session.platform_version = "20.12"
         with tempfile.TemporaryDirectory() as tmpdir:
             download_path = Path(tmpdir) / "test.tar.gz"
-            self.session.endpoints.tenant_migration.download_tenant_data = MagicMock(return_value=content)
-            self.api.download(download_path)
+            # Act
+            TenantMigrationAPI(session).download(download_path, "export.tar.gz")
+            # Assert
             assert open(download_path, "rb").read() == content
+        assert request_mock.call_args.args[1].endswith("/dataservice/tenantmigration/download/export.tar.gz")
+
+    @patch("catalystwan.session.ManagerSession.get_file")
+    def test_download_checks_endpoint_version(self, get_file_mock):
+        # Arrange
+        session = ManagerSession("https://example.com", auth=vManageAuth("admin", "admin"))  # pragma: allowlist secret
+        session.platform_version = "20.3"
+        # Act
+        with self.assertLogs("catalystwan.endpoints", level="WARNING") as logs:
+            TenantMigrationAPI(session).download(Path("test.tar.gz"))
+        # Assert
+        assert "only supported for API versions: >=20.6" in logs.output[0]
+        get_file_mock.assert_called_once()
 
     def test_import_tenant(self):
         self.session.api_version = Version("20.12")
@@ -0,0 +1,141 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from catalystwan.exceptions import ManagerHTTPError
+from catalystwan.session import create_manager_session
+from catalystwan.testing import Cassette, CassetteRecorder, FakeManager, Interaction, json_response, scrub
+from catalystwan.utils.session_type import SessionType
+from catalystwan.vmanage_auth import UnauthorizedAccessError
+
+DEVICES = {"data": [{"deviceId": "1.1.1.1", "host-name": "edge", "snmpCommunity": "public"}]}
+
+
+class TestFakeManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = FakeManager(seed=1).start()
+        self.addCleanup(self.manager.stop)
+        self.manager.route("GET", "/dataservice/device", DEVICES)
+
+    def login(self):
+        session = create_manager_session(url=self.manager.url, username="admin", password="admin")
+        self.addCleanup(session.close)
+        return session
+
+    def test_login_and_programmed_route(self):
+        # Act
+        session = self.login()
+        devices = session.get_data("/dataservice/device")
+        # Assert
+        assert session.session_type == SessionType.SINGLE_TENANT
+        assert session.platform_version == "20.12.1"
+        assert devices == DEVICES["data"]
+        assert self.manager.logins == 1
+
+    def test_invalid_credentials(self):
+        with self.assertRaises(UnauthorizedAccessError):
+            create_manager_session(url=self.manager.url, username="admin", password="wrong")
+
+    def test_expired_session_relogin(self):
+        # Arrange
+        session = self.login()
+        self.manager.expire_sessions()
+        # Act
+        devices = session.get_data("/dataservice/device")
+        # Assert
+        assert devices == DEVICES["data"]
+        assert self.manager.logins == 2
+
+    def test_unmatched_request(self):
+        # Arrange
+        session = self.login()
+        # Act
+        with self.assertRaises(ManagerHTTPError) as context:
+            session.get("/dataservice/unknown")
+        # Assert
+        assert context.exception.response.status_code == 404
+
+    def test_handler_receives_request(self):
+        # Arrange
+        session = self.login()
+        self.manager.route("POST", "/dataservice/template/.*", handler=lambda request: {"echo": request.json()})
+        # Act
+        response = session.post("/dataservice/template/device", json={"name": "template"})
+        # Assert
+        assert response.json() == {"echo": {"name": "template"}}
+
+    @patch("catalystwan.retry_policy.sleep")
+    def test_injected_errors_retried(self, _):
+        # Arrange
+        session = self.login()
+        self.manager.inject_error(503, count=1)
+        self.manager.inject_error(None, count=1)
+        # Act
+        devices = session.get_data("/dataservice/device")
+        # Assert
+        assert devices == DEVICES["data"]
+        assert self.manager.requests[("GET", "/dataservice/device")] == 3
+
+
+class TestCassette(unittest.TestCase):
+    def test_scrub(self):
+        payload = {"data": [{"name": "a", "password": "b", "nested": {"apiKey": "c", "token": ""}}]}
+        assert scrub(payload) == {
+            "data": [{"name": "a", "password": "<scrubbed>", "nested": {"apiKey": "<scrubbed>", "token": ""}}]
+        }
+
+    def test_playback_order_and_query_matching(self):
+        # Arrange
+        cassette = Cassette(
+            [
+                Interaction("GET", "/dataservice/task", 200, '{"status": "in_progress"}'),
+                Interaction("GET", "/dataservice/task", 200, '{"status": "done"}'),
+                Interaction("GET", "/dataservice/device", 200, '{"data": [2]}', query="b=2&a=1"),
+            ]
+        )
+        # Act
+        statuses = [json.loads(cassette.match("GET", "/dataservice/task").content)["status"] for _ in range(3)]
+        device = cassette.match("GET", "/dataservice/device", "a=1&b=2")
+        # Assert
+        assert statuses == ["in_progress", "done", "done"]
+        assert device is not None and device.body == '{"data": [2]}'
+        assert cassette.match("POST", "/dataservice/task") is None
+
+    def test_record_save_and_replay(self):
+        # Arrange
+        with FakeManager() as manager:
+            manager.route("GET", "/dataservice/device", DEVICES)
+            manager.route("GET", "/dataservice/file", handler=lambda _: Interaction("", "", 200, "AP8=", base64=True))
+            session = create_manager_session(url=manager.url, username="admin", password="admin")
+            with CassetteRecorder(session) as recorder:
+                session.get("/dataservice/device", params={"family": "vedges"})
+                session.get("/dataservice/file")
+            session.close()
+        # Act
+        with TemporaryDirectory() as directory:
+            recorder.cassette.save(Path(directory) / "cassette.json")
+            cassette = Cassette.load(Path(directory) / "cassette.json")
+        with FakeManager(cassette=cassette) as manager:
+            session = create_manager_session(url=manager.url, username="admin", password="admin")
+            devices = session.get_data("/dataservice/device")
+            content = session.get("/dataservice/file").content
+            session.close()
+        # Assert
+        assert [(i.method, i.path, i.query) for i in cassette.interactions] == [
+            ("GET", "/dataservice/device", "family=vedges"),
+            ("GET", "/dataservice/file", ""),
+        ]
+        assert devices == [{"deviceId": "1.1.1.1", "host-name": "edge", "snmpCommunity": "<scrubbed>"}]
+        assert content == b"\x00\xff"
+        assert not any("cookie" in name.lower() for i in cassette.interactions for name in i.headers)
+
+    def test_json_response(self):
+        assert json_response({"a": 1}, 201).content == b'{"a": 1}'
+
+
+if __name__ == "__main__":
+    unittest.main()
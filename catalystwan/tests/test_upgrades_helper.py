@@ -0,0 +1,74 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import hashlib
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from requests import Request
+
+from catalystwan.utils.upgrades_helper import ImageFile, MultipartFileStream, SoftwarePackageUploadPayload
+
+
+class TestImageUpload(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "vmanage-20.12.1-x86_64.tar.gz"
+        self.content = bytes(range(256)) * 4096
+        self.path.write_bytes(self.content)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_image_file_digest(self):
+        image = ImageFile(self.path)
+        assert image.digest("sha256") == hashlib.sha256(self.content).hexdigest()
+        assert image.matches(hashlib.md5(self.content).hexdigest().upper())
+        assert not image.matches("abc")
+
+    def test_multipart_stream_reads_bounded_chunks(self):
+        # Arrange
+        progress = []
+        stream = MultipartFileStream(self.path, callback=progress.append)
+        # Act
+        chunks = []
+        while chunk := stream.read(64 * 1024):
+            chunks.append(chunk)
+        body = b"".join(chunks)
+        # Assert
+        assert max(len(chunk) for chunk in chunks) == 64 * 1024
+        assert len(body) == len(stream)
+        assert body.startswith(f"--{stream.boundary}\r\n".encode())
+        assert body.endswith(f"\r\n--{stream.boundary}--\r\n".encode())
+        assert self.content in body
+        assert progress[-1] == len(stream)
+        assert stream._mapped is None
+
+    def test_multipart_stream_read_without_size_returns_whole_body(self):
+        # Arrange
+        stream = MultipartFileStream(self.path)
+        head = stream.read(16)
+        # Act
+        body = stream.read()
+        # Assert
+        assert len(head) + len(body) == len(stream)
+        assert (head + body).endswith(self.content + f"\r\n--{stream.boundary}--\r\n".encode())
+        assert stream.read(-1) == b""
+        assert stream._mapped is None
+
+    @patch("catalystwan.utils.upgrades_helper.ProgressBar")
+    def test_payload_prepared_as_streamed_request_body(self, _):
+        # Arrange
+        payload = SoftwarePackageUploadPayload(str(self.path)).prepared()
+        # Act
+        request = Request("POST", "https://example.com/dataservice/device/action/software/package", **payload.asdict())
+        prepared = request.prepare()
+        # Assert
+        assert prepared.body is payload.data
+        assert prepared.headers["Content-Length"] == str(len(payload.data))  # type: ignore
+        assert prepared.headers["content-type"].startswith("multipart/form-data; boundary=")
+
+
+if __name__ == "__main__":
+    unittest.main()
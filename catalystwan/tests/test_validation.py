@@ -0,0 +1,83 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+import unittest
+from typing import Optional
+
+from pydantic import BaseModel
+from requests import Response
+
+from catalystwan.endpoints import APIEndpoints, get
+from catalystwan.response import ManagerResponse
+from catalystwan.typed_list import DataSequence
+from catalystwan.validation import ValidationPolicy, response_validation
+
+
+class Interface(BaseModel):
+    name: str
+    mtu: int
+
+
+class ValidationClient:
+    api_version = None
+    session_type = None
+
+    def __init__(self, validation_policy: Optional[ValidationPolicy] = None, validate_responses: bool = True):
+        self.validation_policy = validation_policy
+        self.validate_responses = validate_responses
+
+    def request(self, method: str, url: str, **kwargs) -> ManagerResponse:
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps({"data": [{"name": f"ge0/{i}", "mtu": "1500"} for i in range(10)]}).encode()
+        return ManagerResponse(response)
+
+
+class InterfaceEndpoints(APIEndpoints):
+    @get("/interfaces", "data")
+    def get_interfaces(self) -> DataSequence[Interface]:  # type: ignore [empty-body]
+        ...
+
+    @get("/interfaces/statistics", "data")
+    def get_statistics(self) -> DataSequence[Interface]:  # type: ignore [empty-body]
+        ...
+
+
+class TestValidationPolicy(unittest.TestCase):
+    def test_first_matching_pattern_selects_rate(self):
+        # Arrange
+        policy = ValidationPolicy(default_rate=0.5, rates={r"\.get_statistics$": 0.0, r"^InterfaceEndpoints\.": 0.1})
+        # Act & Assert
+        assert policy.rate("InterfaceEndpoints.get_statistics") == 0.0
+        assert policy.rate("InterfaceEndpoints.get_interfaces") == 0.1
+        assert policy.rate("DeviceEndpoints.get_devices") == 0.5
+
+    def test_set_rate_overrides_resolved_rates(self):
+        # Arrange
+        policy = ValidationPolicy()
+        assert policy.rate("InterfaceEndpoints.get_interfaces") == 1.0
+        # Act
+        policy.set_rate("Interface", 0.2)
+        # Assert
+        assert policy.rate("InterfaceEndpoints.get_interfaces") == 0.2
+
+    def test_response_validation_of_client(self):
+        policy = ValidationPolicy(rates={"Interface": 0.3})
+        assert response_validation(ValidationClient(), "InterfaceEndpoints.get_interfaces") is True
+        assert response_validation(ValidationClient(policy), "InterfaceEndpoints.get_interfaces") == 0.3
+        assert response_validation(ValidationClient(policy, False), "InterfaceEndpoints.get_interfaces") is False
+
+    def test_endpoints_validated_according_to_policy(self):
+        # Arrange
+        policy = ValidationPolicy(rates={r"\.get_statistics$": 0.0, r"\.get_interfaces$": 0.2})
+        endpoints = InterfaceEndpoints(ValidationClient(policy))
+        # Act
+        interfaces = endpoints.get_interfaces()
+        statistics = endpoints.get_statistics()
+        # Assert
+        assert sum(isinstance(interface.mtu, int) for interface in interfaces) == 2
+        assert not any(isinstance(interface.mtu, int) for interface in statistics)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,21 @@
 # Copyright 2023 Cisco Systems, Inc. and its affiliates
 
+import hashlib
+import json
+import tempfile
 import unittest
+from pathlib import Path
+from typing import Optional
 from unittest.mock import MagicMock, Mock, patch
 
+from requests.exceptions import ConnectionError
+
 from catalystwan.api.versions_utils import DeviceSoftwareRepository, DeviceVersions, RepositoryAPI
 from catalystwan.endpoints.configuration.software_actions import SoftwareImageDetails
 from catalystwan.endpoints.configuration_device_actions import InstalledDeviceData, PartitionDevice
 from catalystwan.endpoints.configuration_device_inventory import DeviceDetailsResponse
+from catalystwan.exceptions import ImageChecksumError, ManagerRequestException
+from catalystwan.retry_policy import NoRetryPolicy, RetryPolicy
 from catalystwan.typed_list import DataSequence
 
 
@@ -238,3 +247,93 @@ class TestRepositoryAPI(unittest.TestCase):
             PartitionDevice, [PartitionDevice(device_id="mock_uuid", device_ip="mock_ip", version="curr_ver")]
         )
         self.assertEqual(answer, proper_answer)
+
+
+class TestRepositoryAPIUploadImage(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.image_path = Path(self.tmpdir.name) / "c8000v-17.12.01.SPA.bin"
+        self.image_path.write_bytes(b"image content" * 1024)
+        self.sha256 = hashlib.sha256(self.image_path.read_bytes()).hexdigest()
+        self.session = Mock()
+        self.session.retry_policy = RetryPolicy(jitter=False)
+        self.upload = self.session.endpoints.configuration_device_software_update.upload_software_to_manager
+        self.api = RepositoryAPI(self.session)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def repository(self, checksum: Optional[str]) -> DataSequence[SoftwareImageDetails]:
+        checksum_map = json.dumps({self.image_path.name: checksum}) if checksum else None
+        image = SoftwareImageDetails(availableFiles=self.image_path.name, checksumMap=checksum_map)  # type: ignore
+        return DataSequence(SoftwareImageDetails, [image])
+
+    def test_upload_image_skips_existing_image(self):
+        # Arrange
+        self.api.get_all_software_images = MagicMock(return_value=self.repository(self.sha256))
+        # Act
+        uploaded = self.api.upload_image(str(self.image_path))
+        # Assert
+        assert uploaded is False
+        self.upload.assert_not_called()
+
+    def test_upload_image_uploads_image_with_different_checksum(self):
+        # Arrange
+        self.api.get_all_software_images = MagicMock(side_effect=[self.repository("0" * 64), self.repository(None)])
+        # Act
+        uploaded = self.api.upload_image(str(self.image_path))
+        # Assert
+        assert uploaded is True
+        self.upload.assert_called_once()
+
+    def test_upload_image_verifies_local_checksum(self):
+        with self.assertRaises(ImageChecksumError):
+            self.api.upload_image(str(self.image_path), checksum="sha256:" + "0" * 64)
+        self.upload.assert_not_called()
+
+    def test_upload_image_verifies_uploaded_checksum(self):
+        # Arrange
+        self.api.get_all_software_images = MagicMock(
+            side_effect=[DataSequence(SoftwareImageDetails, []), self.repository("f" * 32)]
+        )
+        # Act / Assert
+        with self.assertRaises(ImageChecksumError):
+            self.api.upload_image(str(self.image_path))
+
+    @patch("catalystwan.retry_policy.sleep")
+    def test_upload_image_retried_on_connection_error(self, sleep_mock):
+        # Arrange
+        error = ManagerRequestException("Connection aborted")
+        error.__cause__ = ConnectionError()
+        self.upload.side_effect = [error, None]
+        empty = DataSequence(SoftwareImageDetails, [])
+        self.api.get_all_software_images = MagicMock(side_effect=[empty, empty, self.repository(self.sha256)])
+        # Act
+        uploaded = self.api.upload_image(str(self.image_path))
+        # Assert
+        assert uploaded is True
+        assert self.upload.call_count == 2
+        sleep_mock.assert_called_once()
+        assert self.session.retry_policy.counters["retries"] == 1
+        self.session.metrics.record_retries.assert_called_once_with(
+            "ConfigurationDeviceSoftwareUpdate.upload_software_to_manager", "POST", 1
+        )
+
+    @patch("catalystwan.retry_policy.sleep")
+    def test_upload_image_not_retried_when_session_disables_retries(self, sleep_mock):
+        # Arrange
+        self.session.retry_policy = NoRetryPolicy()
+        error = ManagerRequestException("Connection aborted")
+        error.__cause__ = ConnectionError()
+        self.upload.side_effect = [error, None]
+        self.api.get_all_software_images = MagicMock(return_value=DataSequence(SoftwareImageDetails, []))
+        # Act / Assert
+        with self.assertRaises(ManagerRequestException):
+            self.api.upload_image(str(self.image_path))
+        self.upload.assert_called_once()
+        sleep_mock.assert_not_called()
+        self.session.metrics.record_retries.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
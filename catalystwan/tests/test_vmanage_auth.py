@@ -6,12 +6,13 @@ from typing import Callable, Dict, List, Union
 from unittest import TestCase, mock
 from uuid import uuid4
 
+from parameterized import parameterized  # type: ignore
 from requests import Request
 from requests.cookies import RequestsCookieJar
 
 from catalystwan import USER_AGENT
 from catalystwan.exceptions import CatalystwanException
-from catalystwan.vmanage_auth import UnauthorizedAccessError, vManageAuth
+from catalystwan.vmanage_auth import UnauthorizedAccessError, merge_cookie_header, vManageAuth, vSessionAuth
 
 
 class MockResponse:
@@ -144,6 +145,63 @@ class TestvManageAuth(TestCase):
         with self.assertRaises(CatalystwanException):
             vManageAuth("user", self.password).get_xsrftoken()
 
+    @mock.patch("catalystwan.vmanage_auth.get", side_effect=mock_valid_token)
+    @mock.patch("catalystwan.vmanage_auth.post", side_effect=mock_request_j_security_check)
+    def test_generation_changes_with_credentials(self, mock_post, mock_get):
+        # Arrange
+        vmanage_auth = vManageAuth("admin", self.password)
+        request = Request(method="GET", url=f"{self.base_url}/dataservice/device").prepare()
+        # Act
+        vmanage_auth(request)
+        authenticated = vmanage_auth.generation
+        vmanage_auth(request)
+        reused = vmanage_auth.generation
+        vmanage_auth.clear(request)
+        # Assert
+        assert authenticated == 1
+        assert reused == 1
+        assert vmanage_auth.generation == 2
+        assert mock_post.call_count == 1
+
+    def test_credentials_applied_without_lock(self):
+        # Arrange
+        vmanage_auth = vManageAuth("admin", self.password)
+        vmanage_auth.cookies.set("JSESSIONID", "xyz")
+        vmanage_auth.xsrftoken = "token"
+        vmanage_auth(Request(method="GET", url=self.base_url).prepare())
+        vmanage_auth.lock = mock.MagicMock()
+        request = Request(method="GET", url=self.base_url, cookies={"other": "1", "JSESSIONID": "old"}).prepare()
+        # Act
+        vmanage_auth(request)
+        # Assert
+        vmanage_auth.lock.__enter__.assert_not_called()
+        assert request.headers["Cookie"] == "other=1; JSESSIONID=xyz"
+        assert request.headers["x-xsrf-token"] == "token"
+
+    def test_snapshot_renewed_with_credentials(self):
+        # Arrange
+        vmanage_auth = vSessionAuth("admin", self.password, subdomain="tenant")
+        vmanage_auth.cookies.set("JSESSIONID", "xyz")
+        vmanage_auth.xsrftoken = "token"
+        vmanage_auth.vsessionid = "vsession1"
+        vmanage_auth(Request(method="GET", url=self.base_url).prepare())
+        # Act
+        vmanage_auth.vsessionid = "vsession2"
+        request = vmanage_auth(Request(method="GET", url=self.base_url).prepare())
+        # Assert
+        assert request.headers["VSessionId"] == "vsession2"
+
+    @parameterized.expand(
+        [
+            (None, "JSESSIONID=new"),
+            ("", "JSESSIONID=new"),
+            ("JSESSIONID=old", "JSESSIONID=new"),
+            ("a=1; JSESSIONID=old;b=2", "a=1; b=2; JSESSIONID=new"),
+        ]
+    )
+    def test_merge_cookie_header(self, cookie_header, expected):
+        assert merge_cookie_header(cookie_header, "JSESSIONID=new") == expected
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,35 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import json
+from typing import Any, Callable, Dict, Literal, Union
+
+JSONLoads = Callable[[Union[str, bytes]], Any]
+JSONBackend = Literal["json", "orjson"]
+
+
+def _orjson_loads() -> JSONLoads:
+    try:
+        import orjson  # type: ignore
+    except ImportError as error:
+        raise ImportError("orjson JSON backend selected but 'orjson' package is not installed") from error
+    return orjson.loads
+
+
+JSON_BACKENDS: Dict[str, Callable[[], JSONLoads]] = {
+    "json": lambda: json.loads,
+    "orjson": _orjson_loads,
+}
+
+
+def get_json_loads(backend: JSONBackend) -> JSONLoads:
+    """Returns 'loads' function of selected JSON decoder backend
+
+    Args:
+        backend: name of the backend, "json" (standard library) or "orjson" (requires optional 'orjson' package)
+
+    Returns:
+        JSONLoads: function decoding JSON document from str or bytes
+    """
+    if (factory := JSON_BACKENDS.get(backend)) is None:
+        raise ValueError(f"Unknown JSON backend: {backend}, available backends: {list(JSON_BACKENDS)}")
+    return factory()
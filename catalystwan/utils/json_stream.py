@@ -0,0 +1,109 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import codecs
+from json import JSONDecodeError, JSONDecoder
+from typing import Any, Iterable, Iterator, Optional
+
+WHITESPACE = " \t\n\r"
+NUMBER_CONTINUATION = set("0123456789+-.eE") | {""}
+
+
+class _StreamReader:
+    """Decodes JSON values from text buffer refilled with chunks of bytes, consumed text is dropped on refill"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Reads next chunk, returns False when there is no more data"""
+        while not self.eof:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.eof = True
+                text = self._decoder.decode(b"", final=True)
+            else:
+                text = self._decoder.decode(chunk)
+            if text:
+                self.buffer = self.buffer[self.pos :] + text
+                self.pos = 0
+                return True
+        return False
+
+    def peek(self) -> str:
+        """Returns next non-whitespace character (without consuming it) or empty string at the end of document"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, characters: str) -> str:
+        character = self.peek()
+        if not character or character not in characters:
+            raise JSONDecodeError(f"Expecting one of: {characters!r}", self.buffer, self.pos)
+        self.pos += 1
+        return character
+
+    def value(self) -> Any:
+        """Decodes next value, reads more chunks until value is complete"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buffer, self.pos)
+            except JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            if isinstance(value, (int, float)) and self.buffer[end : end + 1] in NUMBER_CONTINUATION and self.fill():
+                continue  # number might continue in next chunk
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes], sourcekey: Optional[str] = "data") -> Iterator[Any]:
+    """Decodes JSON document incrementally and yields items of array found under sourcekey
+    (or items of top level array when sourcekey is None). Single object found instead of array is yielded as one item.
+
+    Only the text of item being decoded and not yet consumed part of last chunk are kept in memory,
+    items preceding the array under other keys are decoded and dropped, document is not read past the array.
+
+    Args:
+        chunks: UTF-8 encoded JSON document split into chunks of any size (eg. Response.iter_content)
+        sourcekey: name of top level key containing the array
+
+    Raises:
+        JSONDecodeError: when document is malformed
+    """
+    reader = _StreamReader(chunks)
+    if not reader.peek():
+        return
+    if sourcekey is not None:
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if key == sourcekey:
+                break
+            reader.value()
+            if reader.expect(",}") == "}":
+                return
+    if reader.peek() != "[":
+        if (value := reader.value()) is not None:
+            yield value
+        return
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        if reader.expect(",]") == "]":
+            return
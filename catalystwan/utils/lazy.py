@@ -0,0 +1,98 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+"""Deferred imports keeping 'import catalystwan' and session creation cheap.
+
+Containers (session.api, session.endpoints) import and instantiate API classes on first attribute access,
+packages re-exporting many models import the defining submodule on first access of exported name.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+
+class LazyAttribute:
+    """Non-data descriptor creating instance of class from given module with container session on first access.
+    Created instance is stored in container __dict__, so next accesses do not reach the descriptor.
+    Relative module name is resolved against package of the module defining the container."""
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+        self.attribute = name
+        self.package: Optional[str] = None
+
+    def __set_name__(self, owner: type, attribute: str) -> None:
+        self.attribute = attribute
+        self.package = owner.__module__.rpartition(".")[0]
+
+    def load(self) -> type:
+        return getattr(import_module(self.module, self.package), self.name)
+
+    def __get__(self, container: Any, owner: type) -> Any:
+        if container is None:
+            return self
+        value = self.load()(container._session)
+        container.__dict__[self.attribute] = value
+        return value
+
+
+def lazy(module: str, name: str) -> Any:
+    """Declares container attribute holding instance of 'module.name' class created on first access.
+    Returns Any so the attribute can be annotated with the class for type checkers.
+
+    Example:
+        >>> class APIContainer(LazyContainer):
+        ...     templates: TemplatesAPI = lazy(".template_api", "TemplatesAPI")
+    """
+    return LazyAttribute(module, name)
+
+
+class LazyContainer:
+    """Base for containers which attributes are declared with 'lazy'"""
+
+    def __init__(self, session: Any):
+        self._session = session
+
+    @classmethod
+    def lazy_attributes(cls) -> List[str]:
+        return [name for klass in cls.__mro__ for name, v in vars(klass).items() if isinstance(v, LazyAttribute)]
+
+    def load_all(self) -> None:
+        """Creates all attributes now (recursively), eg. to register every endpoint decorated in API classes"""
+        for name in self.lazy_attributes():
+            value = getattr(self, name)
+            if isinstance(value, LazyContainer):
+                value.load_all()
+
+    def __dir__(self) -> Iterable[str]:
+        return sorted({*super().__dir__(), *self.lazy_attributes()})
+
+
+def lazy_module(
+    package: str, exports: Mapping[str, Iterable[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Creates module level __getattr__ and __dir__ (PEP 562) for package re-exporting names of its submodules.
+
+    Args:
+        package: __name__ of the package
+        exports: maps relative submodule name (eg. ".lists") to names it provides
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_module(__name__, {".lists": ("AppList", "ColorList")})
+    """
+    lookup: Dict[str, str] = {name: module for module, names in exports.items() for name in names}
+    namespace = import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        if (module := lookup.get(name)) is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(lookup)
+
+    return __getattr__, __dir__
@@ -1,11 +1,14 @@
 # Copyright 2023 Cisco Systems, Inc. and its affiliates
 
+import hashlib
 from enum import Enum
-from pathlib import PurePath
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Optional, Union
+from uuid import uuid4
 
 from attr import define  # type: ignore
 from clint.textui.progress import Bar as ProgressBar  # type: ignore
-from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor  # type: ignore
 
 from catalystwan.endpoints import CustomPayloadType, PreparedPayload
 from catalystwan.endpoints.configuration_device_inventory import DeviceDetailsResponse
@@ -13,6 +16,8 @@ from catalystwan.exceptions import MultiplePersonalityError
 from catalystwan.typed_list import DataSequence
 from catalystwan.utils.personality import Personality
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class Family(Enum):
     VEDGE = "vedge"
@@ -74,20 +79,121 @@ def validate_personality_homogeneity(devices: DataSequence[DeviceDetailsResponse
         )
 
 
+class ImageFile:
+    """Software image file on local disk, digests are computed over memory-mapped content and cached"""
+
+    DIGEST_ALGORITHMS = {32: "md5", 40: "sha1", 64: "sha256", 128: "sha512"}
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.name = self.path.name
+        self.size = self.path.stat().st_size
+        self._digests: Dict[str, str] = {}
+
+    def digest(self, algorithm: str = "sha256") -> str:
+        if algorithm not in self._digests:
+            hasher = hashlib.new(algorithm)
+            if self.size:
+                with open(self.path, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as mapped:
+                    view = memoryview(mapped)
+                    for offset in range(0, self.size, UPLOAD_CHUNK_SIZE):
+                        hasher.update(view[offset : offset + UPLOAD_CHUNK_SIZE])
+                    view.release()
+            self._digests[algorithm] = hasher.hexdigest()
+        return self._digests[algorithm]
+
+    def matches(self, digest: str) -> bool:
+        """Checks if file matches given hexdigest, algorithm is guessed from digest length"""
+        if (algorithm := self.DIGEST_ALGORITHMS.get(len(digest))) is None:
+            return False
+        return self.digest(algorithm) == digest.lower()
+
+
+class MultipartFileStream:
+    """Streams file as single-part multipart/form-data body with bounded memory usage.
+
+    File is memory-mapped and read in chunks so only single chunk is copied to user space at a time,
+    stream is opened lazily on first read and closed when whole body was read.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        field: str = "file",
+        content_type: str = "application/octet-stream",
+        callback: Optional[Callable[[int], None]] = None,
+    ):
+        self.path = Path(path)
+        self.callback = callback
+        self.boundary = uuid4().hex
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{self.path.name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._size = self.path.stat().st_size
+        self._position = 0
+        self._file: Optional[BinaryIO] = None
+        self._mapped: Optional[mmap] = None
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + self._size + len(self._tail)
+
+    def _file_content(self, start: int, end: int) -> bytes:
+        if self._mapped is None:
+            self._file = open(self.path, "rb")
+            self._mapped = mmap(self._file.fileno(), 0, access=ACCESS_READ)
+        return self._mapped[start:end]
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Reads up to size bytes of body, whole remaining body when size is negative or None"""
+        total = len(self)
+        size = total - self._position if size is None or size < 0 else size
+        chunks: List[bytes] = []
+        while size > 0 and self._position < total:
+            position = self._position
+            head_end = len(self._head)
+            file_end = head_end + self._size
+            if position < head_end:
+                chunk = self._head[position : position + size]
+            elif position < file_end:
+                chunk = self._file_content(position - head_end, min(position - head_end + size, self._size))
+            else:
+                chunk = self._tail[position - file_end : position - file_end + size]
+            chunks.append(chunk)
+            size -= len(chunk)
+            self._position += len(chunk)
+        if self._position >= total:
+            self.close()
+        if self.callback is not None:
+            self.callback(self._position)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 class SoftwarePackageUploadPayload(CustomPayloadType):
     def __init__(self, image_path: str):
-        encoder = MultipartEncoder(
-            fields={"file": (PurePath(image_path).name, open(image_path, "rb"), "application/x-gzip")}
-        )
-        callback = self._create_callback(encoder)
-        monitor = MultipartEncoderMonitor(encoder, callback)
-        self.payload = PreparedPayload(data=monitor, headers={"content-type": monitor.content_type})
+        stream = MultipartFileStream(image_path, content_type="application/x-gzip")
+        stream.callback = self._create_callback(stream)
+        self.payload = PreparedPayload(data=stream, headers={"content-type": stream.content_type})
 
-    def _create_callback(self, encoder: MultipartEncoder):
-        bar = ProgressBar(expected_size=encoder._calculate_length(), filled_char="=")
+    def _create_callback(self, stream: MultipartFileStream):
+        bar = ProgressBar(expected_size=len(stream), filled_char="=")
 
-        def callback(monitor: MultipartEncoderMonitor):
-            bar.show(monitor.bytes_read)
+        def callback(bytes_read: int):
+            bar.show(bytes_read)
 
         return callback
 
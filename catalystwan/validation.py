@@ -0,0 +1,59 @@
+# Copyright 2024 Cisco Systems, Inc. and its affiliates
+
+import re
+from typing import Any, Dict, Optional, Pattern, Union
+
+Validation = Union[bool, float]
+
+
+class ValidationPolicy:
+    """Selects how thoroughly responses of APIEndpoints methods are validated, per endpoint.
+
+    Rate is fraction (0.0 - 1.0) of response items validated with pydantic, remaining items are created
+    with model_construct (1.0 - full validation, 0.0 - validation off). Sampled validation keeps schema drift
+    visible in validation failures (raised and counted by metrics) for endpoints where full validation is too costly.
+
+    Args:
+        default_rate: fraction of items validated for endpoints without specific rate
+        rates: maps endpoint (qualified method name, eg. "MonitoringDeviceDetails.list_all_devices") regex patterns
+            to rates, first matching pattern is used
+
+    Example:
+        >>> policy = ValidationPolicy(rates={r"^MonitoringDeviceDetails\\.": 0.05, r"Statistics": 0.0})
+        >>> session = ManagerSession(base_url=url, auth=auth, validation_policy=policy)
+    """
+
+    def __init__(self, default_rate: float = 1.0, rates: Optional[Dict[str, float]] = None):
+        self.default_rate = default_rate
+        self._rates: Dict[Pattern[str], float] = {}
+        self._resolved: Dict[str, float] = {}
+        for pattern, rate in (rates or {}).items():
+            self.set_rate(pattern, rate)
+
+    def set_rate(self, pattern: str, rate: float) -> None:
+        """Sets validation rate for endpoints which qualified name matches given regex pattern"""
+        self._rates[re.compile(pattern)] = rate
+        self._resolved = {}
+
+    def rate(self, endpoint: str) -> float:
+        if (rate := self._resolved.get(endpoint)) is None:
+            rate = next((rate for pattern, rate in self._rates.items() if pattern.search(endpoint)), self.default_rate)
+            self._resolved[endpoint] = rate
+        return rate
+
+
+def validation_rate(validate: Validation) -> float:
+    """Returns fraction of items to be validated for validate argument of response parsing methods"""
+    if isinstance(validate, float):
+        return validate
+    return 1.0 if validate else 0.0
+
+
+def response_validation(client: Any, endpoint: str) -> Validation:
+    """Returns validate argument for parsing response of endpoint sent with given client:
+    False when client has validation disabled, otherwise validation rate of client's policy (True without policy)
+    """
+    validate = client.validate_responses
+    if not validate or (policy := getattr(client, "validation_policy", None)) is None:
+        return validate
+    return policy.rate(endpoint)
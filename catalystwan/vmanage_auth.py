@@ -1,9 +1,10 @@
 # Copyright 2022 Cisco Systems, Inc. and its affiliates
 
 import logging
+from dataclasses import dataclass
 from http.cookies import SimpleCookie
 from threading import RLock
-from typing import Optional
+from typing import Dict, Mapping, Optional, Tuple
 from urllib.parse import urlparse
 
 from packaging.version import Version  # type: ignore
@@ -61,6 +62,30 @@ def update_headers(
         request.headers["VSessionId"] = vsessionid
 
 
+def merge_cookie_header(cookie_header: Optional[str], cookie: str) -> str:
+    """Returns Cookie header value with given 'name=value' cookie replacing cookie with the same name"""
+    if not cookie_header:
+        return cookie
+    name = cookie.split("=", 1)[0]
+    cookies = [c for c in (c.strip() for c in cookie_header.split(";")) if c and c.split("=", 1)[0] != name]
+    cookies.append(cookie)
+    return "; ".join(cookies)
+
+
+@dataclass(frozen=True)
+class AuthSnapshot:
+    """Immutable credentials prepared once per login generation and applied to requests without locking"""
+
+    generation: int
+    cookie: str
+    headers: Mapping[str, str]
+
+    def apply(self, request: PreparedRequest) -> PreparedRequest:
+        request.headers["Cookie"] = merge_cookie_header(request.headers.get("Cookie"), self.cookie)
+        request.headers.update(self.headers)
+        return request
+
+
 class vManageAuth(AuthBase, AuthProtocol):
     """Attaches vManage Authentication to the given Requests object.
 
@@ -72,6 +97,7 @@ class vManageAuth(AuthBase, AuthProtocol):
     """
 
     def __init__(self, username: str, password: str, logger: Optional[logging.Logger] = None, verify: bool = False):
+        self._snapshot: Optional[AuthSnapshot] = None
         self.username = username
         self.password = password
         self.xsrftoken: Optional[str] = None
@@ -81,18 +107,42 @@ class vManageAuth(AuthBase, AuthProtocol):
         self._base_url: str = ""
         self.session_count: int = 0
         self.lock: RLock = RLock()
+        self.login_lock: RLock = RLock()
+        self.generation: int = 0
 
     def __str__(self) -> str:
         return f"vManageAuth(username={self.username})"
 
     def __call__(self, request: PreparedRequest) -> PreparedRequest:
-        with self.lock:
-            self.handle_auth(request)
-            update_headers(request, self.jsessionid, self.xsrftoken)
-            return request
+        # fast path: credentials snapshot is swapped atomically, lock is needed only to (re)authenticate
+        if (snapshot := self._snapshot) is None:
+            with self.lock:
+                self.handle_auth(request)
+                snapshot = self._snapshot = self._snapshot or self.create_snapshot()
+        return snapshot.apply(request)
+
+    def create_snapshot(self) -> AuthSnapshot:
+        return AuthSnapshot(
+            generation=self.generation,
+            cookie=f"JSESSIONID={self.jsessionid}",
+            headers=self.auth_headers(),
+        )
+
+    def auth_headers(self) -> Dict[str, str]:
+        return {"x-xsrf-token": self.xsrftoken} if self.xsrftoken is not None else {}
+
+    @property
+    def xsrftoken(self) -> Optional[str]:
+        return self._xsrftoken
+
+    @xsrftoken.setter
+    def xsrftoken(self, xsrftoken: Optional[str]) -> None:
+        self._xsrftoken = xsrftoken
+        self._snapshot = None
 
     def sync_cookies(self, cookies: RequestsCookieJar) -> None:
         self.cookies = merge_cookies(self.cookies, cookies)
+        self._snapshot = None
 
     @property
     def jsessionid(self) -> Optional[str]:
@@ -101,6 +151,7 @@ class vManageAuth(AuthBase, AuthProtocol):
     def handle_auth(self, request: PreparedRequest):
         if not self.jsessionid or not self.xsrftoken:
             self.authenticate(request)
+            self.generation += 1
 
     def get_jsessionid(self) -> str:
         security_payload = {
@@ -138,7 +189,7 @@ class vManageAuth(AuthBase, AuthProtocol):
 
     def logout(self, client: APIEndpointClient) -> None:
         with self.lock:
-            if self.session_count > 1:
+            if self.session_count > 0:
                 # Other sessions still use the auth, unregister and return
                 return
 
@@ -166,6 +217,7 @@ class vManageAuth(AuthBase, AuthProtocol):
         with self.lock:
             self.cookies.clear_session_cookies()
             self.xsrftoken = None
+            self.generation += 1
 
     def increase_session_count(self) -> None:
         with self.lock:
@@ -205,18 +257,27 @@ class vSessionAuth(vManageAuth):
         logger: Optional[logging.Logger] = None,
         verify: bool = False,
     ):
+        self.vsessionid: Optional[str] = None
         super().__init__(username, password, logger, verify)
         self.subdomain = subdomain
-        self.vsessionid: Optional[str] = None
 
     def __str__(self) -> str:
         return f"vSessionAuth(username={self.username},subdomain={self.subdomain})"  # noqa: E231
 
-    def __call__(self, request: PreparedRequest) -> PreparedRequest:
-        with self.lock:
-            self.handle_auth(request)
-            update_headers(request, self.jsessionid, self.xsrftoken, self.vsessionid)
-            return request
+    def auth_headers(self) -> Dict[str, str]:
+        headers = super().auth_headers()
+        if self.vsessionid is not None:
+            headers["VSessionId"] = self.vsessionid
+        return headers
+
+    @property
+    def vsessionid(self) -> Optional[str]:
+        return self._vsessionid
+
+    @vsessionid.setter
+    def vsessionid(self, vsessionid: Optional[str]) -> None:
+        self._vsessionid = vsessionid
+        self._snapshot = None
 
     def authenticate(self, request: PreparedRequest):
         super().authenticate(request)
@@ -259,6 +320,99 @@ class vSessionAuth(vManageAuth):
             self.vsessionid = None
 
 
+class ProviderAsTenantAuth(AuthBase, AuthProtocol):
+    """Switches provider vManageAuth to tenant view using VSessionId header.
+
+    JSESSIONID and XSRF token of the provider are shared by all tenant views, so creating the view costs
+    a single request for VSessionId instead of a full login. VSessionId is obtained again after provider login
+    is renewed. Login lock and session count are shared with the provider, so re-login is performed only once
+    for the provider and all its tenant views and logout is sent when the last session using the provider ends.
+    """
+
+    def __init__(self, provider: vManageAuth, subdomain: str, tenant_id: Optional[str] = None):
+        self.provider = provider
+        self.subdomain = subdomain
+        self.tenant_id = tenant_id
+        self.lock: RLock = RLock()
+        self._vsession: Optional[Tuple[int, str]] = None
+        self._resets: int = 0
+
+    def __str__(self) -> str:
+        return f"ProviderAsTenantAuth(username={self.provider.username},subdomain={self.subdomain})"  # noqa: E231
+
+    def __call__(self, request: PreparedRequest) -> PreparedRequest:
+        self.provider(request)
+        generation = self.provider.generation
+        if (vsession := self._vsession) is None or vsession[0] != generation:
+            with self.lock:
+                if (vsession := self._vsession) is None or vsession[0] != generation:
+                    vsession = self._vsession = (generation, self.get_vsessionid(self.get_tenantid()))
+        request.headers["VSessionId"] = vsession[1]
+        return request
+
+    @property
+    def vsessionid(self) -> Optional[str]:
+        return self._vsession[1] if self._vsession is not None else None
+
+    @property
+    def generation(self) -> int:  # type: ignore[override]
+        return self.provider.generation + self._resets
+
+    @property
+    def login_lock(self) -> RLock:  # type: ignore[override]
+        return self.provider.login_lock
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {"Content-Type": "application/json", "User-Agent": USER_AGENT}
+        if (xsrftoken := self.provider.xsrftoken) is not None:
+            headers["x-xsrf-token"] = xsrftoken
+        return headers
+
+    def get_tenantid(self) -> str:
+        if self.tenant_id is not None:
+            return self.tenant_id
+        response: Response = get(
+            url=self.provider._base_url + "/dataservice/tenant",
+            cookies=self.provider.cookies,
+            headers=self._headers(),
+            verify=self.provider.verify,
+        )
+        self.provider.logger.debug(auth_response_debug(response, str(self)))
+        tenant = ManagerResponse(response).dataseq(Tenant).filter(subdomain=self.subdomain).single_or_default()
+        if not tenant or not tenant.tenant_id:
+            raise TenantSubdomainNotFound(f"Tenant ID for sub-domain: {self.subdomain} not found")
+        self.tenant_id = tenant.tenant_id
+        return self.tenant_id
+
+    def get_vsessionid(self, tenantid: str) -> str:
+        response: Response = post(
+            url=self.provider._base_url + f"/dataservice/tenant/{tenantid}/vsessionid",
+            cookies=self.provider.cookies,
+            headers=self._headers(),
+            verify=self.provider.verify,
+        )
+        self.provider.logger.debug(auth_response_debug(response, str(self)))
+        return response.json()["VSessionId"]
+
+    def logout(self, client: APIEndpointClient) -> None:
+        self._clear()
+        self.provider.logout(client)
+
+    def _clear(self) -> None:
+        with self.lock:
+            self._vsession = None
+            self._resets += 1
+
+    def increase_session_count(self) -> None:
+        self.provider.increase_session_count()
+
+    def decrease_session_count(self) -> None:
+        self.provider.decrease_session_count()
+
+    def clear(self, last_request: Optional[PreparedRequest]) -> None:
+        self.provider.clear(last_request)
+
+
 def create_vmanage_auth(
     username: str,
     password: str,